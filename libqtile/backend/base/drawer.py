@@ -21,14 +21,23 @@ class Drawer:
 
     We stage drawing operations locally in memory using a cairo RecordingSurface before
     finally drawing all operations to a backend-specific target.
+
+    A persistent Drawer instead draws to a pixel surface that is kept, along with its
+    context, for the lifetime of the Drawer and is only reallocated when it grows.
+    Mirrors then paint directly from that surface.
     """
 
-    def __init__(self, win: Internal, width: int, height: int):
+    _persistent = False
+    # The size that the persistent surface was allocated with
+    _surface_size = (0, 0)
+
+    def __init__(self, win: Internal, width: int, height: int, persistent: bool = False):
         self._win = win
         self._width = width
         self._height = height
+        self._persistent = persistent
 
-        self.surface: cairocffi.RecordingSurface
+        self.surface: cairocffi.Surface
         self.last_surface: cairocffi.RecordingSurface
         self.ctx: cairocffi.Context
         self._reset_surface()
@@ -53,7 +62,7 @@ class Drawer:
 
     @has_mirrors.setter
     def has_mirrors(self, value):
-        if value and not self._has_mirrors:
+        if value and not self._has_mirrors and not self._persistent:
             self._create_last_surface()
 
         self._has_mirrors = value
@@ -65,6 +74,7 @@ class Drawer:
     @width.setter
     def width(self, width: int):
         self._width = width
+        self._check_persistent_surface()
 
     @property
     def height(self) -> int:
@@ -73,17 +83,48 @@ class Drawer:
     @height.setter
     def height(self, height: int):
         self._height = height
+        self._check_persistent_surface()
 
     def _reset_surface(self):
-        """This creates a fresh surface and cairo context."""
+        """
+        This creates a fresh surface and cairo context. Persistent surfaces are kept
+        and only the state of their context is reset.
+        """
+        if self._persistent and hasattr(self, "surface"):
+            self.ctx.restore()
+            self.ctx.new_path()
+            self.ctx.save()
+            return
+
         if hasattr(self, "surface"):
             self.surface.finish()
 
-        self.surface = cairocffi.RecordingSurface(
-            cairocffi.CONTENT_COLOR_ALPHA,
-            None,
-        )
-        self.ctx = cairocffi.Context(self.surface)
+        if self._persistent:
+            self._surface_size = (self.width, self.height)
+            self.surface = self._create_persistent_surface()
+            self.ctx = cairocffi.Context(self.surface)
+            # Saved so that the state left by one frame can be discarded before the next
+            self.ctx.save()
+        else:
+            self.surface = cairocffi.RecordingSurface(
+                cairocffi.CONTENT_COLOR_ALPHA,
+                None,
+            )
+            self.ctx = cairocffi.Context(self.surface)
+
+    def _create_persistent_surface(self) -> cairocffi.Surface:
+        """Creates the surface used by persistent Drawers"""
+        return cairocffi.ImageSurface(cairocffi.FORMAT_ARGB32, self.width, self.height)
+
+    def _check_persistent_surface(self) -> None:
+        """Reallocates the persistent surface if it is too small for the Drawer."""
+        if not self._persistent or not hasattr(self, "surface"):
+            return
+        allocated_width, allocated_height = self._surface_size
+        if self.width > allocated_width or self.height > allocated_height:
+            self.surface.finish()
+            del self.surface
+            self._reset_surface()
 
     def _create_last_surface(self):
         """Creates a separate RecordingSurface for mirrors to access."""
@@ -92,7 +133,7 @@ class Drawer:
         self.last_surface = cairocffi.RecordingSurface(cairocffi.CONTENT_COLOR_ALPHA, None)
 
     def paint_to(self, drawer: Drawer) -> None:
-        drawer.ctx.set_source_surface(self.last_surface)
+        drawer.ctx.set_source_surface(self.surface if self._persistent else self.last_surface)
         drawer.ctx.paint()
 
     def _rounded_rect(self, x, y, width, height, linewidth):
@@ -154,6 +195,7 @@ class Drawer:
 
         If Drawer has been disabled then the RecordingSurface will
         be cleared if no mirrors are waiting to copy its contents.
+        Persistent surfaces keep their contents.
 
         Parameters
         ==========
@@ -180,7 +222,7 @@ class Drawer:
                 src_x=src_x,
                 src_y=src_y,
             )
-            if self.has_mirrors:
+            if self.has_mirrors and not self._persistent:
                 self._create_last_surface()
                 ctx = cairocffi.Context(self.last_surface)
                 ctx.set_source_surface(self.surface)
@@ -596,8 +596,11 @@ class Internal(_Window, metaclass=ABCMeta):
         return f"Internal(wid={self.wid})"
 
     @abstractmethod
-    def create_drawer(self, width: int, height: int) -> Drawer:
-        """Create a Drawer that draws to this window."""
+    def create_drawer(self, width: int, height: int, persistent: bool = False) -> Drawer:
+        """
+        Create a Drawer that draws to this window. Persistent Drawers keep a pixel
+        surface to draw to rather than recording drawing operations for each frame.
+        """
 
     def process_window_expose(self) -> None:
         """Respond to the window being exposed. Required by X11 backend."""
@@ -315,6 +315,7 @@ struct wlr_output {
 	char *make;
 	char *model;
 	char *serial;
+	int32_t refresh; // mHz, may be zero
 	...;
 };
 
@@ -650,7 +650,8 @@ class Core(base.Core):
                 ffi.string(wlr_output.model).decode() if wlr_output.model != ffi.NULL else None
             )
             rect = ScreenRect(x, y, width, height)
-            outputs.append(Output(port_str, make_str, model_str, serial_str, rect))
+            refresh_rate = wlr_output.refresh / 1000 if wlr_output.refresh else None
+            outputs.append(Output(port_str, make_str, model_str, serial_str, rect, refresh_rate))
 
         lib.qw_server_loop_output_dims(self.qw, loop)
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import math
 from typing import TYPE_CHECKING
 
 import cairocffi
@@ -14,14 +15,26 @@ class Drawer(drawer.Drawer):
     """
     A helper class for drawing and text layout.
 
-    1. We stage drawing operations locally in memory using a cairo RecordingSurface.
+    1. We stage drawing operations locally in memory using a cairo RecordingSurface,
+       or an ImageSurface at the output's scale for persistent Drawers.
     2. Then apply these operations to the windows's underlying ImageSurface.
     """
 
     _win: Internal
 
-    def __init__(self, win: Internal, width: int, height: int):
-        drawer.Drawer.__init__(self, win, width, height)
+    def __init__(self, win: Internal, width: int, height: int, persistent: bool = False):
+        drawer.Drawer.__init__(self, win, width, height, persistent=persistent)
+
+    def _create_persistent_surface(self) -> cairocffi.Surface:
+        scale = self._win.scale
+        surface = cairocffi.ImageSurface(
+            cairocffi.FORMAT_ARGB32,
+            math.ceil(self.width * scale),
+            math.ceil(self.height * scale),
+        )
+        # Keep drawing in logical coordinates while rendering at the output's scale
+        surface.set_device_scale(scale, scale)
+        return surface
 
     def _draw(
         self,
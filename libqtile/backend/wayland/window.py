@@ -303,9 +303,9 @@ class Internal(Base, base.Internal):
     def finalize(self) -> None:
         self.hide()
 
-    def create_drawer(self, width: int, height: int) -> Drawer:
+    def create_drawer(self, width: int, height: int, persistent: bool = False) -> Drawer:
         """Create a Drawer that draws to this window."""
-        return Drawer(self, width, height)
+        return Drawer(self, width, height, persistent=persistent)
 
     def set_buffer_with_damage(self, offsetx: int, offsety: int, width: int, height: int) -> None:
         lib.qw_internal_view_set_buffer_with_damage(
@@ -1,6 +1,7 @@
 import asyncio
 import contextlib
 import os
+import time
 from collections.abc import Callable, Iterator
 
 import xcffib
@@ -18,13 +19,17 @@ from libqtile.backend.x11.idle_notify import IdleNotifier
 from libqtile.backend.x11.xkeysyms import keysyms
 from libqtile.command.base import expose_command
 from libqtile.log_utils import logger
+from libqtile.profiling import profiler
 from libqtile.utils import QtileError
 
 EVENT_TO_HANDLER = {
     xcffib.xproto.ButtonPressEvent: "handle_ButtonPress",
     xcffib.xproto.ButtonReleaseEvent: "handle_ButtonRelease",
+    xcffib.xproto.CirculateNotifyEvent: "handle_CirculateNotify",
     xcffib.xproto.ClientMessageEvent: "handle_ClientMessage",
+    xcffib.xproto.ConfigureNotifyEvent: "handle_ConfigureNotify",
     xcffib.xproto.ConfigureRequestEvent: "handle_ConfigureRequest",
+    xcffib.xproto.CreateNotifyEvent: "handle_CreateNotify",
     xcffib.xproto.DestroyNotifyEvent: "handle_DestroyNotify",
     xcffib.xproto.EnterNotifyEvent: "handle_EnterNotify",
     xcffib.xproto.ExposeEvent: "handle_Expose",
@@ -35,19 +40,18 @@ EVENT_TO_HANDLER = {
     xcffib.xproto.MapRequestEvent: "handle_MapRequest",
     xcffib.xproto.MotionNotifyEvent: "handle_MotionNotify",
     xcffib.xproto.PropertyNotifyEvent: "handle_PropertyNotify",
+    xcffib.xproto.ReparentNotifyEvent: "handle_ReparentNotify",
     xcffib.randr.ScreenChangeNotifyEvent: "handle_ScreenChangeNotify",
     xcffib.xproto.SelectionNotifyEvent: "handle_SelectionNotify",
     xcffib.xproto.UnmapNotifyEvent: "handle_UnmapNotify",
 }
 
 _IGNORED_EVENTS = {
-    xcffib.xproto.CreateNotifyEvent,
     xcffib.xproto.FocusInEvent,
     xcffib.xproto.KeyReleaseEvent,
     # DWM handles this to help "broken focusing windows".
     xcffib.xproto.MapNotifyEvent,
     xcffib.xproto.NoExposureEvent,
-    xcffib.xproto.ReparentNotifyEvent,
 }
 
 
@@ -162,8 +166,14 @@ class Core(base.Core):
 
         # The last motion notify event that we still need to handle
         self._motion_notify: xcffib.Event | None = None
-        # The last time we were handling a MotionNotify event
-        self._last_motion_time = 0
+        # Atoms of coalesced properties that changed in this poll, per window
+        self._property_changes: dict[int, dict[int, None]] = {}
+        # The connection and window used by get_valid_timestamp
+        self._timestamp_connection: tuple[xcffib.Connection, int] | None = None
+        # How many requests Window.place sent or skipped because nothing changed
+        self.place_stats = {
+            op: {"sent": 0, "skipped": 0} for op in ("configure", "borders", "notify")
+        }
 
         self.last_focused: window.Window | None = None
 
@@ -182,6 +192,7 @@ class Core(base.Core):
             ).check()
         if hasattr(self, "qtile"):
             delattr(self, "qtile")
+        self._close_timestamp_connection()
         self.conn.finalize()
 
     def get_output_info(self) -> list[config.Output]:
@@ -246,44 +257,54 @@ class Core(base.Core):
             return
 
         # Qtile just started - scan for clients
-        for wid in self._root.query_tree():
-            item = window.XWindow(self.conn, wid)
+        self.conn.stacking.reset(self._root.query_tree())
+        # Most children of the root are unmapped or override-redirect, so only their
+        # attributes are requested, all at once. The windows that may be managed are
+        # then prefetched, all at once too.
+        wids = list(self.conn.stacking)
+        attributes = [self.conn.conn.core.GetWindowAttributes(wid) for wid in wids]
+        candidates = []
+        for wid, cookie in zip(wids, attributes):
             try:
-                attrs = item.get_attributes()
-                state = item.get_wm_state()
-                internal = item.get_property("QTILE_INTERNAL")
+                attrs = cookie.reply()
             except (xcffib.xproto.WindowError, xcffib.xproto.AccessError):
                 continue
-
-            if (
-                attrs
-                and attrs.map_state == xcffib.xproto.MapState.Unmapped
-                or attrs.override_redirect
-            ):
-                continue
-            if state and state[0] == window.WithdrawnState:
-                item.unmap()
+            if attrs.map_state == xcffib.xproto.MapState.Unmapped or attrs.override_redirect:
                 continue
+            item = window.XWindow(self.conn, wid)
+            candidates.append((item, item.send_prefetch()))
+
+        for item, cookies in candidates:
+            with item.prefetch(cookies=cookies):
+                try:
+                    state = item.get_wm_state()
+                    internal = item.get_property("QTILE_INTERNAL")
+                except (xcffib.xproto.WindowError, xcffib.xproto.AccessError):
+                    continue
 
-            if item.wid in self.qtile.windows_map:
-                win = self.qtile.windows_map[item.wid]
-                win.unhide()
-                return
+                if state and state[0] == window.WithdrawnState:
+                    item.unmap()
+                    continue
 
-            if internal:
-                win = window.Internal(item, self.qtile)
-            else:
-                win = window.Window(item, self.qtile)
+                if item.wid in self.qtile.windows_map:
+                    win = self.qtile.windows_map[item.wid]
+                    win.unhide()
+                    return
 
-                if item.get_wm_type() == "dock" or win.reserved_space:
-                    assert self.qtile.current_screen is not None
-                    win.static(self.qtile.current_screen.index)
-                    continue
+                if internal:
+                    win = window.Internal(item, self.qtile)
+                else:
+                    win = window.Window(item, self.qtile)
 
-            self.qtile.manage(win)
+                    if item.get_wm_type() == "dock" or win.reserved_space:
+                        assert self.qtile.current_screen is not None
+                        win.static(self.qtile.current_screen.index)
+                        continue
 
-            self.update_client_lists()
-            win.change_layer()
+                self.qtile.manage(win)
+
+                self.update_client_lists()
+                win.change_layer()
 
     def warp_pointer(self, x, y):
         self._root.warp_pointer(x, y)
@@ -308,10 +329,15 @@ class Core(base.Core):
         """Handle an X11 event by forwarding it to the right target"""
         targets = self._get_target_chain(event)
         logger.debug("X11 event: %s (targets: %s)", event.__class__.__name__, targets)
+        profiling = profiler.enabled
+        if profiling:
+            start = time.perf_counter()
         for target in targets:
             ret = target(event)
             if not ret:
                 break
+        if profiling:
+            profiler.record("x11", event.__class__.__name__, time.perf_counter() - start)
 
     def _xpoll(self) -> None:
         """Poll the connection and dispatch incoming events"""
@@ -329,6 +355,12 @@ class Core(base.Core):
                 if self.idle_notifier.check_event(event):
                     continue
 
+                # Some property changes are handled together at the end of the poll
+                if isinstance(
+                    event, xcffib.xproto.PropertyNotifyEvent
+                ) and self._coalesce_property_change(event):
+                    continue
+
                 # Motion Notifies are handled later
                 # Otherwise this is too CPU intensive
                 if isinstance(event, xcffib.xproto.MotionNotifyEvent):
@@ -371,12 +403,50 @@ class Core(base.Core):
                     self.qtile.stop()
                     return
                 logger.exception("Got an exception in poll loop")
+        if self._property_changes:
+            self._handle_property_changes()
         # Handle any outstanding motion notify events
         if self._motion_notify:
             self.handle_event(self._motion_notify)
             self._motion_notify = None
         self.flush()
 
+    def _coalesce_property_change(self, event) -> bool:
+        """Record a change of a coalesced property, returning whether it was one"""
+        assert self.qtile is not None
+        win = self.qtile.windows_map.get(event.window)
+        if not isinstance(win, window.Window):
+            return False
+        if self.conn.atoms.get_name(event.atom) not in win.coalesced_properties:
+            return False
+        self._property_changes.setdefault(event.window, {})[event.atom] = None
+        return True
+
+    def _handle_property_changes(self) -> None:
+        """
+        Handle the property changes recorded by this poll, reading the properties of
+        all of the windows in one round trip and updating each window once
+        """
+        assert self.qtile is not None
+        changes, self._property_changes = self._property_changes, {}
+
+        pending = []
+        for wid, atoms in changes.items():
+            win = self.qtile.windows_map.get(wid)
+            # The window may have been unmanaged by a later event
+            if not isinstance(win, window.Window):
+                continue
+            names = self.conn.atoms.get_names(atoms)
+            pending.append((win, names, win.prefetch_property_changes(names)))
+
+        for win, names, cookies in pending:
+            try:
+                win.handle_property_changes(names, cookies)
+            except (xcffib.xproto.WindowError, xcffib.xproto.AccessError):
+                pass
+            except Exception:
+                logger.exception("Got an exception handling property changes")
+
     def _get_target_chain(self, event) -> list[Callable]:
         """Returns a chain of targets that can handle this event
 
@@ -431,28 +501,57 @@ class Core(base.Core):
         # we do this on a separate connection since we can't receive events
         # without returning control to the event loop, which we can't do
         # because the event loop (via some window event) wants to know the
-        # current time.
-        conn = None
+        # current time. The connection is kept, and only gets events for the
+        # property changes of its own window, so the next one is ours.
         try:
-            conn = xcbq.Connection(self._display_name)
-            conn.default_screen.root.set_attribute(eventmask=EventMask.PropertyChange)
-            conn.conn.core.ChangePropertyChecked(
+            conn, wid = self._get_timestamp_connection()
+            conn.core.ChangeProperty(
                 xcffib.xproto.PropMode.Append,
-                self._root.wid,
+                wid,
                 self.conn.atoms["WM_CLASS"],
                 self.conn.atoms["STRING"],
                 8,
                 0,
                 "",
-            ).check()
+            )
+            conn.flush()
             while True:
-                event = conn.conn.wait_for_event()
-                if event.__class__ != xcffib.xproto.PropertyNotifyEvent:
-                    continue
-                return event.time
-        finally:
-            if conn is not None:
-                conn.finalize()
+                event = conn.wait_for_event()
+                if isinstance(event, xcffib.xproto.PropertyNotifyEvent) and event.window == wid:
+                    return event.time
+        except xcffib.ConnectionException:
+            # Connect again next time
+            self._close_timestamp_connection()
+            raise
+
+    def _get_timestamp_connection(self) -> tuple[xcffib.Connection, int]:
+        if self._timestamp_connection is None:
+            conn = xcffib.connect(display=self._display_name)
+            root = conn.get_setup().roots[conn.pref_screen].root
+            wid = conn.generate_id()
+            conn.core.CreateWindow(
+                0,
+                wid,
+                root,
+                -1,
+                -1,
+                1,
+                1,
+                0,
+                xcffib.xproto.WindowClass.InputOnly,
+                0,
+                xcffib.xproto.CW.EventMask,
+                [EventMask.PropertyChange],
+            )
+            self._timestamp_connection = (conn, wid)
+        return self._timestamp_connection
+
+    def _close_timestamp_connection(self) -> None:
+        if self._timestamp_connection is not None:
+            conn, _ = self._timestamp_connection
+            self._timestamp_connection = None
+            with contextlib.suppress(xcffib.ConnectionException):
+                conn.disconnect()
 
     @property
     def display_name(self) -> str:
@@ -470,9 +569,8 @@ class Core(base.Core):
         wids = [wid for wid, c in self.qtile.windows_map.items() if isinstance(c, window.Window)]
         self._root.set_property("_NET_CLIENT_LIST", wids)
 
-        # We rely on the stacking order from the X server
         stacked_wids = []
-        for wid in self._root.query_tree():
+        for wid in self.conn.stacking:
             win = self.qtile.windows_map.get(wid)
             if not win:
                 continue
@@ -720,16 +818,7 @@ class Core(base.Core):
 
     def handle_MotionNotify(self, event) -> None:  # noqa: N802
         assert self.qtile is not None
-
-        # Limit the motion notify events from happening too frequently
-        # As we already handle motion notify events "later", the default is None
-        # So we also need to check if this has to be done in the first place
-        resize_fps = self.qtile.current_screen.x11_drag_polling_rate
-        if resize_fps is not None and (event.time - self._last_motion_time) <= (
-            1000 / resize_fps
-        ):
-            return
-        self._last_motion_time = event.time
+        # Motion is coalesced and throttled by the drag itself
         self.qtile.process_button_motion(event.event_x, event.event_y)
 
     def handle_ConfigureRequest(self, event):  # noqa: N802
@@ -760,6 +849,12 @@ class Core(base.Core):
         assert self.qtile is not None
 
         xwin = window.XWindow(self.conn, event.window)
+        with xwin.prefetch():
+            self._manage_mapped(xwin)
+
+    def _manage_mapped(self, xwin: window.XWindow) -> None:
+        assert self.qtile is not None
+
         try:
             attrs = xwin.get_attributes()
             internal = xwin.get_property("QTILE_INTERNAL")
@@ -794,9 +889,41 @@ class Core(base.Core):
             self.update_client_lists()
             win.change_layer()
 
+    def handle_CreateNotify(self, event) -> None:  # noqa: N802
+        if event.parent == self._root.wid:
+            self.conn.stacking.add(event.window)
+
+    def handle_ReparentNotify(self, event) -> None:  # noqa: N802
+        if event.parent == self._root.wid:
+            self.conn.stacking.add(event.window)
+        else:
+            self.conn.stacking.remove(event.window)
+
+    def handle_ConfigureNotify(self, event) -> None:  # noqa: N802
+        assert self.qtile is not None
+        # The stacking of the windows that we manage is updated when we restack them
+        if event.event != self._root.wid or event.window in self.qtile.windows_map:
+            return
+        if event.above_sibling:
+            self.conn.stacking.restack(
+                event.window, xcffib.xproto.StackMode.Above, event.above_sibling
+            )
+        else:
+            # No sibling means that the window is at the bottom of the stack
+            self.conn.stacking.restack(event.window, xcffib.xproto.StackMode.Below)
+
+    def handle_CirculateNotify(self, event) -> None:  # noqa: N802
+        if event.event != self._root.wid:
+            return
+        if event.place == xcffib.xproto.Place.OnTop:
+            self.conn.stacking.restack(event.window, xcffib.xproto.StackMode.Above)
+        else:
+            self.conn.stacking.restack(event.window, xcffib.xproto.StackMode.Below)
+
     def handle_DestroyNotify(self, event) -> None:  # noqa: N802
         assert self.qtile is not None
 
+        self.conn.stacking.remove(event.window)
         self.qtile.unmanage(event.window)
         self.update_client_lists()
         if self.qtile.current_window is None:
@@ -948,6 +1075,28 @@ class Core(base.Core):
 
         self.last_focused = win
 
+    @expose_command
+    def verify_stacking(self) -> dict[str, list[int]]:
+        """
+        Compare the stacking order that qtile keeps with the one on the server, which
+        it is then reset to. Returns both if they differ, or an empty dict if not.
+        """
+        server = list(self._root.query_tree())
+        local = list(self.conn.stacking)
+        self.conn.stacking.reset(server)
+        if server == local:
+            return {}
+        logger.warning("The stacking order differed from the server's")
+        return {"local": local, "server": server}
+
+    @expose_command
+    def get_place_stats(self) -> dict[str, dict[str, int]]:
+        """
+        Get how many ConfigureWindow requests, border paints and synthetic
+        ConfigureNotify events were sent or skipped when placing windows
+        """
+        return self.place_stats
+
     @expose_command
     def idle_notify_activity(self) -> None:
         self._fake_input(xcbq.XCB_MOTION_NOTIFY, 0, 0, 0)
@@ -18,14 +18,27 @@ class Drawer(drawer.Drawer):
     draw()), we copy the appropriate portion of the pixmap onto the window. In the event
     that our drawing area is resized, we invalidate the underlying surface and pixmap
     and recreate them when we need them again with the new geometry.
+
+    Persistent Drawers draw straight to the XCBSurface rather than to a
+    RecordingSurface that is replayed onto it.
     """
 
-    def __init__(self, conn: xcbq.Connection, win: window.Internal, width: int, height: int):
-        drawer.Drawer.__init__(self, win, width, height)
+    def __init__(
+        self,
+        conn: xcbq.Connection,
+        win: window.Internal,
+        width: int,
+        height: int,
+        persistent: bool = False,
+    ):
+        # These are needed to create the persistent surface, which is done by the base
+        # class constructor
         self.conn = conn
         self._xcb_surface = None
+        self._pixmap = None
         self._gc = None
         self._depth, self._visual = conn.default_screen._get_depth_and_visual(win._depth)
+        drawer.Drawer.__init__(self, win, width, height, persistent=persistent)
         # Create an XCBSurface and pixmap
         self._check_xcb()
 
@@ -45,6 +58,7 @@ class Drawer(drawer.Drawer):
             self._free_xcb_surface()
             self._free_pixmap()
         self._width = width
+        self._check_persistent_surface()
 
     @property
     def height(self):
@@ -56,6 +70,7 @@ class Drawer(drawer.Drawer):
             self._free_xcb_surface()
             self._free_pixmap()
         self._height = height
+        self._check_persistent_surface()
 
     @property
     def pixmap(self):
@@ -122,7 +137,24 @@ class Drawer(drawer.Drawer):
             self._pixmap = self._create_pixmap()
             self._xcb_surface = self._create_xcb_surface()
 
+    def _create_persistent_surface(self):
+        self._check_xcb()
+        return self._xcb_surface
+
+    def _check_persistent_surface(self):
+        # The XCBSurface is freed when the Drawer grows, and the persistent surface
+        # is the XCBSurface
+        if self._persistent and hasattr(self, "surface") and self._xcb_surface is None:
+            del self.surface
+            self._reset_surface()
+
     def _paint(self):
+        if self._persistent:
+            # Operations were drawn straight to the XCBSurface, make sure that they
+            # have been sent before copying its pixmap
+            self._xcb_surface.flush()
+            return
+
         # Paint RecordingSurface operations to the XCBSurface
         ctx = cairocffi.Context(self._xcb_surface)
         ctx.set_source_surface(self.surface, 0, 0)
@@ -181,6 +213,11 @@ class Drawer(drawer.Drawer):
         The ability to clear a smaller area may be useful when you want to
         erase a smaller area of the drawer (e.g. drawing widget decorations).
         """
+        if self._persistent:
+            # Clearing the persistent surface clears the XCBSurface
+            drawer.Drawer.clear_rect(self, x, y, width, height)
+            return
+
         if width <= 0:
             width = self.width
         if height <= 0:
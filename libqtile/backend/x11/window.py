@@ -1,7 +1,11 @@
 import array
 import contextlib
 import inspect
+import re
+import sys
+import time
 import traceback
+from collections.abc import Mapping
 from itertools import islice
 
 import xcffib
@@ -96,9 +100,116 @@ def _geometry_setter(attr):
 
 
 class XWindow:
+    # The properties read when a window is managed, which prefetch() requests up front
+    prefetch_properties = (
+        ("QTILE_INTERNAL", "CARDINAL"),
+        ("WM_STATE", xcffib.xproto.GetPropertyType.Any),
+        ("_NET_WM_VISIBLE_NAME", "UTF8_STRING"),
+        ("_NET_WM_NAME", "UTF8_STRING"),
+        (xcffib.xproto.Atom.WM_NAME, "UTF8_STRING"),
+        (xcffib.xproto.Atom.WM_NAME, xcffib.xproto.GetPropertyType.Any),
+        ("WM_CLASS", "STRING"),
+        ("WM_WINDOW_ROLE", "STRING"),
+        ("WM_TRANSIENT_FOR", "WINDOW"),
+        ("WM_HINTS", xcffib.xproto.GetPropertyType.Any),
+        ("WM_NORMAL_HINTS", xcffib.xproto.GetPropertyType.Any),
+        ("WM_PROTOCOLS", "ATOM"),
+        ("_NET_WM_WINDOW_TYPE", "ATOM"),
+        ("_NET_WM_STATE", "ATOM"),
+        ("_NET_WM_PID", "CARDINAL"),
+        ("_NET_WM_DESKTOP", "CARDINAL"),
+        ("_NET_WM_ICON", "CARDINAL"),
+        ("_NET_WM_STRUT_PARTIAL", "CARDINAL"),
+        ("_NET_WM_WINDOW_OPACITY", "CARDINAL"),
+    )
+
     def __init__(self, conn, wid):
         self.conn = conn
         self.wid = wid
+        # Replies from prefetch(), or the errors they raised
+        self._prefetched = None
+        # The geometry and border width last sent with configure()
+        self._configured = {}
+
+    def send_prefetch(self, properties=None):
+        """
+        Send the requests for prefetch() without waiting for their replies, so that
+        several windows can be prefetched in the same round trip.
+
+        By default, the attributes, geometry and all of the properties that are
+        needed to manage the window are requested. Otherwise, only the given
+        (property, type) pairs are.
+        """
+        core = self.conn.conn.core
+        cookies = {}
+        if properties is None:
+            properties = self.prefetch_properties
+            cookies["attributes"] = core.GetWindowAttributes(self.wid)
+            cookies["geometry"] = core.GetGeometry(self.wid)
+        for prop, type in properties:
+            key = self._property_key(prop, type)
+            cookies[key] = core.GetProperty(False, self.wid, *key, 0, (2**32) - 1)
+        return cookies
+
+    @contextlib.contextmanager
+    def prefetch(self, properties=None, cookies=None):
+        """
+        Request the attributes, geometry and properties of the window that are needed
+        to manage it all at once, so that they take a single round trip rather than
+        one each. Within the context, they are read from the prefetched replies.
+
+        Requests that were already sent with send_prefetch() can be passed as cookies.
+        """
+        start = time.perf_counter()
+        if cookies is None:
+            cookies = self.send_prefetch(properties)
+
+        prefetched = {}
+        for key, cookie in cookies.items():
+            try:
+                prefetched[key] = cookie.reply()
+            except (
+                xcffib.xproto.WindowError,
+                xcffib.xproto.AccessError,
+                xcffib.xproto.DrawableError,
+            ) as e:
+                prefetched[key] = e
+        fetched = time.perf_counter()
+
+        self._prefetched = prefetched
+        try:
+            yield
+        finally:
+            self._prefetched = None
+            logger.debug(
+                "Window %s: prefetched %d replies in %.2fms, handled in %.2fms",
+                self.wid,
+                len(cookies),
+                (fetched - start) * 1000,
+                (time.perf_counter() - fetched) * 1000,
+            )
+
+    def _get_prefetched(self, key):
+        """Return a prefetched reply, or None if there isn't one. Errors are re-raised."""
+        if self._prefetched is None:
+            return None
+        reply = self._prefetched.get(key)
+        if isinstance(reply, Exception):
+            raise reply
+        return reply
+
+    def _property_key(self, prop, type):
+        return (
+            self.conn.atoms[prop] if isinstance(prop, str) else prop,
+            self.conn.atoms[type] if isinstance(type, str) else type,
+        )
+
+    def _forget_prefetched(self, prop):
+        if self._prefetched is None:
+            return
+        atom = self.conn.atoms[prop] if isinstance(prop, str) else prop
+        for key in [k for k in self._prefetched if isinstance(k, tuple) and k[0] == atom]:
+            del self._prefetched[key]
 
     def _property_string(self, r):
         """Extract a string from a window property reply message"""
@@ -202,7 +313,7 @@ class XWindow:
     def get_wm_protocols(self):
         wm_protocols = self.get_property("WM_PROTOCOLS", "ATOM", unpack=int)
         if wm_protocols is not None:
-            return {self.conn.atoms.get_name(wm_protocol) for wm_protocol in wm_protocols}
+            return set(self.conn.atoms.get_names(wm_protocols))
         return set()
 
     def get_wm_state(self):
@@ -243,6 +354,9 @@ class XWindow:
             return self._property_utf8(r)
 
     def get_geometry(self):
+        reply = self._get_prefetched("geometry")
+        if reply is not None:
+            return reply
         q = self.conn.conn.core.GetGeometry(self.wid)
         return q.reply()
 
@@ -259,8 +373,7 @@ class XWindow:
         r = self.get_property("_NET_WM_WINDOW_TYPE", "ATOM", unpack=int)
         if r:
             first_name = None
-            for i, a in enumerate(r):
-                name = self.conn.atoms.get_name(a)
+            for i, name in enumerate(self.conn.atoms.get_names(r)):
                 if i == 0:
                     first_name = name
                 qtile_type = xcbq.WindowTypes.get(name, None)
@@ -272,7 +385,7 @@ class XWindow:
     def get_net_wm_state(self):
         r = self.get_property("_NET_WM_STATE", "ATOM", unpack=int)
         if r:
-            names = [self.conn.atoms.get_name(p) for p in r]
+            names = self.conn.atoms.get_names(r)
             return [xcbq.WindowStates.get(n, n) for n in names]
         return []
 
@@ -286,12 +399,30 @@ class XWindow:
         Arguments can be: x, y, width, height, borderwidth, sibling, stackmode
         """
         mask, values = xcbq.ConfigureMasks(**kwargs)
+        if self._prefetched is not None:
+            self._prefetched.pop("geometry", None)
+        for key in ("x", "y", "width", "height", "borderwidth"):
+            if key in kwargs:
+                self._configured[key] = kwargs[key]
+        if "stackmode" in kwargs:
+            self.conn.stacking.restack(self.wid, kwargs["stackmode"], kwargs.get("sibling"))
         # older versions of xcb pack everything into unsigned ints "=I"
         # since 1.12, uses switches to pack things sensibly
         if float(".".join(xcffib.__xcb_proto_version__.split(".")[0:2])) < 1.12:
             values = [i & 0xFFFFFFFF for i in values]
         return self.conn.conn.core.ConfigureWindow(self.wid, mask, values)
 
+    def configure_changed(self, **kwargs):
+        """
+        Like configure(), but only sends the values that differ from the ones last
+        sent. Returns whether a request was sent.
+        """
+        changed = {k: v for k, v in kwargs.items() if self._configured.get(k) != v}
+        if not changed:
+            return False
+        self.configure(**changed)
+        return True
+
     def set_attribute(self, **kwargs):
         mask, values = xcbq.AttributeMasks(**kwargs)
         self.conn.conn.core.ChangeWindowAttributesChecked(self.wid, mask, values)
@@ -332,6 +463,7 @@ class XWindow:
             # wrap it.
             value = [value]
 
+        self._forget_prefetched(name)
         try:
             self.conn.conn.core.ChangePropertyChecked(
                 xcffib.xproto.PropMode.Replace,
@@ -357,15 +489,11 @@ class XWindow:
             else:
                 type, _ = xcbq.PropertyMap[prop]
 
+        key = self._property_key(prop, type)
         try:
-            r = self.conn.conn.core.GetProperty(
-                False,
-                self.wid,
-                self.conn.atoms[prop] if isinstance(prop, str) else prop,
-                self.conn.atoms[type] if isinstance(type, str) else type,
-                0,
-                (2**32) - 1,
-            ).reply()
+            r = self._get_prefetched(key)
+            if r is None:
+                r = self.conn.conn.core.GetProperty(False, self.wid, *key, 0, (2**32) - 1).reply()
         except (xcffib.xproto.WindowError, xcffib.xproto.AccessError):
             logger.debug("X error in GetProperty (wid=%r, prop=%r), ignoring", self.wid, prop)
             if unpack:
@@ -387,7 +515,7 @@ class XWindow:
 
     def list_properties(self):
         r = self.conn.conn.core.ListProperties(self.wid).reply()
-        return [self.conn.atoms.get_name(i) for i in r.atoms]
+        return self.conn.atoms.get_names(r.atoms)
 
     def map(self):
         self.conn.conn.core.MapWindow(self.wid)
@@ -396,6 +524,9 @@ class XWindow:
         self.conn.conn.core.UnmapWindowUnchecked(self.wid)
 
     def get_attributes(self):
+        reply = self._get_prefetched("attributes")
+        if reply is not None:
+            return reply
         return self.conn.conn.core.GetWindowAttributes(self.wid).reply()
 
     def query_tree(self):
@@ -416,6 +547,26 @@ class XWindow:
 
         if len(colors) > borderwidth:
             colors = colors[:borderwidth]
+        # Windows with the same size and borders share the same border pixmap
+        key = (
+            depth,
+            tuple(c if isinstance(c, str) else tuple(c) for c in colors),
+            borderwidth,
+            width,
+            height,
+        )
+        border = self.conn.border_pixmaps.get(key)
+        if border is None:
+            border = self._create_border_pixmap(depth, colors, borderwidth, width, height)
+            outer_w = width + borderwidth * 2
+            outer_h = height + borderwidth * 2
+            # Pixmaps of depth 24 are stored with 32 bits per pixel too
+            self.conn.border_pixmaps.add(key, border, outer_w * outer_h * 4)
+        self.conn.conn.core.ChangeWindowAttributes(
+            self.wid, xcffib.xproto.CW.BorderPixmap, [border]
+        )
+
+    def _create_border_pixmap(self, depth, colors, borderwidth, width, height):
         core = self.conn.conn.core
         outer_w = width + borderwidth * 2
         outer_h = height + borderwidth * 2
@@ -438,21 +589,88 @@ class XWindow:
                     )
                     core.PolyFillRectangle(pixmap, gc, 1, [rect])
                     coord += borderwidths[i]
-                self._set_borderpixmap(depth, pixmap, gc, borderwidth, width, height)
+                return self._create_tiled_border(depth, pixmap, gc, borderwidth, width, height)
 
-    def _set_borderpixmap(self, depth, pixmap, gc, borderwidth, width, height):
+    def _create_tiled_border(self, depth, pixmap, gc, borderwidth, width, height):
+        """
+        Create the border pixmap, which is tiled from the origin of the window rather
+        than of its border, so the painted borders are shifted into place
+        """
         core = self.conn.conn.core
         outer_w = width + borderwidth * 2
         outer_h = height + borderwidth * 2
-        with PixmapID(self.conn.conn) as border:
-            core.CreatePixmap(depth, border, self.wid, outer_w, outer_h)
-            most_w = outer_w - borderwidth
-            most_h = outer_h - borderwidth
-            core.CopyArea(pixmap, border, gc, borderwidth, borderwidth, 0, 0, most_w, most_h)
-            core.CopyArea(pixmap, border, gc, 0, 0, most_w, most_h, borderwidth, borderwidth)
-            core.CopyArea(pixmap, border, gc, borderwidth, 0, 0, most_h, most_w, borderwidth)
-            core.CopyArea(pixmap, border, gc, 0, borderwidth, most_w, 0, borderwidth, most_h)
-            core.ChangeWindowAttributes(self.wid, xcffib.xproto.CW.BorderPixmap, [border])
+        border = self.conn.conn.generate_id()
+        core.CreatePixmap(depth, border, self.wid, outer_w, outer_h)
+        most_w = outer_w - borderwidth
+        most_h = outer_h - borderwidth
+        core.CopyArea(pixmap, border, gc, borderwidth, borderwidth, 0, 0, most_w, most_h)
+        core.CopyArea(pixmap, border, gc, 0, 0, most_w, most_h, borderwidth, borderwidth)
+        core.CopyArea(pixmap, border, gc, borderwidth, 0, 0, most_h, most_w, borderwidth)
+        core.CopyArea(pixmap, border, gc, 0, borderwidth, most_w, 0, borderwidth, most_h)
+        return border
+
+
+# _PREMULTIPLY[alpha] translates a colour channel to its value premultiplied by alpha
+_PREMULTIPLY = [bytes(int(c * (a / 255.0)) for c in range(256)) for a in range(256)]
+_TRANSLUCENT = re.compile(rb"[^\xff]")
+
+
+class NetWmIcons(Mapping):
+    """
+    The icons in a _NET_WM_ICON property, keyed by "<width>x<height>"
+
+    Only the offsets of the icons are read up front. Each icon is premultiplied
+    when it is first looked up, so consumers only pay for the sizes they use.
+    """
+
+    def __init__(self, data):
+        self.data = data
+        self._icons = {}
+        self._offsets = {}
+
+        cardinals = array.array("I")
+        cardinals.frombytes(memoryview(data)[: len(data) // 4 * 4])
+        pos = 0
+        while pos + 2 <= len(cardinals):
+            width, height = cardinals[pos], cardinals[pos + 1]
+            if not width or not height:
+                break
+            start = (pos + 2) * 4
+            end = start + width * height * 4
+            if end > len(data):
+                break
+            self._offsets[f"{width}x{height}"] = (start, end)
+            pos += 2 + width * height
+
+    def __getitem__(self, size):
+        icon = self._icons.get(size)
+        if icon is None:
+            start, end = self._offsets[size]
+            icon = self._icons[size] = self._premultiply(memoryview(self.data)[start:end])
+        return icon
+
+    def __iter__(self):
+        return iter(self._offsets)
+
+    def __len__(self):
+        return len(self._offsets)
+
+    @staticmethod
+    def _premultiply(pixels):
+        # Each pixel is a native endian ARGB cardinal, so the alpha channel is the
+        # last byte on little endian machines and the first one on big endian ones.
+        alpha_index, channels = (3, (0, 1, 2)) if sys.byteorder == "little" else (0, (1, 2, 3))
+        arr = array.array("B")
+        arr.frombytes(pixels)
+        alpha = pixels[alpha_index::4].tobytes()
+        # Opaque pixels are left alone, which is most of them in most icons
+        for match in _TRANSLUCENT.finditer(alpha):
+            i = match.start()
+            table = _PREMULTIPLY[alpha[i]]
+            pixel = i * 4
+            for c in channels:
+                arr[pixel + c] = table[arr[pixel + c]]
+        return arr
 
 
 class _Window:
@@ -495,6 +713,8 @@ class _Window:
         self.previous_layer = (False, False, True, False, False, False)
 
         self.bordercolor = None
+        # The colours, width and window size of the borders last painted
+        self._painted_borders = None
         self.state = NormalState
         self._float_state = FloatStates.NOT_FLOATING
         self._demands_attention = False
@@ -813,10 +1033,14 @@ class _Window:
         above=False,
         margin=None,
         respect_hints=False,
+        force_notify=False,
     ):
         """
         Places the window at the specified location with the given size.
 
+        Only the geometry and borders that changed since the window was last
+        placed are sent to the X server, see Core.get_place_stats.
+
         Parameters
         ==========
         x: int
@@ -831,22 +1055,11 @@ class _Window:
         above: bool, optional
             If True, the geometry will be adjusted to respect hints provided by the
             client.
+        force_notify: bool, optional
+            If True, a synthetic ConfigureNotify is sent even if nothing changed,
+            e.g. to answer a ConfigureRequest.
         """
 
-        # TODO: self.x/y/height/width are updated BEFORE
-        # place is called, so there's no way to know if only
-        # the position is changed, so we are sending
-        # the ConfigureNotify every time place is called
-        #
-        # # if position change and size don't
-        # # send a configure notify. See ICCCM 4.2.3
-        # send_notify = False
-        # if (self.x != x or self.y != y) and \
-        #    (self.width == width and self.height == height):
-        #       send_notify = True
-        # #for now, we just:
-        send_notify = True
-
         # Adjust the placement to account for layout margins, if there are any.
         if margin is not None:
             if isinstance(margin, int):
@@ -897,15 +1110,20 @@ class _Window:
         self.width = width
         self.height = height
 
-        self.window.configure(x=x, y=y, width=width, height=height)
+        stats = self.qtile.core.place_stats
+        moved = self.window.configure_changed(x=x, y=y, width=width, height=height)
+        stats["configure"]["sent" if moved else "skipped"] += 1
 
         if above:
             self.change_layer(up=True)
 
-        self.paint_borders(bordercolor, borderwidth)
+        moved |= self.paint_borders(bordercolor, borderwidth)
 
-        if send_notify:
+        # Clients need a synthetic ConfigureNotify when they are moved without being
+        # resized (ICCCM 4.2.3), but we send one whenever something changed to be safe
+        if moved or force_notify:
             self.send_configure_notify(x, y, width, height)
+        stats["notify"]["sent" if moved or force_notify else "skipped"] += 1
 
     def get_layering_information(self) -> tuple[bool, bool, bool, bool, bool, bool]:
         """
@@ -1002,7 +1220,7 @@ class _Window:
         moved = (self.previous_layer > layering) - (layering > self.previous_layer)
         self.previous_layer = layering
 
-        stack = list(self.qtile.core._root.query_tree())
+        stack = list(self.qtile.core.conn.stacking)
         if self.wid not in stack or len(stack) < 2:
             return
 
@@ -1192,7 +1410,7 @@ class _Window:
         ]
         if children:
             if stack is None:
-                stack = list(self.qtile.core._root.query_tree())
+                stack = list(self.qtile.core.conn.stacking)
             parent = self.window.wid
             children.sort(key=stack.index)
             for child in children:
@@ -1202,10 +1420,21 @@ class _Window:
                 parent = child
 
     def paint_borders(self, color, width):
+        """Paint the borders, unless they are already painted. Returns whether they were."""
         self.borderwidth = width
         self.bordercolor = color
+        # Multi-colour borders are painted on a pixmap the size of the window
+        colors = color if isinstance(color, str) or not color else tuple(color)
+        borders = (colors, width, self.width, self.height, self.depth)
+        stats = self.qtile.core.place_stats
+        if borders == self._painted_borders:
+            stats["borders"]["skipped"] += 1
+            return False
+        self._painted_borders = borders
+        stats["borders"]["sent"] += 1
         self.window.configure(borderwidth=width)
         self.window.paint_borders(self.depth, color, width, self.width, self.height)
+        return True
 
     def send_configure_notify(self, x, y, width, height):
         """Send a synthetic ConfigureNotify"""
@@ -1513,9 +1742,9 @@ class Internal(_Window, base.Internal):
         win.set_property("QTILE_INTERNAL", 1)
         self._depth = desired_depth
 
-    def create_drawer(self, width: int, height: int) -> Drawer:
+    def create_drawer(self, width: int, height: int, persistent: bool = False) -> Drawer:
         """Create a Drawer that draws to this window."""
-        return Drawer(self.conn, self, width, height)
+        return Drawer(self.conn, self, width, height, persistent=persistent)
 
     @expose_command()
     def kill(self):
@@ -1621,6 +1850,7 @@ class Static(_Window, base.Static):
             self.height,
             self.borderwidth,
             self.bordercolor,
+            force_notify=True,
         )
         return False
 
@@ -1678,6 +1908,32 @@ class Window(_Window, base.Window):
         | EventMask.FocusChange
     )
 
+    # Properties that only need to be read again once however often they change
+    # within a batch of events, and the update method that reads them
+    coalesced_properties = {
+        "WM_CLASS": "update_wm_class",
+        "WM_HINTS": "update_hints",
+        "WM_NORMAL_HINTS": "update_hints",
+        "WM_NAME": "update_name",
+        "_NET_WM_NAME": "update_name",
+        "_NET_WM_VISIBLE_NAME": "update_name",
+        "_NET_WM_ICON": "update_wm_net_icon",
+    }
+    _update_properties = {
+        "update_wm_class": (("WM_CLASS", "STRING"),),
+        "update_hints": (
+            ("WM_HINTS", xcffib.xproto.GetPropertyType.Any),
+            ("WM_NORMAL_HINTS", xcffib.xproto.GetPropertyType.Any),
+        ),
+        "update_name": (
+            ("_NET_WM_VISIBLE_NAME", "UTF8_STRING"),
+            ("_NET_WM_NAME", "UTF8_STRING"),
+            (xcffib.xproto.Atom.WM_NAME, "UTF8_STRING"),
+            (xcffib.xproto.Atom.WM_NAME, xcffib.xproto.GetPropertyType.Any),
+        ),
+        "update_wm_net_icon": (("_NET_WM_ICON", "CARDINAL"),),
+    }
+
     def __init__(self, window, qtile):
         _Window.__init__(self, window, qtile)
         self._wm_class: list[str] | None = None
@@ -1713,7 +1969,7 @@ class Window(_Window, base.Window):
 
     @floating.setter
     def floating(self, do_float):
-        stack = self.qtile.core._root.query_tree()
+        stack = list(self.qtile.core.conn.stacking)
         tiled = [win.window.wid for win in (self.group.tiled_windows if self.group else [])]
         tiled_stack = [wid for wid in stack if wid in tiled and wid != self.window.wid]
         if do_float and self._float_state == FloatStates.NOT_FLOATING:
@@ -2080,43 +2336,22 @@ class Window(_Window, base.Window):
                 height,
                 self.borderwidth,
                 self.bordercolor,
+                force_notify=True,
             )
         self.update_state()
         return False
 
     def update_wm_net_icon(self):
-        """Set a dict with the icons of the window"""
+        """Set a mapping with the icons of the window"""
 
         icon = self.window.get_property("_NET_WM_ICON", "CARDINAL")
         if not icon:
             return
-        icon = list(map(ord, icon.value))
-
-        icons = {}
-        while True:
-            if not icon:
-                break
-            size = icon[:8]
-            if len(size) != 8 or not size[0] or not size[4]:
-                break
-
-            icon = icon[8:]
-
-            width = size[0]
-            height = size[4]
-
-            next_pix = width * height * 4
-            data = icon[:next_pix]
-
-            arr = array.array("B", data)
-            for i in range(0, len(arr), 4):
-                mult = arr[i + 3] / 255.0
-                arr[i + 0] = int(arr[i + 0] * mult)
-                arr[i + 1] = int(arr[i + 1] * mult)
-                arr[i + 2] = int(arr[i + 2] * mult)
-            icon = icon[next_pix:]
-            icons[f"{width}x{height}"] = arr
-        self.icons = icons
+        data = icon.value.buf()
+        # Clients often set the property again without changing their icons
+        if isinstance(self.icons, NetWmIcons) and self.icons.data == data:
+            return
+        self.icons = NetWmIcons(data)
         hook.fire("net_wm_icon_change", self)
 
     def handle_ClientMessage(self, event):  # noqa: N802
@@ -2168,28 +2403,35 @@ class Window(_Window, base.Window):
         else:
             logger.debug("Unhandled client message: %s", atoms.get_name(opcode))
 
+    def prefetch_property_changes(self, names):
+        """Send the requests for the properties that handle_property_changes() reads"""
+        updates = dict.fromkeys(self.coalesced_properties[name] for name in names)
+        return self.window.send_prefetch(
+            [prop for update in updates for prop in self._update_properties[update]]
+        )
+
+    def handle_property_changes(self, names, cookies=None):
+        """
+        Handle changes of coalesced_properties, calling each update once however many
+        of its properties changed. The properties are read with a single round trip,
+        or none if cookies from prefetch_property_changes() are passed.
+        """
+        if cookies is None:
+            cookies = self.prefetch_property_changes(names)
+        with self.window.prefetch(cookies=cookies):
+            for update in dict.fromkeys(self.coalesced_properties[name] for name in names):
+                getattr(self, update)()
+
     def handle_PropertyNotify(self, e):  # noqa: N802
         name = self.qtile.core.conn.atoms.get_name(e.atom)
-        if name == "WM_TRANSIENT_FOR":
+        if name in self.coalesced_properties:
+            self.handle_property_changes([name])
+        elif name == "WM_TRANSIENT_FOR":
             pass
-        elif name == "WM_CLASS":
-            self.update_wm_class()
-        elif name == "WM_HINTS":
-            self.update_hints()
-        elif name == "WM_NORMAL_HINTS":
-            self.update_hints()
-        elif name == "WM_NAME":
-            self.update_name()
-        elif name == "_NET_WM_NAME":
-            self.update_name()
-        elif name == "_NET_WM_VISIBLE_NAME":
-            self.update_name()
         elif name == "WM_ICON_NAME":
             pass
         elif name == "_NET_WM_ICON_NAME":
             pass
-        elif name == "_NET_WM_ICON":
-            self.update_wm_net_icon()
         elif name == "ZOOM":
             pass
         elif name == "_NET_WM_WINDOW_OPACITY":
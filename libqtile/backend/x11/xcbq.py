@@ -7,6 +7,8 @@ import contextlib
 import functools
 import operator
 import struct
+import time
+from collections import OrderedDict
 from itertools import chain, repeat
 
 import cairocffi
@@ -173,6 +175,42 @@ SUPPORTED_ATOMS = [
 SUPPORTED_ATOMS.extend(WindowTypes.keys())
 SUPPORTED_ATOMS.extend(net_wm_states)
 
+# Atoms that are interned together when connecting, rather than one at a time when
+# they are first used. See declare_atoms.
+declared_atoms = dict.fromkeys(
+    [
+        *SUPPORTED_ATOMS,
+        *PropertyMap.keys(),
+        *(type for type, _ in PropertyMap.values()),
+        "UTF8_STRING",
+        "CLIPBOARD",
+        "MANAGER",
+        "QTILE_INTERNAL",
+        "WM_CHANGE_STATE",
+        "WM_CLIENT_MACHINE",
+        "WM_DELETE_WINDOW",
+        "WM_PROTOCOLS",
+        "WM_TAKE_FOCUS",
+        "WM_WINDOW_ROLE",
+        "_NET_CLOSE_WINDOW",
+        "_NET_WM_ICON",
+        "_NET_WM_WINDOW_OPACITY",
+        "_XEMBED",
+        "_XEMBED_INFO",
+        "_XROOTPMAP_ID",
+        "ESETROOT_PMAP_ID",
+    ]
+)
+
+
+def declare_atoms(*names):
+    """
+    Declare atoms to intern with the others when connecting to the X server, which
+    saves a round trip for each of them. This must be called before connecting.
+    """
+    declared_atoms.update(dict.fromkeys(names))
+
+
 XCB_CONN_ERRORS = {
     1: "XCB_CONN_ERROR",
     2: "XCB_CONN_CLOSED_EXT_NOTSUPPORTED",
@@ -287,14 +325,18 @@ class AtomCache:
         self.atoms = {}
         self.reverse = {}
 
-        # We can change the pre-loads not to wait for a return
-        for name in WindowTypes.keys():
-            self.insert(name=name)
-
         for i in dir(xcffib.xproto.Atom):
             if not i.startswith("_"):
                 self.insert(name=i, atom=getattr(xcffib.xproto.Atom, i))
 
+        start = time.perf_counter()
+        self.intern(declared_atoms)
+        logger.debug(
+            "Interned %d atoms in %.2fms",
+            len(declared_atoms),
+            (time.perf_counter() - start) * 1000,
+        )
+
     def insert(self, name=None, atom=None):
         assert name or atom
         if atom is None:
@@ -306,11 +348,26 @@ class AtomCache:
         self.atoms[name] = atom
         self.reverse[atom] = name
 
+    def intern(self, names):
+        """Intern the names that aren't cached yet, all in a single round trip"""
+        names = [name for name in dict.fromkeys(names) if name not in self.atoms]
+        cookies = [self.conn.conn.core.InternAtom(False, len(name), name) for name in names]
+        for name, cookie in zip(names, cookies):
+            self.insert(name=name, atom=cookie.reply().atom)
+
     def get_name(self, atom):
         if atom not in self.reverse:
             self.insert(atom=atom)
         return self.reverse[atom]
 
+    def get_names(self, atoms):
+        """Like get_name, but looks up all the unknown atoms in a single round trip"""
+        unknown = [atom for atom in dict.fromkeys(atoms) if atom not in self.reverse]
+        cookies = [self.conn.conn.core.GetAtomName(atom) for atom in unknown]
+        for atom, cookie in zip(unknown, cookies):
+            self.insert(name=cookie.reply().name.to_string(), atom=atom)
+        return [self.reverse[atom] for atom in atoms]
+
     def __getitem__(self, key):
         if key not in self.atoms:
             self.insert(name=key)
@@ -431,6 +488,18 @@ class ScreenSaver:
         self.conn.conn.flush()
 
 
+def mode_refresh_rate(mode) -> float | None:
+    """The refresh rate in Hz of a randr ModeInfo"""
+    if mode is None or not mode.htotal or not mode.vtotal:
+        return None
+    vtotal = mode.vtotal
+    if mode.mode_flags & xcffib.randr.ModeFlag.DoubleScan:
+        vtotal *= 2
+    if mode.mode_flags & xcffib.randr.ModeFlag.Interlace:
+        vtotal /= 2
+    return mode.dot_clock / (mode.htotal * vtotal)
+
+
 class RandR:
     def __init__(self, conn):
         self.ext = conn.conn(xcffib.randr.key)
@@ -439,7 +508,9 @@ class RandR:
     def query_crtcs(self, root: int) -> list[Output]:
         infos: list[Output] = []
         primary = self.ext.GetOutputPrimary(root).reply().output
-        for output in self.ext.GetScreenResources(root).reply().outputs:
+        resources = self.ext.GetScreenResources(root).reply()
+        modes = {mode.id: mode for mode in resources.modes}
+        for output in resources.outputs:
             info = self.ext.GetOutputInfo(output, xcffib.CurrentTime).reply()
 
             # ignore disconnected monitors
@@ -467,7 +538,8 @@ class RandR:
 
             port = bytes(info.name).decode() if info.name else None
             rect = ScreenRect(crtc_info.x, crtc_info.y, crtc_info.width, crtc_info.height)
-            out = Output(port, make, model, serial, rect)
+            refresh_rate = mode_refresh_rate(modes.get(crtc_info.mode))
+            out = Output(port, make, model, serial, rect, refresh_rate)
 
             # prepend the primary output, append all others in screen
             # resources order
@@ -498,6 +570,100 @@ class XFixes:
         self.conn.xfixes.ext.SelectSelectionInput(window.wid, _selection, self.selection_mask)
 
 
+class PixmapCache:
+    """
+    A least recently used cache of pixmaps on the server
+
+    The pixmaps that are evicted are freed, so that the pixmaps in the cache take up
+    at most limit bytes. The most recently added pixmap is always kept.
+    """
+
+    def __init__(self, conn, limit=16 * 1024 * 1024):
+        self.conn = conn
+        self.limit = limit
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        # key -> (pixmap, size in bytes)
+        self._pixmaps = OrderedDict()
+
+    def get(self, key):
+        entry = self._pixmaps.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._pixmaps.move_to_end(key)
+        return entry[0]
+
+    def add(self, key, pixmap, size):
+        self._pixmaps[key] = (pixmap, size)
+        self.size += size
+        while self.size > self.limit and len(self._pixmaps) > 1:
+            _, (old, old_size) = self._pixmaps.popitem(last=False)
+            self.conn.core.FreePixmap(old)
+            self.size -= old_size
+
+    def clear(self):
+        for pixmap, _ in self._pixmaps.values():
+            self.conn.core.FreePixmap(pixmap)
+        self._pixmaps.clear()
+        self.size = 0
+
+
+class StackingOrder:
+    """
+    The stacking order of the children of the root window, from bottom to top
+
+    It is updated from the stacking requests that qtile sends and from the events
+    about windows that it doesn't manage, so that it doesn't need to be queried
+    from the server.
+    """
+
+    def __init__(self):
+        self._wids = []
+
+    def __iter__(self):
+        return iter(self._wids)
+
+    def __len__(self):
+        return len(self._wids)
+
+    def __contains__(self, wid):
+        return wid in self._wids
+
+    def reset(self, wids):
+        self._wids = list(wids)
+
+    def add(self, wid):
+        """Add a new window, which is stacked on top of the others"""
+        if wid not in self._wids:
+            self._wids.append(wid)
+
+    def remove(self, wid):
+        with contextlib.suppress(ValueError):
+            self._wids.remove(wid)
+
+    def restack(self, wid, stackmode, sibling=None):
+        """Apply a ConfigureWindow stack mode, or a notification of one"""
+        if wid not in self._wids:
+            # Only the children of the root window are stacked here
+            return
+        if stackmode not in (xcffib.xproto.StackMode.Above, xcffib.xproto.StackMode.Below):
+            # TopIf, BottomIf and Opposite depend on which windows overlap
+            return
+        self.remove(wid)
+        above = stackmode == xcffib.xproto.StackMode.Above
+        if sibling is None or sibling not in self._wids:
+            if above:
+                self._wids.append(wid)
+            else:
+                self._wids.insert(0, wid)
+        else:
+            index = self._wids.index(sibling)
+            self._wids.insert(index + 1 if above else index, wid)
+
+
 class Connection:
     _extmap = {
         "xinerama": Xinerama,
@@ -529,6 +695,8 @@ class Connection:
         self.refresh_modmap()
 
         self._cmaps = {}
+        self.border_pixmaps = PixmapCache(self.conn)
+        self.stacking = StackingOrder()
 
     def colormap(self, desired_depth):
         if desired_depth in self._cmaps:
@@ -575,6 +743,7 @@ class Connection:
 
     def finalize(self):
         self.cursors.finalize()
+        self.border_pixmaps.clear()
         self.disconnect()
 
     def refresh_keymap(self, first=None, count=None):
@@ -652,6 +821,7 @@ class Connection:
             value_mask,
             values,
         )
+        self.stacking.add(wid)
         return window.XWindow(self, wid)
 
     def disconnect(self):
@@ -159,6 +159,13 @@ class Bar(Gap, configurable.Configurable, CommandObject):
             True,
             "Reserve screen space (when set to 'False', bar will be drawn above windows).",
         ),
+        (
+            "persistent_drawers",
+            False,
+            "Draw the bar and its widgets to surfaces that are kept between frames instead "
+            "of recording and replaying their drawing operations on each frame. This uses "
+            "more memory but less CPU, and lets mirrors paint from the same surface.",
+        ),
     ]
 
     def __init__(self, widgets: list[_Widget], size: int, **config: Any) -> None:
@@ -175,6 +182,15 @@ class Bar(Gap, configurable.Configurable, CommandObject):
         self._draw_queued = False
         self.future: asyncio.Handle | None = None
 
+        # Damage tracking: a full draw repaints the whole bar, otherwise only the
+        # widgets marked dirty and those moved by a change of length are repainted
+        self._full_draw = True
+        self._dirty: set[_Widget] = set()
+        # The bar length and widget lengths that the current layout was computed for,
+        # and the resulting offset and length of each widget
+        self._layout_key: tuple | None = None
+        self._widget_positions: list[tuple[int, int]] = []
+
         # The part of the margins that was reserved by clients
         self._reserved_space: list[int] = [0, 0, 0, 0]  # [N, E, S, W]
         self._reserved_space_updated = False
@@ -291,7 +307,9 @@ class Bar(Gap, configurable.Configurable, CommandObject):
             self.drawer.width = width
             self.drawer.height = height
         else:
-            self.drawer = self.window.create_drawer(width, height)
+            self.drawer = self.window.create_drawer(
+                width, height, persistent=self.persistent_drawers
+            )
         self.drawer.clear(self.background)
 
         crashed_widgets: set[_Widget] = set()
@@ -628,6 +646,19 @@ class Bar(Gap, configurable.Configurable, CommandObject):
         self._has_keyboard = None
 
     def draw(self) -> None:
+        """Redraw the whole bar"""
+        self._full_draw = True
+        self._queue_draw()
+
+    def draw_widget(self, widget: _Widget) -> None:
+        """
+        Redraw a single widget. If its length has changed, the widgets that it
+        moves are redrawn too.
+        """
+        self._dirty.add(widget)
+        self._queue_draw()
+
+    def _queue_draw(self) -> None:
         assert self.qtile is not None
 
         if not self.widgets:
@@ -638,9 +669,70 @@ class Bar(Gap, configurable.Configurable, CommandObject):
             self.future = self.qtile.call_soon(self._actual_draw)
             self._draw_queued = True
 
+    def _layout(self) -> int | None:
+        """
+        Lay out the widgets if the bar or a widget has changed length since the
+        last layout. Returns the index of the first widget that was moved or
+        resized, or None if none were.
+        """
+        # The length of stretch widgets is an output of the layout, but a widget
+        # switching to or from stretch changes it
+        lengths = tuple(
+            (w.length_type, 0 if w.length_type == STRETCH else w.length) for w in self.widgets
+        )
+        key = (self.length, tuple(map(id, self.widgets)), lengths)
+        if key == self._layout_key:
+            return None
+        previous = self._layout_key, self._widget_positions
+        self._layout_key = key
+
+        self._resize(self.length, self.widgets)
+
+        if self.horizontal:
+            offsets = [w.offsetx for w in self.widgets]
+        else:
+            offsets = [w.offsety for w in self.widgets]
+        # Stretch widgets are only given their length by the layout
+        self._widget_positions = [
+            (offset, w.length if length_type == STRETCH else length)
+            for offset, (length_type, length), w in zip(offsets, lengths, self.widgets)
+        ]
+
+        old_key, old_positions = previous
+        if old_key is None or old_key[:2] != key[:2]:
+            return 0
+        for index, (old, new) in enumerate(zip(old_positions, self._widget_positions)):
+            if old != new:
+                return index
+        return None
+
     def _actual_draw(self) -> None:
         self._draw_queued = False
-        self._resize(self.length, self.widgets)
+        full_draw = self._full_draw
+        dirty = self._dirty
+        self._full_draw = False
+        self._dirty = set()
+
+        moved = self._layout()
+        if full_draw:
+            self._draw_border()
+            widgets = self.widgets
+        elif moved is None:
+            widgets = [w for w in self.widgets if w in dirty]
+        else:
+            # Everything after the first change has moved and must be repainted
+            widgets = [w for w in self.widgets[:moved] if w in dirty] + self.widgets[moved:]
+
+        for i in widgets:
+            try:
+                i.draw()
+            except Exception:
+                logger.exception("Widget failed to draw")
+
+        if full_draw or moved is not None:
+            self._fill_unoccupied()
+
+    def _draw_border(self) -> None:
         # We draw the border before the widgets
         if any(self.border_width):
             # The border is drawn "outside" of the bar (i.e. not in the space that the
@@ -688,12 +780,7 @@ class Bar(Gap, configurable.Configurable, CommandObject):
                     src_y=src_y,
                 )
 
-        for i in self.widgets:
-            try:
-                i.draw()
-            except Exception:
-                logger.exception("Widget failed to draw")
-
+    def _fill_unoccupied(self) -> None:
         # We need to check if there is any unoccupied space in the bar
         # This can happen where there are no SPACER-type widgets to fill
         # empty space.
@@ -703,12 +790,13 @@ class Bar(Gap, configurable.Configurable, CommandObject):
 
         # Widgets are offset by the top/left border but this is not included in self.length
         # so we adjust the end of the bar area for this offset
+        last = self.widgets[-1]
         if self.horizontal:
             bar_end = self.length + self.border_width[3]
-            widget_end = i.offsetx + i.length
+            widget_end = last.offsetx + last.length
         else:
             bar_end = self.length + self.border_width[0]
-            widget_end = i.offsety + i.length
+            widget_end = last.offsety + last.length
 
         if widget_end < bar_end:
             # Defines a rectangle for the area enclosed by the bar's borders and the end of the
@@ -9,13 +9,15 @@ import asyncio
 import inspect
 import sys
 import traceback
-from collections.abc import Callable
+from collections.abc import Callable, Collection
 
 from libqtile.command.graph import SelectorType
 from libqtile.log_utils import logger
 from libqtile.utils import create_task
 
-ItemT = tuple[bool, list[str | int]] | None
+# The items can be any collection, e.g. dict keys or a range, which allows
+# select() to check that an item exists without building a list of all of them
+ItemT = tuple[bool, Collection[str | int]] | None
 
 
 def allow_when_locked(func: Callable) -> Callable:
@@ -98,24 +100,29 @@ class CommandObject(metaclass=abc.ABCMeta):
     (c.f. docstring for `.items()` and `.select()`).
     """
 
+    _commands: dict[str, Callable]
+    _command_names: list[str]
+
     def __new__(cls, *args, **kwargs):
-        # Check which level of command object has been parsed
-        # This test ensures inherited classes don't stop additional
-        # methods from being exposed.
-        # For example, if widget.TextBox has already been parsed, a subsequent
-        # call to initialise a new TextBox will return here. However, if a user
-        # subclasses TextBox for a new widget then that new widget will still
-        # be parsed here to check for new commands.
-        if getattr(cls, "_command_object", "") == cls.__name__:
-            super().__new__(cls)
+        # The table of exposed commands is built once per class, the first
+        # time an instance is created, and stored on the class itself. Checking
+        # the class's own __dict__ ensures inherited classes don't stop
+        # additional methods from being exposed: if widget.TextBox has already
+        # been parsed, a subsequent TextBox is created straight away, but a
+        # user subclass of TextBox gets parsed to check for new commands.
+        if "_commands" not in cls.__dict__:
+            cls._build_commands()
+        return super().__new__(cls)
 
+    @classmethod
+    def _build_commands(cls) -> None:
+        """Collect the exposed commands of the class and its bases"""
         commands = {}
-        cmd_s = set()
 
         # We need to iterate over the class's inherited classes in reverse order
         # We reverse the order so the exposed command will always be the latest
         # definition of the method.
-        for c in reversed(list(cls.__mro__)):
+        for c in reversed(cls.__mro__):
             for method_name in list(c.__dict__.keys()):
                 method = getattr(c, method_name, None)
 
@@ -133,23 +140,9 @@ class CommandObject(metaclass=abc.ABCMeta):
                     setattr(cls, mapping, method)
                     commands[mapping] = method
 
-        if cmd_s:
-            names = ", ".join(cmd_s)
-            msg = (
-                f"The use of the 'cmd_' prefix to expose commands via IPC "
-                f"is deprecated. Methods should use the "
-                f"@expose_command() decorator instead. "
-                f"Please update: {names}"
-            )
-            logger.warning("Deprecation Warning: %s", msg)
-
-        # Record the object as being parsed.
-        cls._command_object = cls.__name__
-
-        # Store list of exposed commands
+        # Store the exposed commands, and their sorted names for commands()
         cls._commands = commands
-
-        return super().__new__(cls)
+        cls._command_names = sorted(commands)
 
     def select(self, selectors: list[SelectorType]) -> CommandObject:
         """Return a selected object
@@ -161,7 +154,8 @@ class CommandObject(metaclass=abc.ABCMeta):
         """
         obj: CommandObject = self
         for name, selector in selectors:
-            root, items = obj.items(name)
+            ret = obj._items(name)
+            root, items = (False, None) if ret is None else ret
             # if non-root object and no selector given
             if root is False and selector is None:
                 raise SelectError("", name, selectors)
@@ -198,7 +192,8 @@ class CommandObject(metaclass=abc.ABCMeta):
             # Not finding information for a particular item class is OK here;
             # we don't expect layouts to have a window, etc.
             return False, None
-        return ret
+        root, items = ret
+        return root, list(items)
 
     @abc.abstractmethod
     def _items(self, name) -> ItemT:
@@ -240,7 +235,7 @@ class CommandObject(metaclass=abc.ABCMeta):
 
         Used by __qsh__ for command completion and online help
         """
-        return sorted([cmd for cmd in self._commands])
+        return list(self._command_names)
 
     @expose_command()
     def doc(self, name) -> str:
@@ -248,9 +243,8 @@ class CommandObject(metaclass=abc.ABCMeta):
 
         Used by __qsh__ to provide online help.
         """
-        if name in self.commands():
-            command = self.command(name)
-            assert command
+        command = self.command(name)
+        if command is not None:
             signature = self._get_command_signature(command)
             spec = name + signature
             htext = inspect.getdoc(command) or ""
@@ -11,7 +11,7 @@ from __future__ import annotations
 
 from typing import Any
 
-from libqtile.command.base import SelectError
+from libqtile.command.base import CommandError, SelectError
 from libqtile.command.graph import (
     CommandGraphCall,
     CommandGraphNode,
@@ -20,7 +20,11 @@ from libqtile.command.graph import (
     GraphType,
     SelectorType,
 )
-from libqtile.command.interface import CommandInterface, IPCCommandInterface
+from libqtile.command.interface import (
+    BatchCommandInterface,
+    CommandInterface,
+    IPCCommandInterface,
+)
 from libqtile.ipc import Client, find_sockfile
 
 
@@ -99,7 +103,7 @@ class CommandClient:
         -------
         The output returned from the function call.
         """
-        if name not in self.commands:
+        if not self._command.has_command(self._current_node, name):
             raise SelectError("Not valid child or command", name, self._current_node.selectors)
 
         call = self._current_node.call(name, lifted=lifted)
@@ -138,6 +142,26 @@ class CommandClient:
             raise SelectError("", "", self._current_node.selectors)
         return self.__class__(self._command, current_node=self._current_node.parent)
 
+    def batch(self) -> CommandClient:
+        """Get a client which collects calls until `send_batch` is called
+
+        Calls made on the returned client return the index of their result in
+        the list returned by `send_batch`. Navigation and commands are only
+        checked once the batch is sent.
+        """
+        return self.__class__(
+            BatchCommandInterface(self._command), current_node=self._current_node
+        )
+
+    def send_batch(self, stop_on_error: bool = False) -> list[Any]:
+        """Send the calls collected by a client returned by `batch`
+
+        Failed calls have their ``CommandError`` or ``CommandException`` in
+        place of a result. If stop_on_error is set, the results end at the
+        first call that failed.
+        """
+        return _send_batch(self._command, stop_on_error)
+
 
 class InteractiveCommandClient:
     """
@@ -259,6 +283,26 @@ class InteractiveCommandClient:
         next_node = self._current_node.parent.navigate(self._current_node.object_type, name)
         return self.__class__(self._command, current_node=next_node)
 
+    def batch(self) -> InteractiveCommandClient:
+        """Get a client which collects calls until `send_batch` is called
+
+        Calls made on the returned client return the index of their result in
+        the list returned by `send_batch`. Navigation and commands are only
+        checked once the batch is sent.
+        """
+        return self.__class__(
+            BatchCommandInterface(self._command), current_node=self._current_node
+        )
+
+    def send_batch(self, stop_on_error: bool = False) -> list[Any]:
+        """Send the calls collected by a client returned by `batch`
+
+        Failed calls have their ``CommandError`` or ``CommandException`` in
+        place of a result. If stop_on_error is set, the results end at the
+        first call that failed.
+        """
+        return _send_batch(self._command, stop_on_error)
+
     def normalize_item(self, item: str) -> str | int:
         "Normalize the item according to Qtile._items()."
         object_type = (
@@ -269,6 +313,12 @@ class InteractiveCommandClient:
         return _normalize_item(object_type, item)
 
 
+def _send_batch(command: CommandInterface, stop_on_error: bool) -> list[Any]:
+    if not isinstance(command, BatchCommandInterface):
+        raise CommandError("Client is not collecting a batch, use batch() to start one")
+    return command.send(stop_on_error=stop_on_error)
+
+
 def _normalize_item(object_type: str | None, item: str) -> str | int:
     if object_type in ["group", "widget", "bar"]:
         return str(item)
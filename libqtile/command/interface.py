@@ -6,18 +6,25 @@ import traceback
 import types
 import typing
 from abc import ABCMeta, abstractmethod
+from collections.abc import Hashable, Iterator
 from typing import Any, Literal, Union, get_args, get_origin
 
 from libqtile import hook, ipc
 from libqtile.command.base import CommandError, CommandException, CommandObject, SelectError
 from libqtile.command.graph import CommandGraphCall, CommandGraphNode, SelectorType
 from libqtile.log_utils import logger
+from libqtile.profiling import profiler
 from libqtile.utils import ColorsType, ColorType  # noqa: F401
 
 SUCCESS = 0
 ERROR = 1
 EXCEPTION = 2
 
+# request type of a batch of calls sent to the IPCCommandServer
+BATCH = "batch"
+
+CallType = tuple[CommandGraphCall, tuple, dict]
+
 
 # these two mask their aliases from elsewhere in the tree (i.e.
 # libqtile.extension.base._Extension, and libqtile.layout.base.Layout
@@ -70,6 +77,31 @@ class CommandInterface(metaclass=ABCMeta):
             The keyword arguments to pass into the command graph call.
         """
 
+    def execute_batch(self, calls: list[CallType], stop_on_error: bool = False) -> list[Any]:
+        """Execute all the given calls in order, returning the list of results
+
+        Calls that fail do not raise, the ``CommandError`` or
+        ``CommandException`` is returned in place of their result instead.
+
+        Parameters
+        ----------
+        calls: list[tuple[CommandGraphCall, tuple, dict]]
+            The calls to perform, together with their arguments and keyword
+            arguments.
+        stop_on_error: bool
+            If True, stop at the first call that fails. The returned list then
+            ends with the error of that call.
+        """
+        results: list[Any] = []
+        for call, args, kwargs in calls:
+            try:
+                results.append(self.execute(call, args, kwargs))
+            except (CommandError, CommandException) as err:
+                results.append(err)
+                if stop_on_error:
+                    break
+        return results
+
     @abstractmethod
     def has_command(self, node: CommandGraphNode, command: str) -> bool:
         """Check if the given command exists
@@ -207,12 +239,12 @@ class QtileCommandInterface(CommandInterface):
 class IPCCommandInterface(CommandInterface):
     """Execute the resolved commands using the IPC connection to a running qtile instance"""
 
-    def __init__(self, ipc_client: ipc.Client):
+    def __init__(self, ipc_client: ipc.Client | ipc.PersistentClient):
         """Build a command object which resolves commands through IPC calls
 
         Parameters
         ----------
-        ipc_client: ipc.Client
+        ipc_client: ipc.Client | ipc.PersistentClient
             The client that is to be used to resolve the calls.
         """
         self._client = ipc_client
@@ -241,6 +273,84 @@ class IPCCommandInterface(CommandInterface):
             raise CommandError(result)
         raise CommandException(result)
 
+    def execute_batch(self, calls: list[CallType], stop_on_error: bool = False) -> list[Any]:
+        """Execute all the given calls in order, returning the list of results
+
+        The calls are sent to the server as a single batch request, which is
+        evaluated in one go on the server side.
+
+        Parameters
+        ----------
+        calls: list[tuple[CommandGraphCall, tuple, dict]]
+            The calls to perform, together with their arguments and keyword
+            arguments.
+        stop_on_error: bool
+            If True, stop at the first call that fails. The returned list then
+            ends with the error of that call.
+        """
+        status, replies = self._client.send(
+            {
+                "type": BATCH,
+                "calls": [
+                    (call.parent.selectors, call.name, args, kwargs, call.lifted)
+                    for call, args, kwargs in calls
+                ],
+                "stop_on_error": stop_on_error,
+            }
+        )
+        if status != SUCCESS:
+            raise CommandError(replies)
+
+        results: list[Any] = []
+        for status, result in replies:
+            if status == SUCCESS:
+                results.append(result)
+            elif status == ERROR:
+                results.append(CommandError(result))
+            else:
+                results.append(CommandException(result))
+        return results
+
+    def subscribe(
+        self,
+        hooks: list[str],
+        *,
+        maxsize: int = 256,
+        policy: str = ipc.DROP_OLDEST,
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate over the events of the given hooks as they are fired
+
+        Each event is a dict holding the ``hook`` name, its serialized
+        ``args`` and the number of events ``dropped`` by the server since the
+        previous event because the client was not reading them fast enough.
+        This needs the interface to use an ``ipc.PersistentClient``, which
+        cannot be used for anything else while iterating.
+
+        Parameters
+        ----------
+        hooks: list[str]
+            The names of the hooks from ``libqtile.hook`` to subscribe to.
+        maxsize: int
+            The number of events the server buffers for this client.
+        policy: str
+            What the server does with new events when the buffer is full, one
+            of ``ipc.STREAM_POLICIES``. With ``ipc.COALESCE``, a buffered event
+            is replaced by a new one of the same hook and for the same object.
+        """
+        if not isinstance(self._client, ipc.PersistentClient):
+            raise CommandError("Subscribing to hooks needs an ipc.PersistentClient")
+
+        frames = self._client.subscribe(
+            {"type": ipc.SUBSCRIBE, "hooks": hooks, "maxsize": maxsize, "policy": policy}
+        )
+        status, result = next(frames)
+        if status != SUCCESS:
+            frames.close()
+            raise CommandError(result)
+
+        for frame in frames:
+            yield {**frame["event"], "dropped": frame["dropped"]}
+
     def has_command(self, node: CommandGraphNode, command: str) -> bool:
         """Check if the given command exists
 
@@ -289,6 +399,56 @@ class IPCCommandInterface(CommandInterface):
         return items is not None and item in items
 
 
+class BatchCommandInterface(CommandInterface):
+    """Collect the calls made through it and execute them together
+
+    Commands and items are not checked when navigating the command graph, the
+    whole batch is resolved when it is sent.
+    """
+
+    def __init__(self, command: CommandInterface):
+        """Build a command interface which batches its calls
+
+        Parameters
+        ----------
+        command: CommandInterface
+            The interface that is used to execute the batch once sent.
+        """
+        self._command = command
+        self._calls: list[CallType] = []
+
+    def execute(self, call: CommandGraphCall, args: tuple, kwargs: dict) -> int:
+        """Add the call to the batch, returning its index in the results"""
+        self._calls.append((call, args, kwargs))
+        return len(self._calls) - 1
+
+    def has_command(self, node: CommandGraphNode, command: str) -> bool:
+        """Commands are resolved when the batch is sent"""
+        return True
+
+    def has_item(self, node: CommandGraphNode, object_type: str, item: str | int) -> bool:
+        """Items are resolved when the batch is sent"""
+        return True
+
+    def send(self, stop_on_error: bool = False) -> list[Any]:
+        """Execute the collected calls and start a new batch
+
+        Parameters
+        ----------
+        stop_on_error: bool
+            If True, stop at the first call that fails.
+
+        Returns
+        -------
+        list[Any]
+            The results of the calls, in the order they were made. Failed
+            calls have their ``CommandError`` or ``CommandException`` in
+            place of a result.
+        """
+        calls, self._calls = self._calls, []
+        return self._command.execute_batch(calls, stop_on_error=stop_on_error)
+
+
 def lift_args(cmd, args, kwargs):
     """
     Lift args lifts the arguments to the type annotations on cmd's parameters.
@@ -382,6 +542,27 @@ def lift_args(cmd, args, kwargs):
     return tuple(converted_args), converted_kwargs
 
 
+def _serialize_hook_arg(arg: Any) -> Any:
+    """Convert a hook argument to something that can be sent over IPC
+
+    Objects like windows, groups or screens are replaced by their type and the
+    attributes identifying them.
+    """
+    if arg is None or isinstance(arg, bool | int | float | str):
+        return arg
+    if isinstance(arg, list | tuple | set):
+        return [_serialize_hook_arg(item) for item in arg]
+    if isinstance(arg, dict):
+        return {str(key): _serialize_hook_arg(value) for key, value in arg.items()}
+
+    serialized: dict[str, Any] = {"type": type(arg).__name__}
+    for attr in ("wid", "name", "index"):
+        value = getattr(arg, attr, None)
+        if isinstance(value, int | str):
+            serialized[attr] = value
+    return serialized
+
+
 class IPCCommandServer:
     """Execute the object commands for the calls that are sent to it"""
 
@@ -395,9 +576,88 @@ class IPCCommandServer:
 
     def call(
         self,
-        data: tuple[list[SelectorType], str, tuple, dict, bool],
+        data: tuple[list[SelectorType], str, tuple, dict, bool] | dict[str, Any],
     ) -> tuple[int, Any]:
         """Receive and parse the given data"""
+        if isinstance(data, dict):
+            if data.get("type") == BATCH:
+                return self.call_batch(data["calls"], data.get("stop_on_error", False))
+            if data.get("type") == ipc.SUBSCRIBE:
+                return ERROR, "Subscribing to hooks needs a framed connection"
+            return ERROR, f"Unknown request type: {data.get('type')}"
+        return self._call(data)
+
+    def subscribe(self, data: dict[str, Any], stream: ipc.EventStream) -> tuple[int, Any]:
+        """Push the events of the requested hooks to the given stream
+
+        The subscription lasts until the stream is closed, i.e. until the
+        client closes its connection.
+        """
+        hooks = data.get("hooks")
+        if not hooks or not isinstance(hooks, list):
+            return ERROR, "No hooks to subscribe to"
+        unknown = [name for name in hooks if name not in hook.subscribe.hooks]
+        if unknown:
+            return ERROR, f"Unknown hooks: {', '.join(map(str, unknown))}"
+
+        policy = data.get("policy", stream.policy)
+        if policy not in ipc.STREAM_POLICIES:
+            return ERROR, f"Unknown policy: {policy}"
+        maxsize = data.get("maxsize", stream.maxsize)
+        if not isinstance(maxsize, int) or maxsize < 1:
+            return ERROR, f"Invalid buffer size: {maxsize}"
+        stream.policy = policy
+        stream.maxsize = maxsize
+
+        def push(name: str, *args: Any) -> None:
+            event = {"hook": name, "args": [_serialize_hook_arg(arg) for arg in args]}
+            # coalesce events of the same hook about the same object
+            key: Hashable = name
+            if args:
+                first = args[0]
+                if hasattr(first, "wid"):
+                    key = (name, first.wid)
+                elif isinstance(first, int | str):
+                    key = (name, first)
+                else:
+                    key = (name, id(first))
+            stream.push(event, key=key)
+
+        def unsubscribe() -> None:
+            for name in hooks:
+                hook.qtile_hooks.unobserve(name, push)
+
+        for name in hooks:
+            hook.qtile_hooks.observe(name, push)
+        stream.add_close_callback(unsubscribe)
+        logger.debug("Event stream subscribed to hooks: %s", hooks)
+        return SUCCESS, hooks
+
+    def call_batch(
+        self,
+        calls: list[tuple[list[SelectorType], str, tuple, dict, bool]],
+        stop_on_error: bool = False,
+    ) -> tuple[int, list[tuple[int, Any]]]:
+        """Run each of the given calls in order and return all their replies
+
+        If stop_on_error is set, no further call is run after the first one
+        that does not succeed.
+        """
+        replies = []
+        for data in calls:
+            try:
+                reply = self._call(data)
+            except Exception:
+                reply = EXCEPTION, traceback.format_exc().strip().split("\n")[-1]
+            replies.append(reply)
+            if stop_on_error and reply[0] != SUCCESS:
+                break
+        return SUCCESS, replies
+
+    def _call(
+        self,
+        data: tuple[list[SelectorType], str, tuple, dict, bool],
+    ) -> tuple[int, Any]:
         selectors, name, args, kwargs, lifted = data
         try:
             obj = self.qtile.select(selectors)
@@ -415,12 +675,15 @@ class IPCCommandServer:
 
         # Check if method is bound, if itis, insert magic self
         if not hasattr(cmd, "__self__"):
-            args = (obj,) + args
+            # json clients send the args as a list
+            args = (obj,) + tuple(args)
 
         if self.qtile.locked and not getattr(cmd, "_allow_when_locked", False):
             return ERROR, f"{name} cannot be called when session is locked."
 
         try:
+            if profiler.enabled:
+                return SUCCESS, profiler.call("command", name, cmd, *args, **kwargs)
             return SUCCESS, cmd(*args, **kwargs)
         except CommandError as err:
             return ERROR, err.args[0]
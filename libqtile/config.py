@@ -378,6 +378,8 @@ class Output:
     # Do not consider geometry when comparing outputs: we want to know if the
     # underlying physical hardware is the same, the geometry doesn't matter.
     rect: ScreenRect = field(compare=False)
+    # The refresh rate in Hz, if the backend knows it
+    refresh_rate: float | None = field(default=None, compare=False)
 
 
 class Screen(CommandObject):
@@ -402,12 +404,12 @@ class Screen(CommandObject):
     drawn, so you can set the background color for an image by setting
     background here.
 
-    The ``x11_drag_polling_rate`` parameter specifies the rate for drag events
-    in the X11 backend. By default this is set to None, indicating no limit.
-    Because in the X11 backend we already handle motion notify events later,
-    the performance should already be okay. However, to limit these events
-    further you can use this variable and e.g. set it to your monitor refresh
-    rate. 60 would mean that we handle a drag event 60 times per second.
+    The ``x11_drag_polling_rate`` parameter specifies the rate for drag events.
+    Pointer motion during a drag is coalesced so that only the newest position
+    is applied, at most once per frame. By default (None) the refresh rate of the
+    screen's output is used, or 60 if the backend can't tell. Set this to force
+    a different rate: 60 would mean that we handle a drag event 60 times per
+    second. Despite its name, this is used by both backends.
     """
 
     group: _Group
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING
+
+from libqtile.backend import base
+from libqtile.command import interface
+from libqtile.command.base import CommandError, SelectError
+from libqtile.log_utils import logger
+
+if TYPE_CHECKING:
+    import asyncio
+    from collections.abc import Callable, Sequence
+    from typing import Any
+
+    from libqtile.config import Screen
+    from libqtile.core.manager import Qtile
+    from libqtile.lazy import LazyCall
+
+# Used when neither the screen nor its output tell us how often to update
+DEFAULT_DRAG_RATE = 60.0
+
+
+def drag_rate(screen: Screen) -> float:
+    """The number of drag updates per second to apply on the given screen"""
+    if screen.x11_drag_polling_rate:
+        return float(screen.x11_drag_polling_rate)
+    if screen.output.refresh_rate:
+        return screen.output.refresh_rate
+    return DEFAULT_DRAG_RATE
+
+
+class DragEngine:
+    """Apply the commands of a Drag as the pointer moves
+
+    Pointer motion is not applied as it arrives: only the newest position is
+    kept and it is applied at most once per frame of the screen being dragged
+    on, so a high polling rate mouse can't make us move or resize a window more
+    often than it can be drawn. The commands are resolved when the drag starts
+    and are then called directly rather than through the command server.
+    """
+
+    def __init__(
+        self,
+        qtile: Qtile,
+        x: int,
+        y: int,
+        rx: int,
+        ry: int,
+        commands: Sequence[LazyCall],
+        rate: float,
+    ) -> None:
+        self.qtile = qtile
+        self.origin = (x, y)
+        self.reference = (rx, ry)
+        self.interval = 1 / rate
+        self.calls = [(i, self._resolve(i)) for i in commands]
+        self._pending: tuple[int, int] | None = None
+        self._handle: asyncio.Handle | None = None
+        self._last_apply = 0.0
+        self.applied = 0
+        self.coalesced = 0
+
+    def _resolve(self, call: LazyCall) -> tuple[Any, Callable] | None:
+        try:
+            obj = self.qtile.select(call.selectors)
+            cmd = obj.command(call.name)
+        except SelectError:
+            return None
+        if cmd is None:
+            return None
+        return obj, cmd
+
+    def motion(self, x: int, y: int) -> None:
+        """Record a new pointer position, to be applied on the next frame"""
+        if self._pending is not None:
+            self.coalesced += 1
+        self._pending = (x, y)
+        if self._handle is not None:
+            return
+        delay = self._last_apply + self.interval - time.monotonic()
+        if delay > 0:
+            self._handle = self.qtile.call_later(delay, self.flush)
+        else:
+            self._handle = self.qtile.call_soon(self.flush)
+
+    def flush(self) -> None:
+        """Apply the newest pending position, if any"""
+        self._handle = None
+        if self._pending is None:
+            return
+        x, y = self._pending
+        self._pending = None
+        self._last_apply = time.monotonic()
+        self.apply(x, y)
+
+    def stop(self) -> None:
+        """Apply the last position right away and stop handling motion"""
+        if self._handle is not None:
+            self._handle.cancel()
+        self.flush()
+
+    def apply(self, x: int, y: int) -> None:
+        ox, oy = self.origin
+        dx = x - ox
+        dy = y - oy
+        if not (dx or dy):
+            return
+        self.applied += 1
+        rx, ry = self.reference
+        for call, resolved in self.calls:
+            if not call.check(self.qtile):
+                continue
+            args = call.args + (rx + dx, ry + dy)
+            if resolved is None or not self._alive(resolved[0]):
+                # The command could not be resolved up front (or its target has
+                # gone away), so let the command server report what's wrong
+                status, val = self.qtile.server.call(
+                    (call.selectors, call.name, args, call.kwargs, False)
+                )
+                if status in (interface.ERROR, interface.EXCEPTION):
+                    logger.error("Mouse command error %s: %s", call.name, val)
+                continue
+            obj, cmd = resolved
+            if self.qtile.locked and not getattr(cmd, "_allow_when_locked", False):
+                continue
+            if not hasattr(cmd, "__self__"):
+                args = (obj,) + args
+            try:
+                cmd(*args, **call.kwargs)
+            except CommandError as err:
+                logger.error("Mouse command error %s: %s", call.name, err.args[0])
+            except Exception:
+                logger.exception("Mouse command error %s:", call.name)
+
+    def _alive(self, obj: Any) -> bool:
+        if isinstance(obj, base.Window | base.Internal | base.Static):
+            return obj.wid in self.qtile.windows_map
+        return True
@@ -46,6 +46,7 @@ from libqtile.config import (
 )
 from libqtile.config import ScratchPad as ScratchPadConfig
 from libqtile.confreader import Config
+from libqtile.core.drag import DragEngine, drag_rate
 from libqtile.core.lifecycle import lifecycle
 from libqtile.core.loop import LoopContext
 from libqtile.core.state import QtileState
@@ -55,6 +56,7 @@ from libqtile.group import _Group
 from libqtile.interactive.repl import repl_server
 from libqtile.layout.base import Layout
 from libqtile.log_utils import logger
+from libqtile.profiling import handler_name, profiler
 from libqtile.resources.sleep import inhibitor
 from libqtile.scratchpad import ScratchPad
 from libqtile.scripts.main import VERSION
@@ -69,6 +71,53 @@ from libqtile.utils import (
 from libqtile.widget.base import _Widget
 
 
+class _WindowsMap(dict[int, base.WindowType]):
+    """The windows known to qtile, keyed by their wid
+
+    Alongside the windows, this keeps an index of the ones that can be
+    addressed through the command graph (i.e. not widgets like the systray),
+    so that selecting a window never needs to scan all of them. The index is
+    updated on every change, wherever the windows are added or removed.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.addressable: dict[int, base.WindowType] = {}
+
+    def __setitem__(self, wid: int, win: base.WindowType) -> None:
+        super().__setitem__(wid, win)
+        if isinstance(win, CommandObject) and not isinstance(win, _Widget):
+            self.addressable[wid] = win
+        else:
+            self.addressable.pop(wid, None)
+
+    def __delitem__(self, wid: int) -> None:
+        super().__delitem__(wid)
+        self.addressable.pop(wid, None)
+
+    def pop(self, wid: int, *default: Any) -> Any:
+        self.addressable.pop(wid, None)
+        return super().pop(wid, *default)
+
+    def popitem(self) -> tuple[int, base.WindowType]:
+        wid, win = super().popitem()
+        self.addressable.pop(wid, None)
+        return wid, win
+
+    def setdefault(self, wid: int, win: base.WindowType) -> base.WindowType:
+        if wid not in self:
+            self[wid] = win
+        return self[wid]
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        for wid, win in dict(*args, **kwargs).items():
+            self[wid] = win
+
+    def clear(self) -> None:
+        super().clear()
+        self.addressable.clear()
+
+
 class Qtile(CommandObject):
     """This object is the `root` of the command graph"""
 
@@ -90,10 +139,10 @@ class Qtile(CommandObject):
         self._state: QtileState | str | None = state
         self.socket_path = socket_path
 
-        self._drag: tuple | None = None
+        self._drag: DragEngine | None = None
         self._mouse_map: defaultdict[int, list[Mouse]] = defaultdict(list)
 
-        self.windows_map: dict[int, base.WindowType] = {}
+        self.windows_map: _WindowsMap = _WindowsMap()
         self.widgets_map: dict[str, _Widget] = {}
         self.renamed_widgets: list[str]
         self.groups_map: dict[str, _Group] = {}
@@ -255,6 +304,7 @@ class Qtile(CommandObject):
                 ipc.Server(
                     self._prepare_socket_path(self.socket_path),
                     self.server.call,
+                    self.server.subscribe,
                 ),
             ):
                 await self._stopped_event.wait()
@@ -408,12 +458,13 @@ class Qtile(CommandObject):
 
         # Alias screens with the same x and y coordinates, taking largest
         xywh: dict[
-            tuple[int, int], tuple[int, int, str | None, str | None, str | None, str | None]
+            tuple[int, int],
+            tuple[int, int, str | None, str | None, str | None, str | None, float | None],
         ] = {}
         for info in self.core.get_output_info():
             pos = (info.rect.x, info.rect.y)
-            width, height, port, make, model, serial = xywh.get(
-                pos, (0, 0, info.port, info.make, info.model, info.serial)
+            width, height, port, make, model, serial, refresh_rate = xywh.get(
+                pos, (0, 0, info.port, info.make, info.model, info.serial, info.refresh_rate)
             )
             # if one monitor is wider and one monitor is longer, either
             # serial number was valid (i.e. we could choose either, since
@@ -425,11 +476,13 @@ class Qtile(CommandObject):
                 info.make,
                 info.model,
                 info.serial,
+                # a drag shouldn't outpace the fastest of the aliased outputs
+                max(filter(None, (refresh_rate, info.refresh_rate)), default=None),
             )
 
         return [
-            Output(port, make, model, serial, ScreenRect(x, y, w, h))
-            for (x, y), (w, h, port, make, model, serial) in xywh.items()
+            Output(port, make, model, serial, ScreenRect(x, y, w, h), refresh_rate)
+            for (x, y), (w, h, port, make, model, serial, refresh_rate) in xywh.items()
         ]
 
     def get_screens_from_config(self, output_info: list[Output]) -> list[Screen]:
@@ -940,7 +993,9 @@ class Qtile(CommandObject):
                     y = win_size[1] + win_pos[1]
                     self.core.warp_pointer(x, y)
 
-                self._drag = (x, y, val[0], val[1], m.commands)
+                self._drag = DragEngine(
+                    self, x, y, val[0], val[1], m.commands, drag_rate(self.current_screen)
+                )
                 self.core.grab_pointer()
                 handled = True
 
@@ -950,25 +1005,15 @@ class Qtile(CommandObject):
         if self._drag is not None:
             for m in self._mouse_map[button_code]:
                 if isinstance(m, Drag):
+                    self._drag.stop()
                     self._drag = None
                     self.core.ungrab_pointer()
                     return True
         return False
 
     def process_button_motion(self, x: int, y: int) -> None:
-        if self._drag is None:
-            return
-        ox, oy, rx, ry, cmd = self._drag
-        dx = x - ox
-        dy = y - oy
-        if dx or dy:
-            for i in cmd:
-                if i.check(self):
-                    status, val = self.server.call(
-                        (i.selectors, i.name, i.args + (rx + dx, ry + dy), i.kwargs, False)
-                    )
-                    if status in (interface.ERROR, interface.EXCEPTION):
-                        logger.error("Mouse command error %s: %s", i.name, val)
+        if self._drag is not None:
+            self._drag.motion(x, y)
 
     def warp_to_screen(self) -> None:
         if self.current_screen:
@@ -998,23 +1043,17 @@ class Qtile(CommandObject):
 
     def _items(self, name: str) -> ItemT:
         if name == "group":
-            return True, list(self.groups_map.keys())
+            return True, self.groups_map.keys()
         elif name == "layout":
-            return True, list(range(len(self.current_group.layouts)))
+            return True, range(len(self.current_group.layouts))
         elif name == "widget":
-            return False, list(self.widgets_map.keys())
+            return False, self.widgets_map.keys()
         elif name == "bar":
             return False, [x.position for x in self.current_screen.gaps if isinstance(x, bar.Bar)]
         elif name == "window":
-            windows: list[str | int]
-            windows = [
-                k
-                for k, v in self.windows_map.items()
-                if isinstance(v, CommandObject) and not isinstance(v, _Widget)
-            ]
-            return True, windows
+            return True, self.windows_map.addressable.keys()
         elif name == "screen":
-            return True, list(range(len(self.screens)))
+            return True, range(len(self.screens))
         elif name == "core":
             return True, []
         return None
@@ -1040,13 +1079,7 @@ class Qtile(CommandObject):
             if sel is None:
                 return self.current_window
             else:
-                windows: dict[str | int, base.WindowType]
-                windows = {
-                    k: v
-                    for k, v in self.windows_map.items()
-                    if isinstance(v, CommandObject) and not isinstance(v, _Widget)
-                }
-                return windows.get(sel)
+                return self.windows_map.addressable.get(sel)  # type: ignore
         elif name == "screen":
             if sel is None:
                 return self.current_screen
@@ -1061,7 +1094,10 @@ class Qtile(CommandObject):
         event queue after func is called."""
 
         def f() -> None:
-            func(*args)
+            if profiler.enabled:
+                profiler.call("loop", handler_name(func), func, *args)
+            else:
+                func(*args)
             self.core.flush()
 
         return self._eventloop.call_soon(f)
@@ -1070,7 +1106,10 @@ class Qtile(CommandObject):
         """Another event loop proxy, see `call_soon`."""
 
         def f() -> None:
-            func(*args)
+            if profiler.enabled:
+                profiler.call("loop", handler_name(func), func, *args)
+            else:
+                func(*args)
             self.core.flush()
 
         return self._eventloop.call_soon_threadsafe(f)
@@ -1079,7 +1118,10 @@ class Qtile(CommandObject):
         """Another event loop proxy, see `call_soon`."""
 
         def f() -> None:
-            func(*args)
+            if profiler.enabled:
+                profiler.call("loop", handler_name(func), func, *args)
+            else:
+                func(*args)
             self.core.flush()
 
         return self._eventloop.call_later(delay, f)
@@ -1087,7 +1129,24 @@ class Qtile(CommandObject):
     def run_in_executor(self, func: Callable, *args: Any) -> asyncio.Future:
         """A wrapper for running a function in the event loop's default
         executor."""
-        return self._eventloop.run_in_executor(None, func, *args)
+        if not profiler.enabled:
+            return self._eventloop.run_in_executor(None, func, *args)
+
+        # Executor jobs don't block the loop, only record how long they take
+        name = handler_name(func)
+        elapsed = 0.0
+
+        def job() -> Any:
+            nonlocal elapsed
+            start = time.perf_counter()
+            try:
+                return func(*args)
+            finally:
+                elapsed = time.perf_counter() - start
+
+        future = self._eventloop.run_in_executor(None, job)
+        future.add_done_callback(lambda _: profiler.record("executor", name, elapsed))
+        return future
 
     @expose_command()
     def debug(self) -> None:
@@ -1936,6 +1995,51 @@ class Qtile(CommandObject):
         tracemalloc.take_snapshot().dump(malloc_dump)
         return True, malloc_dump
 
+    @expose_command()
+    def hook_timings_toggle(self) -> None:
+        """Toggle recording the time spent in each hook subscriber
+
+        Recorded timings are discarded when stopping. See `get_hook_timings`.
+        """
+        hook.qtile_hooks.enable_timings(hook.qtile_hooks.timings is None)
+
+    @expose_command()
+    def get_hook_timings(self) -> dict[str, dict[str, dict[str, float]]]:
+        """Get the time spent in each hook subscriber
+
+        For each hook, returns the number of ``calls`` of each subscriber
+        along with the ``total`` and ``max`` time in seconds spent in it,
+        since `hook_timings_toggle` started recording.
+        """
+        if hook.qtile_hooks.timings is None:
+            raise CommandError("Hook timings are not being recorded")
+        return hook.qtile_hooks.timings
+
+    @expose_command()
+    def profiling_toggle(self, stall_threshold: float | None = None) -> None:
+        """Toggle profiling of the event loop
+
+        While profiling, the time spent in X11 event handlers, hooks, IPC
+        commands and callbacks scheduled on the event loop is recorded, and
+        any of them running longer than ``stall_threshold`` seconds (0.1 by
+        default) is logged. Recorded data is discarded when restarting. See
+        `get_profile`.
+        """
+        profiler.enable(not profiler.enabled, stall_threshold, self._eventloop)
+
+    @expose_command()
+    def get_profile(self) -> dict[str, Any]:
+        """Get the data recorded while profiling
+
+        Returns whether profiling is ``enabled``, for how many seconds it has
+        been (``duration``), the ``stall_threshold`` and the number of
+        ``stalls`` over it, and the ``handlers`` sorted by the total time
+        spent in them. For each handler, this gives its ``category`` and
+        ``name``, its number of ``calls``, the ``total``, ``mean`` and ``max``
+        time in seconds spent in it and a ``histogram`` of these times.
+        """
+        return profiler.info()
+
     @expose_command()
     def get_test_data(self) -> Any:
         """
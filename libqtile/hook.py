@@ -1,19 +1,64 @@
 import asyncio
 import contextlib
+import functools
 import inspect
-from collections.abc import Callable
+import time
+from collections.abc import Callable, Hashable
 
 from libqtile import backend, utils
 from libqtile.log_utils import logger
+from libqtile.profiling import profiler
 from libqtile.resources.sleep import inhibitor
 
 HookHandler = Callable[[Callable], Callable]
 
 subscriptions = {}  # type: dict
 
+# Kinds of subscribers, worked out once per subscriber rather than on each fire
+SYNC = 0
+COROUTINE_FUNCTION = 1
+COROUTINE = 2
+
+# The subscribers of each registry and event along with their kind, in
+# subscription order. Built from `subscriptions` when an event is fired and kept
+# until its list of subscribers changes.
+_dispatch_tables: dict[str, dict[str, tuple[tuple, tuple[tuple[Callable, int], ...]]]] = {}
+_NO_SUBSCRIBERS: list = []
+
 
 def clear():
+    for registry in subscriptions.values():
+        for funcs in registry.values():
+            for func in funcs:
+                if isinstance(func, _Coalesced):
+                    func.cancel()
     subscriptions.clear()
+    _dispatch_tables.clear()
+
+
+def _subscriber_kind(func) -> int:
+    if inspect.iscoroutinefunction(func):
+        return COROUTINE_FUNCTION
+    if asyncio.iscoroutine(func):
+        return COROUTINE
+    return SYNC
+
+
+def _dispatch_table(registry_name: str, event: str) -> tuple[tuple[Callable, int], ...]:
+    funcs = subscriptions[registry_name].get(event, _NO_SUBSCRIBERS)
+    tables = _dispatch_tables.setdefault(registry_name, {})
+    cached = tables.get(event)
+    # The subscription lists can also be modified directly, so the table is
+    # checked against the subscribers it was built from
+    subscribers = tuple(funcs)
+    if cached is None or cached[0] != subscribers:
+        table = tuple((func, _subscriber_kind(func)) for func in subscribers)
+        cached = tables[event] = (subscribers, table)
+    return cached[1]
+
+
+def _invalidate_dispatch_table(registry_name: str, event: str) -> None:
+    _dispatch_tables.get(registry_name, {}).pop(event, None)
 
 
 def _fire_async_event(co, unsubscribe):
@@ -36,33 +81,114 @@ def _fire_async_event(co, unsubscribe):
         task.add_done_callback(finish_task)
 
 
+class _Coalesced:
+    """A subscriber whose fires are collected and delivered later
+
+    Fires are grouped by key: with ``coalesce=True`` every fire of the event
+    shares a single key, otherwise ``coalesce`` is called with the arguments of
+    the fire to compute it. Only the arguments of the latest fire of each key
+    are delivered, once per iteration of the event loop or, when ``delay`` is
+    given, at most once every ``delay`` seconds.
+
+    A function subscribed with ``coalesce`` to several events shares a single
+    _Coalesced between them, so that it is delivered at most once per iteration
+    whichever of those events were fired.
+    """
+
+    def __init__(
+        self,
+        func: Callable,
+        coalesce: bool | Callable[..., Hashable],
+        delay: float | None,
+        unsubscribe: Callable[[], None],
+    ) -> None:
+        functools.update_wrapper(self, func)
+        self.func = func
+        self.key = coalesce if callable(coalesce) else None
+        self.delay = delay
+        self.unsubscribe = unsubscribe
+        self.pending: dict[Hashable, tuple[tuple, dict]] = {}
+        self.handle: asyncio.Handle | asyncio.TimerHandle | None = None
+        # The events this is subscribed to
+        self.events: set[str] = set()
+
+    def __call__(self, *args, **kwargs) -> None:
+        loop = None
+        with contextlib.suppress(RuntimeError):
+            loop = asyncio.get_running_loop()
+
+        if loop is None:
+            # Nothing would run the delivery, so there is nothing to coalesce with
+            self.deliver(args, kwargs)
+            return
+
+        key = None if self.key is None else self.key(*args, **kwargs)
+        # Move the key to the end so that keys are delivered in order of their latest fire
+        self.pending.pop(key, None)
+        self.pending[key] = (args, kwargs)
+        if self.handle is None:
+            if self.delay is None:
+                self.handle = loop.call_soon(self.flush)
+            else:
+                self.handle = loop.call_later(self.delay, self.flush)
+
+    def deliver(self, args: tuple, kwargs: dict) -> bool:
+        try:
+            result = self.func(*args, **kwargs)
+        except:  # noqa: E722
+            logger.exception("Error in coalesced hook %s", self.func)
+            return False
+        if inspect.iscoroutine(result):
+            _fire_async_event(result, self.unsubscribe)
+            return False
+        if result is True:
+            self.cancel()
+            self.unsubscribe()
+            return True
+        return False
+
+    def flush(self) -> None:
+        self.handle = None
+        pending = self.pending
+        self.pending = {}
+        for args, kwargs in pending.values():
+            if self.deliver(args, kwargs):
+                break
+
+    def cancel(self) -> None:
+        if self.handle is not None:
+            self.handle.cancel()
+            self.handle = None
+        self.pending.clear()
+
+
 # Custom hook functions receive a single argument, "self", which will refer to the
 # Subscribe/Unsubscribe classes.
 
 
 def _resume_func(self):
-    def f(func):
+    def f(func, **kwargs):
         inhibitor.want_resume()
-        return self._subscribe("resume", func)
+        return self._subscribe("resume", func, **kwargs)
 
     return f
 
 
 def _suspend_func(self):
-    def f(func):
+    def f(func, **kwargs):
         inhibitor.want_sleep()
-        return self._subscribe("suspend", func)
+        return self._subscribe("suspend", func, **kwargs)
 
     return f
 
 
 def _user_hook_func(self):
     def wrapper(hook_name):
-        def f(func):
+        def f(func, **kwargs):
             name = f"user_{hook_name}"
             if name not in self.hooks:
                 self.hooks[name] = None
-            return self._subscribe(name, func)
+            return self._subscribe(name, func, **kwargs)
 
         return f
 
@@ -91,8 +217,11 @@ class HookHandlerCollection:
         return self.hooks[name]
 
     def _register(self, hook: Hook) -> None:
-        def _hook_func(func):
-            return self._subscribe(hook.name, func)
+        def _hook_func(func=None, **kwargs):
+            if func is None:
+                # Used as a decorator with options, e.g. @hook.subscribe.x(coalesce=True)
+                return functools.partial(_hook_func, **kwargs)
+            return self._subscribe(hook.name, func, **kwargs)
 
         hooked = _hook_func if hook.func is None else hook.func(self)
         hooked.__doc__ = hook.doc
@@ -100,14 +229,72 @@ class HookHandlerCollection:
         self.hooks[hook.name] = hooked
 
 
+def _find_coalesced(registry: dict, func: Callable) -> _Coalesced | None:
+    for lst in registry.values():
+        for subscriber in lst:
+            if isinstance(subscriber, _Coalesced) and subscriber.func == func:
+                return subscriber
+    return None
+
+
+def _find_subscriber(lst: list, func: Callable) -> int | None:
+    for i, subscriber in enumerate(lst):
+        if subscriber == func or (isinstance(subscriber, _Coalesced) and subscriber.func == func):
+            return i
+    return None
+
+
 class Subscribe(HookHandlerCollection):
-    def _subscribe(self, event: str, func: Callable) -> Callable:
+    """
+    Subscribing functions can be passed these keyword arguments:
+
+    ``coalesce``
+        Instead of being called each time the event is fired, the function is
+        called once per iteration of the event loop with the arguments of the
+        latest fire. If a function is given rather than ``True``, it is called
+        with the arguments of each fire to get a key, and the latest fire of
+        each key is delivered. A function subscribed with ``coalesce`` to
+        several events is called once for all of them, with the options given
+        when it was first subscribed.
+    ``delay``
+        With ``coalesce``, deliver at most once every ``delay`` seconds
+        rather than once per iteration of the event loop.
+    """
+
+    def _subscribe(
+        self,
+        event: str,
+        func: Callable,
+        coalesce: bool | Callable[..., Hashable] = False,
+        delay: float | None = None,
+    ) -> Callable:
         registry = subscriptions.setdefault(self.registry_name, dict())
         lst = registry.setdefault(event, [])
-        if func not in lst:
-            lst.append(func)
+        if _find_subscriber(lst, func) is None:
+            if coalesce:
+                coalesced = _find_coalesced(registry, func)
+                if coalesced is None:
+                    unsubscribe = functools.partial(self._unsubscribe, func)
+                    coalesced = _Coalesced(func, coalesce, delay, unsubscribe)
+                coalesced.events.add(event)
+                lst.append(coalesced)
+            elif delay is not None:
+                raise ValueError("delay can only be given with coalesce")
+            else:
+                lst.append(func)
+            _invalidate_dispatch_table(self.registry_name, event)
         return func
 
+    def _unsubscribe(self, func: Callable) -> None:
+        # Called when a coalesced subscriber returns True, which unsubscribes it
+        # from every event it shares
+        registry = subscriptions.get(self.registry_name, {})
+        for event, lst in registry.items():
+            i = _find_subscriber(lst, func)
+            if i is not None and isinstance(lst[i], _Coalesced):
+                del lst[i]
+                _invalidate_dispatch_table(self.registry_name, event)
+
 
 class Unsubscribe(HookHandlerCollection):
     """
@@ -115,15 +302,21 @@ class Unsubscribe(HookHandlerCollection):
     overridden to remove calls from hooks.
     """
 
-    def _subscribe(self, event: str, func: Callable) -> None:
+    def _subscribe(self, event: str, func: Callable, **kwargs) -> None:
         registry = subscriptions.setdefault(self.registry_name, dict())
         lst = registry.setdefault(event, [])
-        try:
-            lst.remove(func)
-        except ValueError:
+        i = _find_subscriber(lst, func)
+        if i is None:
             logger.warning(
                 f"Tried to unsubscribe a hook ({event}) that was not currently subscribed."
             )
+            return
+        subscriber = lst.pop(i)
+        if isinstance(subscriber, _Coalesced):
+            subscriber.events.discard(event)
+            if not subscriber.events:
+                subscriber.cancel()
+        _invalidate_dispatch_table(self.registry_name, event)
 
 
 class Registry:
@@ -131,9 +324,45 @@ class Registry:
         self.name = name
         self.subscribe = Subscribe(name)
         self.unsubscribe = Unsubscribe(name, check_name=False)
+        # Observers are called with the name of the event followed by its
+        # arguments. Unlike subscriptions, they are not cleared when the config
+        # is reloaded, and their return value is ignored.
+        self.observers: dict[str, list[Callable]] = {}
+        # Time spent in each subscriber of each event, see enable_timings()
+        self.timings: dict[str, dict[str, dict[str, float]]] | None = None
         for hook in hooks:
             self.register_hook(hook)
 
+    def enable_timings(self, enabled: bool = True) -> None:
+        """Start or stop recording the time spent in each subscriber
+
+        Only the synchronous part of a subscriber is timed: for coroutines,
+        this is the time taken to create and schedule them. Recorded timings
+        are discarded when stopping.
+        """
+        self.timings = {} if enabled else None
+
+    def _record_timing(self, event: str, func: Callable, elapsed: float) -> None:
+        assert self.timings is not None
+        name = f"{getattr(func, '__module__', None)}.{getattr(func, '__qualname__', func)}"
+        timing = self.timings.setdefault(event, {}).setdefault(
+            name, {"calls": 0, "total": 0.0, "max": 0.0}
+        )
+        timing["calls"] += 1
+        timing["total"] += elapsed
+        timing["max"] = max(timing["max"], elapsed)
+
+    def observe(self, event: str, func: Callable) -> None:
+        if event not in self.subscribe.hooks:
+            raise utils.QtileError(f"Unknown event: {event}")
+        lst = self.observers.setdefault(event, [])
+        if func not in lst:
+            lst.append(func)
+
+    def unobserve(self, event: str, func: Callable) -> None:
+        with contextlib.suppress(KeyError, ValueError):
+            self.observers[event].remove(func)
+
     def register_hook(self, hook: Hook) -> None:
         if hook.name in self.subscribe.hooks:
             raise utils.QtileError(
@@ -147,9 +376,6 @@ class Registry:
     def fire(self, event, *args, **kwargs):
         if event not in self.subscribe.hooks:
             raise utils.QtileError(f"Unknown event: {event}")
-        # Do not fire for Internal windows
-        if any(isinstance(arg, backend.base.window.Internal) for arg in args):
-            return
         # We should check if the registry name is in the subscriptions dict
         # A name can disappear if the config is reloaded (which clears subscriptions)
         # but there are no hook subscriptions. This is not an issue for qtile core but
@@ -157,31 +383,58 @@ class Registry:
         if self.name not in subscriptions:
             subscriptions[self.name] = dict()
 
-        # Handlers for transient hooks
-        def unsubscribe_func(event, func):
-            def _wrapper():
-                getattr(self.unsubscribe, event)(func)
+        dispatch = _dispatch_table(self.name, event)
+        observers = self.observers.get(event)
+        if not dispatch and not observers:
+            return
 
-            return _wrapper
+        # Do not fire for Internal windows
+        if args and any(isinstance(arg, backend.base.window.Internal) for arg in args):
+            return
 
         to_unsubscribe = []
+        timings = self.timings
+        profiling = profiler.enabled
+        if profiling:
+            fired = time.perf_counter()
 
-        for i in subscriptions[self.name].get(event, []):
+        for func, kind in dispatch:
             try:
-                if inspect.iscoroutinefunction(i):
-                    _fire_async_event(i(*args, **kwargs), unsubscribe_func(event, i))
-                elif asyncio.iscoroutine(i):
-                    _fire_async_event(i, unsubscribe_func(event, i))
+                if timings is not None:
+                    start = time.perf_counter()
+
+                if kind == SYNC:
+                    # Handlers for transient hooks return True
+                    if func(*args, **kwargs) is True:
+                        to_unsubscribe.append(func)
+                elif kind == COROUTINE_FUNCTION:
+                    _fire_async_event(func(*args, **kwargs), self._unsubscribe_func(event, func))
                 else:
-                    result = i(*args, **kwargs)
-                    if result is True:
-                        to_unsubscribe.append(unsubscribe_func(event, i))
+                    _fire_async_event(func, self._unsubscribe_func(event, func))
 
+                if timings is not None:
+                    self._record_timing(event, func, time.perf_counter() - start)
             except:  # noqa: E722
                 logger.exception("Error in hook %s", event)
 
-        for f in to_unsubscribe:
-            f()
+        for func in to_unsubscribe:
+            self.unsubscribe._subscribe(event, func)
+
+        if observers:
+            for observer in list(observers):
+                try:
+                    observer(event, *args)
+                except:  # noqa: E722
+                    logger.exception("Error in observer of hook %s", event)
+
+        if profiling:
+            profiler.record("hook", event, time.perf_counter() - fired)
+
+    def _unsubscribe_func(self, event: str, func: Callable) -> Callable[[], None]:
+        def _wrapper():
+            self.unsubscribe._subscribe(event, func)
+
+        return _wrapper
 
 
 hooks: list[Hook] = [
@@ -1128,3 +1381,5 @@ qtile_hooks = Registry("qtile", hooks)
 subscribe = qtile_hooks.subscribe
 unsubscribe = qtile_hooks.unsubscribe
 fire = qtile_hooks.fire
+observe = qtile_hooks.observe
+unobserve = qtile_hooks.unobserve
@@ -3,15 +3,32 @@ A simple IPC mechanism for communicating between two local processes. We
 use marshal to serialize data - this means that both client and server must
 run the same Python version, and that clients must be trusted (as
 un-marshalling untrusted data can result in arbitrary code execution).
+
+Two wire protocols are supported on the same socket:
+
+    - The one-shot protocol: the client writes a single message, sends EOF
+      and the server replies with a single message before closing the
+      connection.
+    - The framed protocol: the client starts the connection with
+      ``FRAMED_MAGIC`` and can then send any number of framed requests on the
+      same connection. Each frame carries a request id which the server echoes
+      in its reply, so requests can be pipelined.
+
+On framed connections, a request of type ``SUBSCRIBE`` opens an event stream:
+after the reply to the request, the server keeps pushing event frames tagged
+with the id of that request until the connection is closed.
 """
 
 import asyncio
 import fcntl
+import itertools
 import json
 import marshal
 import os.path
 import socket
 import struct
+from collections import OrderedDict
+from collections.abc import AsyncGenerator, Callable, Generator, Hashable
 from typing import Any, Self
 
 from libqtile.log_utils import logger
@@ -20,8 +37,28 @@ from libqtile.utils import get_cache_dir
 HDRFORMAT = "!L"
 HDRLEN = struct.calcsize(HDRFORMAT)
 
+# frame header: payload length, request id, and a flag byte set if the payload
+# is json rather than marshal
+FRAMEFORMAT = "!LLB"
+FRAMELEN = struct.calcsize(FRAMEFORMAT)
+
+# sent by clients to switch the connection to the framed protocol. the first
+# byte can never start a json message and, read as a marshal header, would
+# declare a message of well over a gigabyte.
+FRAMED_MAGIC = b"QTILEIPC/framed\n"
+
 SOCKBASE = "qtilesocket.%s"
 
+# request type opening an event stream on a framed connection
+SUBSCRIBE = "subscribe"
+
+# what to do with new events when the buffer of an event stream is full
+DROP_OLDEST = "drop_oldest"
+DROP_NEWEST = "drop_newest"
+# like DROP_OLDEST, but a buffered event is replaced by a new one with the same key
+COALESCE = "coalesce"
+STREAM_POLICIES = (DROP_OLDEST, DROP_NEWEST, COALESCE)
+
 
 class IPCError(Exception):
     pass
@@ -114,6 +151,46 @@ class _IPC:
         size = struct.pack(HDRFORMAT, len(msg_bytes))
         return size + msg_bytes
 
+    @staticmethod
+    def pack_frame(request_id: int, msg: Any, *, is_json: bool = False) -> bytes:
+        """Pack the object into a frame of the framed protocol"""
+        if is_json:
+            payload = json.dumps(msg, default=_IPC._json_encoder).encode()
+        else:
+            payload = marshal.dumps(msg)
+        return struct.pack(FRAMEFORMAT, len(payload), request_id, is_json) + payload
+
+    @staticmethod
+    async def read_frame(reader: asyncio.StreamReader) -> tuple[int, Any, bool] | None:
+        """Read one frame of the framed protocol
+
+        Returns
+        -------
+        tuple[int, Any, bool] | None
+            A tuple of the request id, the unpacked object and a boolean
+            denoting if the frame was json encoded, or None if the connection
+            was closed cleanly between two frames.
+        """
+        try:
+            header = await reader.readexactly(FRAMELEN)
+        except asyncio.IncompleteReadError as e:
+            if e.partial:
+                raise IPCError("Connection closed in the middle of a frame header") from e
+            return None
+
+        size, request_id, is_json = struct.unpack(FRAMEFORMAT, header)
+        try:
+            payload = await reader.readexactly(size)
+        except asyncio.IncompleteReadError as e:
+            raise IPCError("Connection closed in the middle of a frame") from e
+
+        try:
+            if is_json:
+                return request_id, json.loads(payload.decode()), True
+            return request_id, marshal.loads(payload), False
+        except (ValueError, EOFError, TypeError) as e:
+            raise IPCError("Unable to decode frame") from e
+
     @staticmethod
     def _json_encoder(field: Any) -> Any:
         """Convert non-serializable types to ones understood by stdlib json module"""
@@ -179,10 +256,311 @@ class Client:
         return data
 
 
+class PersistentClient:
+    def __init__(self, socket_path: str, is_json=False) -> None:
+        """Create a new IPC client which keeps its connection open
+
+        Unlike :class:`Client`, this client opens a single connection using
+        the framed protocol and reuses it (and its event loop) for every
+        message, which makes it suited to callers issuing many commands in a
+        row. The connection is opened lazily and re-opened if the server
+        drops it.
+
+        Parameters
+        ----------
+        socket_path: str
+            The file path to the file that is used to open the connection to
+            the running IPC server.
+        is_json: bool
+            Pack and unpack messages as json
+        """
+        self.socket_path = socket_path
+        self.is_json = is_json
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+        self._read_lock: asyncio.Lock | None = None
+        self._pending: dict[int, asyncio.Future] = {}
+        self._ids = itertools.count(1)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, _exc_type, _exc_value, _tb) -> None:
+        self.close()
+
+    def call(self, data: Any) -> Any:
+        return self.send(data)
+
+    def send(self, msg: Any) -> Any:
+        """Send the message and return the response from the server
+
+        If any exception is raised by the server, that will propogate out of
+        this call.
+        """
+        return self._run(self.async_send(msg))
+
+    def send_many(self, msgs: list[Any]) -> list[Any]:
+        """Send all the messages at once and return the responses in order
+
+        The requests are pipelined: all of them are written before waiting
+        for the first reply.
+        """
+        return self._run(self.async_send_many(msgs))
+
+    def _run(self, coro) -> Any:
+        if self._loop is None or self._loop.is_closed():
+            self._loop = asyncio.new_event_loop()
+        return self._loop.run_until_complete(coro)
+
+    async def _connect(self) -> None:
+        if self._writer is not None and not self._writer.is_closing():
+            return
+
+        try:
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_unix_connection(path=self.socket_path), timeout=3
+            )
+        except (ConnectionRefusedError, FileNotFoundError, TimeoutError):
+            raise IPCError(f"Could not open {self.socket_path}")
+
+        writer.write(FRAMED_MAGIC)
+        self._reader, self._writer = reader, writer
+        self._read_lock = asyncio.Lock()
+        self._pending.clear()
+
+    async def _read_replies(self, futures: list[asyncio.Future]) -> None:
+        """Read replies from the server until all the given futures are resolved
+
+        Replies to requests made by other concurrent callers are dispatched to
+        their own futures along the way.
+        """
+        assert self._reader is not None and self._read_lock is not None
+        async with self._read_lock:
+            while not all(future.done() for future in futures):
+                frame = await _IPC.read_frame(self._reader)
+                if frame is None:
+                    raise IPCError("Server closed the connection")
+                request_id, data, _ = frame
+                future = self._pending.pop(request_id, None)
+                if future is not None and not future.done():
+                    future.set_result(data)
+
+    def _write_request(self, msg: Any) -> asyncio.Future:
+        assert self._writer is not None
+        request_id = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        self._writer.write(_IPC.pack_frame(request_id, msg, is_json=self.is_json))
+        return future
+
+    async def async_send(self, msg: Any) -> Any:
+        """Send the message to the server
+
+        Pack and send the message over the shared connection, then wait for
+        and return the matching response from the server.
+        """
+        (data,) = await self.async_send_many([msg])
+        return data
+
+    async def async_send_many(self, msgs: list[Any]) -> list[Any]:
+        """Pipeline the messages to the server and return the responses in order"""
+        await self._connect()
+        assert self._writer is not None
+
+        futures = [self._write_request(msg) for msg in msgs]
+        try:
+            await self._writer.drain()
+            await asyncio.wait_for(self._read_replies(futures), timeout=10)
+        except TimeoutError:
+            await self.async_close()
+            raise IPCError("Server not responding")
+        except (IPCError, ConnectionError) as e:
+            await self.async_close()
+            raise IPCError(str(e)) from e
+        return [future.result() for future in futures]
+
+    def subscribe(self, msg: Any) -> Generator[Any]:
+        """Send a subscription request and iterate over the frames sent back
+
+        The first item is the reply to the request, the following ones are the
+        events pushed by the server. The iteration stops when the server
+        closes the connection. This client cannot be used for other requests
+        while iterating.
+        """
+        stream = self.async_subscribe(msg)
+        try:
+            while True:
+                try:
+                    yield self._run(anext(stream))
+                except StopAsyncIteration:
+                    return
+        finally:
+            self._run(stream.aclose())
+
+    async def async_subscribe(self, msg: Any) -> AsyncGenerator[Any]:
+        """Send a subscription request and iterate over the frames sent back"""
+        await self._connect()
+        assert self._writer is not None and self._reader is not None
+        assert self._read_lock is not None
+
+        request_id = next(self._ids)
+        self._writer.write(_IPC.pack_frame(request_id, msg, is_json=self.is_json))
+        async with self._read_lock:
+            try:
+                await self._writer.drain()
+                while True:
+                    frame = await _IPC.read_frame(self._reader)
+                    if frame is None:
+                        break
+                    if frame[0] == request_id:
+                        yield frame[1]
+            except ConnectionError as e:
+                raise IPCError(str(e)) from e
+            finally:
+                await self.async_close()
+
+    async def async_close(self) -> None:
+        """Close the connection to the server"""
+        if self._writer is not None:
+            self._writer.close()
+            try:
+                await self._writer.wait_closed()
+            except ConnectionError:
+                pass
+        for future in self._pending.values():
+            future.cancel()
+        self._pending.clear()
+        self._reader = self._writer = self._read_lock = None
+
+    def close(self) -> None:
+        """Close the connection and the event loop used by this client"""
+        if self._loop is None or self._loop.is_closed():
+            return
+        self._loop.run_until_complete(self.async_close())
+        self._loop.close()
+        self._loop = None
+
+
+class EventStream:
+    """A bounded stream of events pushed to a client of a framed connection
+
+    Events are buffered and written by a background task, so pushing an event
+    never blocks. When the client does not read fast enough and the buffer is
+    full, events are dropped according to the policy of the stream. Each
+    frame sent is a dict holding the ``event`` and the number of events
+    ``dropped`` since the previous frame.
+    """
+
+    def __init__(
+        self,
+        writer: asyncio.StreamWriter,
+        request_id: int,
+        is_json: bool,
+        maxsize: int = 256,
+        policy: str = DROP_OLDEST,
+    ) -> None:
+        self.writer = writer
+        self.request_id = request_id
+        self.is_json = is_json
+        self.maxsize = maxsize
+        self.policy = policy
+        self.dropped = 0
+        self.closed = False
+        self._events: OrderedDict[Hashable, Any] = OrderedDict()
+        self._ids = itertools.count()
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self._close_callbacks: list[Callable[[], None]] = []
+
+    def add_close_callback(self, callback: Callable[[], None]) -> None:
+        """Call the given function once the stream is closed"""
+        self._close_callbacks.append(callback)
+
+    def push(self, event: Any, key: Hashable | None = None) -> None:
+        """Queue the event to be sent to the client
+
+        With the ``COALESCE`` policy, a buffered event with the same key is
+        replaced by this one.
+        """
+        if self.closed:
+            return
+
+        if self.policy == COALESCE and key is not None:
+            key = ("key", key)
+            if key in self._events:
+                self._events[key] = event
+                self.dropped += 1
+                return
+        else:
+            key = next(self._ids)
+
+        if len(self._events) >= self.maxsize:
+            self.dropped += 1
+            if self.policy == DROP_NEWEST:
+                return
+            self._events.popitem(last=False)
+
+        self._events[key] = event
+        self._wakeup.set()
+        if self._task is None:
+            self._task = asyncio.create_task(self._write_events())
+
+    async def _write_events(self) -> None:
+        try:
+            while True:
+                await self._wakeup.wait()
+                self._wakeup.clear()
+                while self._events:
+                    _, event = self._events.popitem(last=False)
+                    frame = {"event": event, "dropped": self.dropped}
+                    self.dropped = 0
+                    self.writer.write(
+                        _IPC.pack_frame(self.request_id, frame, is_json=self.is_json)
+                    )
+                    await self.writer.drain()
+        except (ConnectionError, ValueError) as e:
+            logger.warning("Unable to send event, closing the stream: %s", e)
+            self.close()
+
+    def close(self) -> None:
+        """Stop sending events and run the close callbacks"""
+        if self.closed:
+            return
+        self.closed = True
+        self._events.clear()
+        if self._task is not None and self._task is not asyncio.current_task():
+            self._task.cancel()
+        for callback in self._close_callbacks:
+            try:
+                callback()
+            except Exception:
+                logger.exception("Error closing event stream")
+
+
 class Server:
-    def __init__(self, socket_path: str, handler) -> None:
+    def __init__(
+        self,
+        socket_path: str,
+        handler,
+        stream_handler: Callable[[Any, EventStream], Any] | None = None,
+    ) -> None:
+        """Create a new IPC server
+
+        Parameters
+        ----------
+        socket_path: str
+            The file path to the socket to listen on.
+        handler:
+            Called with each request, returns the reply to send.
+        stream_handler:
+            Called with ``SUBSCRIBE`` requests of framed connections and the
+            ``EventStream`` for the request, returns the reply to send. Without
+            it, these requests are passed to ``handler``.
+        """
         self.socket_path = socket_path
         self.handler = handler
+        self.stream_handler = stream_handler
         self.server = None  # type: asyncio.AbstractServer | None
 
         if os.path.exists(socket_path):
@@ -203,11 +581,20 @@ class Server:
         """Callback when a connection is made to the server
 
         Read the data sent from the client, execute the requested command, and
-        send the reply back to the client.
+        send the reply back to the client. Connections starting with
+        ``FRAMED_MAGIC`` are handed to :meth:`_serve_framed` instead.
         """
         try:
             logger.debug("Connection made to server")
-            data = await reader.read()
+            try:
+                data = await reader.readexactly(len(FRAMED_MAGIC))
+            except asyncio.IncompleteReadError as e:
+                data = e.partial
+            else:
+                if data == FRAMED_MAGIC:
+                    await self._serve_framed(reader, writer)
+                    return
+                data += await reader.read()
             logger.debug("EOF received by server")
 
             req, is_json = _IPC.unpack(data)
@@ -224,7 +611,53 @@ class Server:
             writer.write_eof()
         finally:
             writer.close()
-            await writer.wait_closed()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def _serve_framed(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Serve framed requests on the connection until the client closes it
+
+        Replies are written in the order the requests are received and are
+        tagged with the id of the request they answer.
+        """
+        logger.debug("Framed connection made to server")
+        streams: list[EventStream] = []
+        try:
+            while True:
+                try:
+                    frame = await _IPC.read_frame(reader)
+                except IPCError:
+                    logger.warning("Invalid frame received, closing connection")
+                    return
+                except ConnectionError:
+                    return
+                if frame is None:
+                    logger.debug("Framed connection closed by client")
+                    return
+
+                request_id, req, is_json = frame
+                if (
+                    self.stream_handler is not None
+                    and isinstance(req, dict)
+                    and req.get("type") == SUBSCRIBE
+                ):
+                    stream = EventStream(writer, request_id, is_json)
+                    streams.append(stream)
+                    rep = self.stream_handler(req, stream)
+                else:
+                    rep = self.handler(req)
+                writer.write(_IPC.pack_frame(request_id, rep, is_json=is_json))
+                try:
+                    await writer.drain()
+                except ConnectionError:
+                    return
+        finally:
+            for stream in streams:
+                stream.close()
 
     async def __aenter__(self) -> Self:
         """Start and return the server"""
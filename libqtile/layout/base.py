@@ -3,7 +3,7 @@ from __future__ import annotations
 import copy
 from abc import ABCMeta, abstractmethod
 from collections.abc import Iterator, Sequence
-from typing import Any, Self, overload
+from typing import Any, NamedTuple, Self, overload
 
 from libqtile import configurable
 from libqtile.backend.base import Window
@@ -11,6 +11,51 @@ from libqtile.command.base import CommandObject, ItemT, expose_command
 from libqtile.command.interface import CommandError
 from libqtile.config import ScreenRect
 from libqtile.group import _Group
+from libqtile.utils import ColorsType
+
+
+class Placement(NamedTuple):
+    """Where a layout puts a window, with the arguments of `Window.place`"""
+
+    x: int
+    y: int
+    width: int
+    height: int
+    borderwidth: int = 0
+    bordercolor: ColorsType | None = None
+    margin: int | list[int] | None = None
+    above: bool = False
+    # Raise the window above the other windows of its layer once placed
+    move_to_top: bool = False
+
+
+# The result of Layout.arrange: the placement of each window, or None for the
+# windows to hide. Windows that aren't in it are left alone.
+Arrangement = dict[Window, Placement | None]
+
+
+def apply_arrangement(windows: Sequence[Window], arrangement: Arrangement) -> None:
+    """Place, show and hide the given windows as arranged, in their order"""
+    for win in windows:
+        if win not in arrangement:
+            continue
+        placement = arrangement[win]
+        if placement is None:
+            win.hide()
+            continue
+        win.place(
+            placement.x,
+            placement.y,
+            placement.width,
+            placement.height,
+            placement.borderwidth,
+            placement.bordercolor,
+            above=placement.above,
+            margin=placement.margin,
+        )
+        win.unhide()
+        if placement.move_to_top:
+            win.move_to_top()
 
 
 class Layout(CommandObject, configurable.Configurable, metaclass=ABCMeta):
@@ -32,8 +77,22 @@ class Layout(CommandObject, configurable.Configurable, metaclass=ABCMeta):
         self._group: _Group | None = None
 
     def layout(self, windows: Sequence[Window], screen_rect: ScreenRect) -> None:
-        for i in windows:
-            self.configure(i, screen_rect)
+        arrangement = self.arrange(windows, screen_rect)
+        if arrangement is None:
+            for i in windows:
+                self.configure(i, screen_rect)
+        else:
+            apply_arrangement(windows, arrangement)
+
+    def arrange(self, windows: Sequence[Window], screen_rect: ScreenRect) -> Arrangement | None:
+        """Compute the placement of all the windows in one pass
+
+        Layouts should implement this rather than `configure`, computing the
+        geometry of all their clients at once: the windows are then placed
+        together by `layout`. It must not place, show or hide any window
+        itself. Returns None if the layout only implements `configure`.
+        """
+        return None
 
     def finalize(self) -> None:
         pass
@@ -120,16 +179,21 @@ class Layout(CommandObject, configurable.Configurable, metaclass=ABCMeta):
         Returns the "next" window that should gain focus or None.
         """
 
-    @abstractmethod
     def configure(self, client: Window, screen_rect: ScreenRect) -> None:
-        """Configure the layout
+        """Configure a single window
 
-        This method should:
+        Layouts implementing `arrange` get this for free, it is only kept for
+        those that don't and for callers placing a single window. Otherwise,
+        this method should:
 
             - Configure the dimensions and borders of a window using the
               `.place()` method.
             - Call either `.hide()` or `.unhide()` on the window.
         """
+        arrangement = self.arrange([client], screen_rect)
+        if arrangement is None:
+            raise NotImplementedError(f"{self.name} implements neither arrange nor configure")
+        apply_arrangement([client], arrangement)
 
     @abstractmethod
     def focus_first(self) -> Window | None:
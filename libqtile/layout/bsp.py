@@ -1,13 +1,13 @@
 from __future__ import annotations
 
-from collections.abc import Generator
+from collections.abc import Generator, Sequence
 from typing import Any, Self
 
 from libqtile.backend.base import Window
 from libqtile.command.base import expose_command
 from libqtile.config import ScreenRect
 from libqtile.group import _Group
-from libqtile.layout.base import Layout
+from libqtile.layout.base import Arrangement, Layout, Placement
 
 
 class _BspNode:
@@ -167,15 +167,27 @@ class Bsp(Layout):
         self.add_defaults(Bsp.defaults)
         self.root = _BspNode()
         self.current = self.root
+        self._nodes: dict[Window, _BspNode] = {}
+        self._geometry: ScreenRect | None = None
+        self._neighbours: dict[tuple[_BspNode, bool, bool], _BspNode | None] = {}
         if self.margin_on_single is None:
             self.margin_on_single = self.margin
 
+    def _invalidate(self) -> None:
+        """Forget the geometry and neighbours computed for the current tree"""
+        self._geometry = None
+        self._neighbours.clear()
+
+    def _set_client(self, node: _BspNode, client: Window) -> None:
+        node.client = client
+        self._nodes[client] = node
+
     def swap(self, c1: Window, c2: Window) -> None:
         node_c1 = self.get_node(c1)
         node_c2 = self.get_node(c2)
 
-        node_c1.client = c2
-        node_c2.client = c1
+        self._set_client(node_c1, c2)
+        self._set_client(node_c2, c1)
 
         self.group.layout_all()
 
@@ -183,6 +195,9 @@ class Bsp(Layout):
         c = Layout.clone(self, group)
         c.root = _BspNode()
         c.current = c.root
+        c._nodes = {}
+        c._geometry = None
+        c._neighbours = {}
         return c
 
     def get_windows(self):
@@ -193,9 +208,7 @@ class Bsp(Layout):
         return dict(name=self.name, clients=[c.name for c in self.root.clients()])
 
     def get_node(self, client):
-        for node in self.root:
-            if client is node.client:
-                return node
+        return self._nodes.get(client)
 
     def focus(self, client: Window) -> None:
         self.current = self.get_node(client)
@@ -203,12 +216,22 @@ class Bsp(Layout):
     def add_client(self, client: Window) -> None:
         node = self.root.get_shortest() if self.fair else self.current
         self.current = node.insert(client, int(self.lower_right), self.ratio)
+        self._nodes[client] = self.current
+        if self.current is not node:
+            # The client that was at node moved to the other child
+            sibling = node.children[1 - int(self.lower_right)]
+            self._nodes[sibling.client] = sibling
+        self._invalidate()
 
     def remove(self, client):
         node = self.get_node(client)
         if node:
+            del self._nodes[client]
+            self._invalidate()
             if node.parent:
                 node = node.parent.remove(node)
+                if node.client is not None:
+                    self._nodes[node.client] = node
                 newclient = next(node.clients(), None)
                 if newclient is None:
                     self.current = self.root
@@ -218,15 +241,19 @@ class Bsp(Layout):
             node.client = None
             self.current = self.root
 
-    def configure(self, client: Window, screen_rect: ScreenRect) -> None:
-        self.root.calc_geom(screen_rect.x, screen_rect.y, screen_rect.width, screen_rect.height)
-        node = self.get_node(client)
-        color = self.border_focus if client.has_focus else self.border_normal
-        border = 0 if node is self.root and not self.border_on_single else self.border_width
-        margin = self.margin_on_single if node is self.root else self.margin
-
-        if node is not None:
-            client.place(
+    def arrange(self, windows: Sequence[Window], screen_rect: ScreenRect) -> Arrangement:
+        if self._geometry != screen_rect:
+            self.root.calc_geom(
+                screen_rect.x, screen_rect.y, screen_rect.width, screen_rect.height
+            )
+            self._neighbours.clear()
+            self._geometry = screen_rect
+        arrangement: Arrangement = {}
+        for client, node in self._nodes.items():
+            color = self.border_focus if client.has_focus else self.border_normal
+            border = 0 if node is self.root and not self.border_on_single else self.border_width
+            margin = self.margin_on_single if node is self.root else self.margin
+            arrangement[client] = Placement(
                 node.x,
                 node.y,
                 node.w - 2 * border,
@@ -235,12 +262,13 @@ class Bsp(Layout):
                 color,
                 margin=margin,
             )
-        client.unhide()
+        return arrangement
 
     @expose_command()
     def toggle_split(self):
         if self.current.parent:
             self.current.parent.split_horizontal = not self.current.parent.split_horizontal
+            self._invalidate()
         self.group.layout_all()
 
     def focus_first(self) -> Window | None:
@@ -282,69 +310,62 @@ class Bsp(Layout):
         if client:
             self.group.focus(client, True)
 
-    def find_left(self):
+    def _split_ancestor(self, horizontal: bool, side: int) -> _BspNode | None:
+        """The closest ancestor of the current node that is split in the given
+        direction, with the current node on the given side of the split"""
         child = self.current
         parent = child.parent
         while parent:
-            if parent.split_horizontal and child is parent.children[1]:
-                neighbor = parent.children[0]
-                center = self.current.y + self.current.h * 0.5
-                while neighbor.client is None:
-                    if neighbor.split_horizontal or neighbor.children[1].y < center:
-                        neighbor = neighbor.children[1]
-                    else:
-                        neighbor = neighbor.children[0]
-                return neighbor
+            if parent.split_horizontal == horizontal and child is parent.children[side]:
+                return parent
             child = parent
             parent = child.parent
+        return None
 
-    def find_right(self):
-        child = self.current
-        parent = child.parent
-        while parent:
-            if parent.split_horizontal and child is parent.children[0]:
-                neighbor = parent.children[1]
+    def _find(self, horizontal: bool, forward: bool) -> _BspNode | None:
+        """The leaf next to the current one, to its right (or below it) if
+        forward, otherwise to its left (or above it)
+
+        Lookups are cached until the tree or its geometry changes.
+        """
+        key = (self.current, horizontal, forward)
+        if key in self._neighbours:
+            return self._neighbours[key]
+
+        side = 0 if forward else 1
+        parent = self._split_ancestor(horizontal, side)
+        neighbor = None
+        if parent is not None:
+            neighbor = parent.children[1 - side]
+            if horizontal:
                 center = self.current.y + self.current.h * 0.5
-                while neighbor.client is None:
-                    if neighbor.split_horizontal or neighbor.children[1].y > center:
-                        neighbor = neighbor.children[0]
-                    else:
-                        neighbor = neighbor.children[1]
-                return neighbor
-            child = parent
-            parent = child.parent
+            else:
+                center = self.current.x + self.current.w * 0.5
+            while neighbor.client is None:
+                if neighbor.split_horizontal == horizontal:
+                    # Take the half that is closest to the current node
+                    neighbor = neighbor.children[side]
+                    continue
+                second = neighbor.children[1]
+                pos = second.y if horizontal else second.x
+                if pos < center or (forward and pos == center):
+                    neighbor = second
+                else:
+                    neighbor = neighbor.children[0]
+        self._neighbours[key] = neighbor
+        return neighbor
+
+    def find_left(self):
+        return self._find(True, False)
+
+    def find_right(self):
+        return self._find(True, True)
 
     def find_up(self):
-        child = self.current
-        parent = child.parent
-        while parent:
-            if not parent.split_horizontal and child is parent.children[1]:
-                neighbor = parent.children[0]
-                center = self.current.x + self.current.w * 0.5
-                while neighbor.client is None:
-                    if not neighbor.split_horizontal or neighbor.children[1].x < center:
-                        neighbor = neighbor.children[1]
-                    else:
-                        neighbor = neighbor.children[0]
-                return neighbor
-            child = parent
-            parent = child.parent
+        return self._find(False, False)
 
     def find_down(self):
-        child = self.current
-        parent = child.parent
-        while parent:
-            if not parent.split_horizontal and child is parent.children[0]:
-                neighbor = parent.children[1]
-                center = self.current.x + self.current.w * 0.5
-                while neighbor.client is None:
-                    if not neighbor.split_horizontal or neighbor.children[1].x > center:
-                        neighbor = neighbor.children[0]
-                    else:
-                        neighbor = neighbor.children[1]
-                return neighbor
-            child = parent
-            parent = child.parent
+        return self._find(False, True)
 
     @expose_command()
     def left(self):
@@ -370,177 +391,91 @@ class Bsp(Layout):
         if node:
             self.group.focus(node.client, True)
 
-    @expose_command()
-    def shuffle_left(self):
-        node = self.find_left()
+    def _shuffle(self, node: _BspNode | None, horizontal: bool, forward: bool) -> None:
         if node:
-            node.client, self.current.client = self.current.client, node.client
+            client = self.current.client
+            self._set_client(self.current, node.client)
+            self._set_client(node, client)
             self.current = node
             self.group.layout_all()
         elif self.current is not self.root:
             node = self.current
             self.remove(node.client)
+            self._nodes[node.client] = node
             newroot = _BspNode()
-            newroot.split_horizontal = True
-            newroot.children = [node, self.root]
+            newroot.split_horizontal = horizontal
+            newroot.children = [self.root, node] if forward else [node, self.root]
             self.root.parent = newroot
             node.parent = newroot
             self.root = newroot
             self.current = node
+            self._invalidate()
             self.group.layout_all()
 
+    @expose_command()
+    def shuffle_left(self):
+        self._shuffle(self.find_left(), True, False)
+
     @expose_command()
     def shuffle_right(self):
-        node = self.find_right()
-        if node:
-            node.client, self.current.client = self.current.client, node.client
-            self.current = node
-            self.group.layout_all()
-        elif self.current is not self.root:
-            node = self.current
-            self.remove(node.client)
-            newroot = _BspNode()
-            newroot.split_horizontal = True
-            newroot.children = [self.root, node]
-            self.root.parent = newroot
-            node.parent = newroot
-            self.root = newroot
-            self.current = node
-            self.group.layout_all()
+        self._shuffle(self.find_right(), True, True)
 
     @expose_command()
     def shuffle_up(self):
-        node = self.find_up()
-        if node:
-            node.client, self.current.client = self.current.client, node.client
-            self.current = node
-            self.group.layout_all()
-        elif self.current is not self.root:
-            node = self.current
-            self.remove(node.client)
-            newroot = _BspNode()
-            newroot.split_horizontal = False
-            newroot.children = [node, self.root]
-            self.root.parent = newroot
-            node.parent = newroot
-            self.root = newroot
-            self.current = node
-            self.group.layout_all()
+        self._shuffle(self.find_up(), False, False)
 
     @expose_command()
     def shuffle_down(self):
-        node = self.find_down()
-        if node:
-            node.client, self.current.client = self.current.client, node.client
-            self.current = node
-            self.group.layout_all()
-        elif self.current is not self.root:
-            node = self.current
-            self.remove(node.client)
-            newroot = _BspNode()
-            newroot.split_horizontal = False
-            newroot.children = [self.root, node]
-            self.root.parent = newroot
-            node.parent = newroot
-            self.root = newroot
-            self.current = node
+        self._shuffle(self.find_down(), False, True)
+
+    def _grow(self, horizontal: bool, forward: bool) -> None:
+        parent = self._split_ancestor(horizontal, 0 if forward else 1)
+        if parent:
+            if forward:
+                parent.split_ratio = min(95, parent.split_ratio + self.grow_amount)
+            else:
+                parent.split_ratio = max(5, parent.split_ratio - self.grow_amount)
+            self._invalidate()
             self.group.layout_all()
 
     @expose_command()
     def grow_left(self):
-        child = self.current
-        parent = child.parent
-        while parent:
-            if parent.split_horizontal and child is parent.children[1]:
-                parent.split_ratio = max(5, parent.split_ratio - self.grow_amount)
-                self.group.layout_all()
-                break
-            child = parent
-            parent = child.parent
+        self._grow(True, False)
 
     @expose_command()
     def grow_right(self):
-        child = self.current
-        parent = child.parent
-        while parent:
-            if parent.split_horizontal and child is parent.children[0]:
-                parent.split_ratio = min(95, parent.split_ratio + self.grow_amount)
-                self.group.layout_all()
-                break
-            child = parent
-            parent = child.parent
+        self._grow(True, True)
 
     @expose_command()
     def grow_up(self):
-        child = self.current
-        parent = child.parent
-        while parent:
-            if not parent.split_horizontal and child is parent.children[1]:
-                parent.split_ratio = max(5, parent.split_ratio - self.grow_amount)
-                self.group.layout_all()
-                break
-            child = parent
-            parent = child.parent
+        self._grow(False, False)
 
     @expose_command()
     def grow_down(self):
-        child = self.current
-        parent = child.parent
-        while parent:
-            if not parent.split_horizontal and child is parent.children[0]:
-                parent.split_ratio = min(95, parent.split_ratio + self.grow_amount)
-                self.group.layout_all()
-                break
-            child = parent
-            parent = child.parent
+        self._grow(False, True)
+
+    def _flip(self, horizontal: bool, forward: bool) -> None:
+        parent = self._split_ancestor(horizontal, 0 if forward else 1)
+        if parent:
+            parent.children = parent.children[::-1]
+            self._invalidate()
+            self.group.layout_all()
 
     @expose_command()
     def flip_left(self):
-        child = self.current
-        parent = child.parent
-        while parent:
-            if parent.split_horizontal and child is parent.children[1]:
-                parent.children = parent.children[::-1]
-                self.group.layout_all()
-                break
-            child = parent
-            parent = child.parent
+        self._flip(True, False)
 
     @expose_command()
     def flip_right(self):
-        child = self.current
-        parent = child.parent
-        while parent:
-            if parent.split_horizontal and child is parent.children[0]:
-                parent.children = parent.children[::-1]
-                self.group.layout_all()
-                break
-            child = parent
-            parent = child.parent
+        self._flip(True, True)
 
     @expose_command()
     def flip_up(self):
-        child = self.current
-        parent = child.parent
-        while parent:
-            if not parent.split_horizontal and child is parent.children[1]:
-                parent.children = parent.children[::-1]
-                self.group.layout_all()
-                break
-            child = parent
-            parent = child.parent
+        self._flip(False, False)
 
     @expose_command()
     def flip_down(self):
-        child = self.current
-        parent = child.parent
-        while parent:
-            if not parent.split_horizontal and child is parent.children[0]:
-                parent.children = parent.children[::-1]
-                self.group.layout_all()
-                break
-            child = parent
-            parent = child.parent
+        self._flip(False, True)
 
     @expose_command()
     def normalize(self):
@@ -551,4 +486,5 @@ class Bsp(Layout):
                 distribute = False
         if distribute:
             self.root.distribute()
+        self._invalidate()
         self.group.layout_all()
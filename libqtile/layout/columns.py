@@ -1,10 +1,11 @@
+from collections.abc import Sequence
 from typing import Any, Self
 
 from libqtile.backend.base import Window
 from libqtile.command.base import expose_command
 from libqtile.config import ScreenRect
 from libqtile.group import _Group
-from libqtile.layout.base import Layout, _ClientList
+from libqtile.layout.base import Arrangement, Layout, Placement, _ClientList
 from libqtile.log_utils import logger
 
 
@@ -287,53 +288,45 @@ class Columns(Layout):
             self.remove_column(c)
         return self.columns[self.current].cw
 
-    def configure(self, client: Window, screen_rect: ScreenRect) -> None:
+    def arrange(self, windows: Sequence[Window], screen_rect: ScreenRect) -> Arrangement:
+        arrangement: Arrangement = dict.fromkeys(windows)
+        ncols = len(self.columns)
         pos = 0
         for col in self.columns:
-            if client in col:
-                break
-            pos += col.width
-        else:
-            client.hide()
-            return
-
-        if client.has_focus:
-            color = self.border_focus if col.split else self.border_focus_stack
-        else:
-            color = self.border_normal if col.split else self.border_normal_stack
-
-        is_single = len(self.columns) == 1 and (len(col) == 1 or not col.split)
-        border = self.single_border_width if is_single else self.border_width
-        margin_size = self.margin_on_single if is_single else self.margin
+            is_single = ncols == 1 and (len(col) == 1 or not col.split)
+            border = self.single_border_width if is_single else self.border_width
+            margin_size = self.margin_on_single if is_single else self.margin
 
-        width = int(0.5 + col.width * screen_rect.width * 0.01 / len(self.columns))
-        x = screen_rect.x + int(0.5 + pos * screen_rect.width * 0.01 / len(self.columns))
+            width = int(0.5 + col.width * screen_rect.width * 0.01 / ncols)
+            x = screen_rect.x + int(0.5 + pos * screen_rect.width * 0.01 / ncols)
+            pos += col.width
 
-        if col.split:
-            pos = 0
-            for c in col:
-                if client == c:
-                    break
-                pos += col.heights[c]
-            height = int(0.5 + col.heights[client] * screen_rect.height * 0.01 / len(col))
-            y = screen_rect.y + int(0.5 + pos * screen_rect.height * 0.01 / len(col))
-            client.place(
-                x, y, width - 2 * border, height - 2 * border, border, color, margin=margin_size
-            )
-            client.unhide()
-        elif client == col.cw:
-            client.place(
-                x,
-                screen_rect.y,
-                width - 2 * border,
-                screen_rect.height - 2 * border,
-                border,
-                color,
-                margin=margin_size,
-            )
-            client.unhide()
-        else:
-            client.hide()
+            hpos = 0
+            for client in col:
+                if client.has_focus:
+                    color = self.border_focus if col.split else self.border_focus_stack
+                else:
+                    color = self.border_normal if col.split else self.border_normal_stack
+                if col.split:
+                    height = int(0.5 + col.heights[client] * screen_rect.height * 0.01 / len(col))
+                    y = screen_rect.y + int(0.5 + hpos * screen_rect.height * 0.01 / len(col))
+                    hpos += col.heights[client]
+                elif client == col.cw:
+                    height = screen_rect.height
+                    y = screen_rect.y
+                else:
+                    arrangement[client] = None
+                    continue
+                arrangement[client] = Placement(
+                    x,
+                    y,
+                    width - 2 * border,
+                    height - 2 * border,
+                    border,
+                    color,
+                    margin=margin_size,
+                )
+        return arrangement
 
     def focus_first(self) -> Window | None:
         """Returns first client in first column of layout"""
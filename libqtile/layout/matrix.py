@@ -1,11 +1,12 @@
 import math
+from collections.abc import Sequence
 from typing import Any, Self
 
 from libqtile.backend.base import Window
 from libqtile.command.base import expose_command
 from libqtile.config import ScreenRect
 from libqtile.group import _Group
-from libqtile.layout.base import _SimpleLayoutBase
+from libqtile.layout.base import Arrangement, Placement, _SimpleLayoutBase
 
 
 class Matrix(_SimpleLayoutBase):
@@ -72,35 +73,33 @@ class Matrix(_SimpleLayoutBase):
         If needed a new row in matrix is created"""
         return self.clients.append(client)
 
-    def configure(self, client: Window, screen_rect: ScreenRect) -> None:
-        if client not in self.clients:
-            return
-        idx = self.clients.index(client)
-        row = idx // self.columns
-        col = idx % self.columns
+    def arrange(self, windows: Sequence[Window], screen_rect: ScreenRect) -> Arrangement:
+        arrangement: Arrangement = {}
+        if not self.clients:
+            return arrangement
         column_size = int(math.ceil(len(self.clients) / self.columns))
-        if client.has_focus:
-            px = self.border_focus
-        else:
-            px = self.border_normal
         # calculate position and size
         column_width = int(screen_rect.width / float(self.columns))
         row_height = int(screen_rect.height / float(column_size))
-        xoffset = screen_rect.x + col * column_width
-        yoffset = screen_rect.y + row * row_height
         win_width = column_width - 2 * self.border_width
         win_height = row_height - 2 * self.border_width
-        # place
-        client.place(
-            xoffset,
-            yoffset,
-            win_width,
-            win_height,
-            self.border_width,
-            px,
-            margin=self.margin,
-        )
-        client.unhide()
+        for idx, client in enumerate(self.clients):
+            row = idx // self.columns
+            col = idx % self.columns
+            if client.has_focus:
+                px = self.border_focus
+            else:
+                px = self.border_normal
+            arrangement[client] = Placement(
+                screen_rect.x + col * column_width,
+                screen_rect.y + row * row_height,
+                win_width,
+                win_height,
+                self.border_width,
+                px,
+                margin=self.margin,
+            )
+        return arrangement
 
     @expose_command()
     def previous(self) -> None:
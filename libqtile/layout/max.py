@@ -1,7 +1,9 @@
+from collections.abc import Sequence
+
 from libqtile.backend.base import Window
 from libqtile.command.base import expose_command
 from libqtile.config import ScreenRect
-from libqtile.layout.base import _SimpleLayoutBase
+from libqtile.layout.base import Arrangement, Placement, _SimpleLayoutBase
 
 
 class Max(_SimpleLayoutBase):
@@ -28,9 +30,13 @@ class Max(_SimpleLayoutBase):
     def add_client(self, client: Window) -> None:  # type: ignore[override]
         return super().add_client(client, 1)
 
-    def configure(self, client: Window, screen_rect: ScreenRect) -> None:
-        if not self.only_focused or (self.clients and client is self.clients.current_client):
-            client.place(
+    def arrange(self, windows: Sequence[Window], screen_rect: ScreenRect) -> Arrangement:
+        arrangement: Arrangement = dict.fromkeys(windows)
+        current = self.clients.current_client if self.clients else None
+        for client in windows:
+            if self.only_focused and client is not current:
+                continue
+            arrangement[client] = Placement(
                 screen_rect.x,
                 screen_rect.y,
                 screen_rect.width - self.border_width * 2,
@@ -38,17 +44,11 @@ class Max(_SimpleLayoutBase):
                 self.border_width,
                 self.border_focus if client.has_focus else self.border_normal,
                 margin=self.margin,
+                move_to_top=(
+                    not self.only_focused and client is current and len(self.clients) > 1
+                ),
             )
-            client.unhide()
-            if (
-                not self.only_focused
-                and self.clients
-                and client is self.clients.current_client
-                and len(self.clients) > 1
-            ):
-                client.move_to_top()
-        else:
-            client.hide()
+        return arrangement
 
     @expose_command("previous")
     def up(self):
@@ -1,5 +1,7 @@
+import bisect
 import contextlib
 import copy
+import functools
 import time
 from enum import Enum, Flag, auto
 from math import isclose
@@ -9,7 +11,7 @@ from libqtile import hook
 from libqtile.backend.base import Window
 from libqtile.command.base import expose_command
 from libqtile.hook import Hook, qtile_hooks
-from libqtile.layout.base import Layout
+from libqtile.layout.base import Layout, Placement
 
 plasma_hook = Hook(
     "plasma_add_mode",
@@ -83,6 +85,39 @@ border_check = {
 }
 
 
+# Attributes whose changes can move any node of a tree
+_TRACKED = frozenset(("_x", "_y", "_width", "_height", "_size", "parent", "payload"))
+_MISSING = object()
+
+# The edge of a leaf which borders a node in the given direction, and the edge
+# of that node it borders
+_EDGES = {
+    Direction.UP: (lambda n: n.y_end, lambda n: n.y),
+    Direction.DOWN: (lambda n: n.y, lambda n: n.y_end),
+    Direction.LEFT: (lambda n: n.x_end, lambda n: n.x),
+    Direction.RIGHT: (lambda n: n.x, lambda n: n.x_end),
+}
+
+
+def cached(func):
+    """Cache the value of a Node property until the next change to a tree"""
+    name = func.__name__
+
+    @functools.wraps(func)
+    def wrapper(self):
+        cache = self._cache
+        if self._cache_generation != Node.generation:
+            cache.clear()
+            self._cache_generation = Node.generation
+        try:
+            return cache[name]
+        except KeyError:
+            value = cache[name] = func(self)
+            return value
+
+    return wrapper
+
+
 def flatten(value):
     """Flattens a nested list of lists into a single list."""
     out = []
@@ -104,8 +139,15 @@ class Node:
     min_size_default = 100
     root_orient = Orient.HORIZONTAL
     priority = Priority.FIXED
+    # Incremented on every change to the size, position or structure of any
+    # tree. The size of a node depends on its siblings, its children and its
+    # parent's capacity, so a change anywhere can move every node in its tree
+    # and the cached geometry of all of them is discarded.
+    generation = 0
 
     def __init__(self, payload=None, x=None, y=None, width=None, height=None):
+        self._cache = {}
+        self._cache_generation = -1
         self.payload = payload
         self._x = x
         self._y = y
@@ -118,6 +160,11 @@ class Node:
         self.restorables = {}
         hook.subscribe.client_killed(self._clean_restorables)
 
+    def __setattr__(self, name, value):
+        if name in _TRACKED and self.__dict__.get(name, _MISSING) != value:
+            Node.generation += 1
+        super().__setattr__(name, value)
+
     def __repr__(self):
         info = self.payload or ""
         if self:
@@ -141,11 +188,13 @@ class Node:
 
     def __setitem__(self, key, value):
         self.children[key] = value
+        Node.generation += 1
 
     def __len__(self):
         return len(self.children)
 
     @property
+    @cached
     def root(self):
         try:
             # Walk way up the tree until we find the root
@@ -163,6 +212,7 @@ class Node:
         return not self.children
 
     @property
+    @cached
     def index(self):
         return self.parent.children.index(self)
 
@@ -214,12 +264,54 @@ class Node:
 
     @property
     def all_leafs(self):
+        return iter(self._leafs)
+
+    @property
+    @cached
+    def _leafs(self):
         if self.is_leaf:
-            yield self
-        for child in self:
-            yield from child.all_leafs
+            return (self,)
+        return tuple(leaf for child in self for leaf in child._leafs)
+
+    @property
+    @cached
+    def _payloads(self):
+        """The first node holding each payload, in depth first order"""
+        payloads = {}
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            payloads.setdefault(id(node.payload), node)
+            stack.extend(reversed(node.children))
+        return payloads
 
     @property
+    @cached
+    def _edges(self):
+        """The leaves sorted by the position of each edge, with their order"""
+        leafs = self._leafs
+        edges = {}
+        for direction, (edge, _) in _EDGES.items():
+            entries = sorted((edge(n), i) for i, n in enumerate(leafs))
+            edges[direction] = ([pos for pos, _ in entries], [i for _, i in entries])
+        return edges
+
+    def bordering_leafs(self, node, direction):
+        """Return leaves of this tree whose edges may touch the opposite edge of
+        node in the given direction, in tree order.
+
+        This is a superset of the leaves sharing a border with node.
+        """
+        positions, order = self._edges[direction]
+        pos = _EDGES[direction][1](node)
+        tolerance = 1e-8 * max(abs(pos), 1)
+        lo = bisect.bisect_left(positions, pos - tolerance)
+        hi = bisect.bisect_right(positions, pos + tolerance)
+        leafs = self._leafs
+        return [leafs[i] for i in sorted(order[lo:hi])]
+
+    @property
+    @cached
     def orient(self):
         if self.is_root:
             return self.root_orient
@@ -234,6 +326,7 @@ class Node:
         return self.orient is Orient.VERTICAL
 
     @property
+    @cached
     def x(self):
         if self.is_root:
             return self._x
@@ -248,6 +341,7 @@ class Node:
         self._x = val
 
     @property
+    @cached
     def y(self):
         if self.is_root:
             return self._y
@@ -266,6 +360,7 @@ class Node:
         return Point(self.x, self.y)
 
     @property
+    @cached
     def width(self):
         if self.is_root:
             return self._width
@@ -283,6 +378,7 @@ class Node:
             self.size = val
 
     @property
+    @cached
     def height(self):
         if self.is_root:
             return self._height
@@ -338,6 +434,7 @@ class Node:
         return self.width if self.horizontal else self.height
 
     @property
+    @cached
     def size(self):
         """Return amount of space taken in parent container."""
         if self.is_root:
@@ -372,6 +469,7 @@ class Node:
         self._size = val
 
     @property
+    @cached
     def size_offset(self):
         return sum(c.size for c in self.parent[: self.index])
 
@@ -411,6 +509,7 @@ class Node:
         return self._size is not None
 
     @property
+    @cached
     def min_size(self):
         if self.fixed:
             return self._size
@@ -420,6 +519,7 @@ class Node:
         return max(size, self.min_size_default)
 
     @property
+    @cached
     def min_size_bound(self):
         if self.is_leaf:
             return self.min_size_default
@@ -429,6 +529,7 @@ class Node:
         self._size = None
 
     @property
+    @cached
     def flexible(self):
         """
         A node is flexible if its size isn't (explicitly or implicitly)
@@ -488,7 +589,8 @@ class Node:
 
     def close_neighbor(self, direction):
         """Return visually adjacent leaf node in specified direction."""
-        nodes = [n for n in self.root.all_leafs if self.common_border(n, direction)]
+        candidates = self.root.bordering_leafs(self, direction)
+        nodes = [n for n in candidates if self.common_border(n, direction)]
         if not nodes:
             return None
         most_recent = max(nodes, key=lambda n: n.last_accessed)
@@ -520,6 +622,7 @@ class Node:
         if idx is None:
             idx = len(self)
         self.children.insert(idx, node)
+        Node.generation += 1
         node.parent = self
         if len(self) == 1:
             return
@@ -543,6 +646,7 @@ class Node:
         node._save_restore_state()  # pylint: disable=W0212
         node.force_size(0)
         self.children.remove(node)
+        Node.generation += 1
         if len(self) == 1:
             child = self[0]
             if self.is_root:
@@ -709,6 +813,8 @@ class Node:
         self.integrate(Direction.RIGHT)
 
     def find_payload(self, payload):
+        if self.is_root:
+            return self._payloads.get(id(payload))
         if self.payload is payload:
             return self
         for child in self:
@@ -948,31 +1054,36 @@ class Plasma(Layout):
         if payload is not None:
             payload.remove()
 
-    def configure(self, client, screen_rect):
+    def arrange(self, windows, screen_rect):
         self.root.x = screen_rect.x
         self.root.y = screen_rect.y
         self.root.width = screen_rect.width
         self.root.height = screen_rect.height
-        node = self.root.find_payload(client)
-        border_width = self.border_width_single if self.root.tree == [node] else self.border_width
-        border_color = getattr(
-            self,
-            "border_"
-            + ("focus" if client.has_focus else "normal")
-            + ("" if node.flexible else "_fixed"),
-        )
-        x, y, width, height = node.pixel_perfect
-        client.place(
-            x,
-            y,
-            width - 2 * border_width,
-            height - 2 * border_width,
-            border_width,
-            border_color,
-            margin=self.margin,
-        )
-        # Always keep tiles below floating windows
-        client.unhide()
+        arrangement = {}
+        # A single window, not in a sub-container
+        single = self.root[0] if len(self.root) == 1 and self.root[0].is_leaf else None
+        for node in self.root.all_leafs:
+            client = node.payload
+            if client is None:
+                continue
+            border_width = self.border_width_single if node is single else self.border_width
+            border_color = getattr(
+                self,
+                "border_"
+                + ("focus" if client.has_focus else "normal")
+                + ("" if node.flexible else "_fixed"),
+            )
+            x, y, width, height = node.pixel_perfect
+            arrangement[client] = Placement(
+                x,
+                y,
+                width - 2 * border_width,
+                height - 2 * border_width,
+                border_width,
+                border_color,
+                margin=self.margin,
+            )
+        return arrangement
 
     def focus(self, client):
         self.focused = client
@@ -1,10 +1,12 @@
 import math
+from collections.abc import Sequence
 from typing import Any, Self
 
 from libqtile.backend.base import Window
 from libqtile.command.base import expose_command
+from libqtile.config import ScreenRect
 from libqtile.group import _Group
-from libqtile.layout.base import _SimpleLayoutBase
+from libqtile.layout.base import Arrangement, Placement, _SimpleLayoutBase
 
 ROWCOL = 1  # do rows at a time left to right top down
 COLROW = 2  # do cols top to bottom, left to right
@@ -203,45 +205,45 @@ class RatioTile(_SimpleLayoutBase):
         self.dirty = True
         return _SimpleLayoutBase.remove(self, w)
 
-    def configure(self, win, screen):
+    def arrange(self, windows: Sequence[Window], screen_rect: ScreenRect) -> Arrangement:
+        if not self.clients:
+            return {}
         # force recalc
-        if not self.last_screen or self.last_screen != screen:
-            self.last_screen = screen
+        if not self.last_screen or self.last_screen != screen_rect:
+            self.last_screen = screen_rect
             self.dirty = True
         if self.last_size and not self.dirty:
-            if screen.width != self.last_size[0] or screen.height != self.last_size[1]:
+            if screen_rect.width != self.last_size[0] or screen_rect.height != self.last_size[1]:
                 self.dirty = True
         if self.dirty:
-            gi = GridInfo(self.ratio, len(self.clients), screen.width, screen.height)
-            self.last_size = (screen.width, screen.height)
+            gi = GridInfo(self.ratio, len(self.clients), screen_rect.width, screen_rect.height)
+            self.last_size = (screen_rect.width, screen_rect.height)
             if self.fancy:
                 method = gi.get_sizes_advanced
             else:
                 method = gi.get_sizes
 
-            self.layout_info = method(screen.width, screen.height, screen.x, screen.y)
+            self.layout_info = method(
+                screen_rect.width, screen_rect.height, screen_rect.x, screen_rect.y
+            )
 
             self.dirty = False
-        try:
-            idx = self.clients.index(win)
-        except ValueError:
-            win.hide()
-            return
-        x, y, w, h = self.layout_info[idx]
-        if win.has_focus:
-            bc = self.border_focus
-        else:
-            bc = self.border_normal
-        win.place(
-            x,
-            y,
-            w - self.border_width * 2,
-            h - self.border_width * 2,
-            self.border_width,
-            bc,
-            margin=self.margin,
-        )
-        win.unhide()
+        arrangement: Arrangement = dict.fromkeys(windows)
+        for win, (x, y, w, h) in zip(self.clients, self.layout_info):
+            if win.has_focus:
+                bc = self.border_focus
+            else:
+                bc = self.border_normal
+            arrangement[win] = Placement(
+                x,
+                y,
+                w - self.border_width * 2,
+                h - self.border_width * 2,
+                self.border_width,
+                bc,
+                margin=self.margin,
+            )
+        return arrangement
 
     @expose_command()
     def info(self) -> dict[str, Any]:
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from typing import Any
 
 from libqtile import hook
@@ -9,7 +9,7 @@ from libqtile.command.base import expose_command
 from libqtile.config import ScreenRect, _Match
 from libqtile.group import _Group
 from libqtile.layout import Columns, Max
-from libqtile.layout.base import Layout
+from libqtile.layout.base import Arrangement, Layout
 
 Rect = tuple[float, float, float, float]
 
@@ -208,6 +208,24 @@ class ScreenSplit(Layout):
     def show(self, _rect) -> None:
         self._set_hooks()
 
+    def arrange(self, windows: Sequence[Window], screen_rect: ScreenRect) -> Arrangement | None:
+        grouped: dict[Split, list[Window]] = {}
+        for client in windows:
+            if client not in self.layouts:
+                # see configure
+                self.layouts[client] = self.active_split
+            grouped.setdefault(self.layouts[client], []).append(client)
+
+        arrangement: Arrangement = {}
+        for split, wins in grouped.items():
+            rect = self._get_rect(split.rect, screen_rect)
+            sub = split.layout.arrange(wins, rect)
+            if sub is None:
+                # this split's layout can only be configured one window at a time
+                return None
+            arrangement.update(sub)
+        return arrangement
+
     def configure(self, client: Window, screen_rect: ScreenRect) -> None:
         if client not in self.layouts:
             # window hasn't been added to a layout yet. this can happen during
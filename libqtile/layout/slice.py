@@ -9,7 +9,7 @@ from libqtile.backend.base import Window
 from libqtile.command.base import expose_command
 from libqtile.config import ScreenRect
 from libqtile.group import _Group
-from libqtile.layout.base import Layout
+from libqtile.layout.base import Arrangement, Layout, Placement
 from libqtile.layout.max import Max
 
 
@@ -33,9 +33,10 @@ class Single(Layout):
             raise ValueError("Cannot remove, window not managed by layout")
         self.window = None
 
-    def configure(self, window, screen_rect):
-        if window is self.window:
-            window.place(
+    def arrange(self, windows: Sequence[Window], screen_rect: ScreenRect) -> Arrangement:
+        arrangement: Arrangement = dict.fromkeys(windows)
+        if self.window in arrangement:
+            arrangement[self.window] = Placement(
                 screen_rect.x,
                 screen_rect.y,
                 screen_rect.width,
@@ -43,9 +44,7 @@ class Single(Layout):
                 0,
                 None,
             )
-            window.unhide()
-        else:
-            window.hide()
+        return arrangement
 
     def empty(self):
         """Is the layout empty
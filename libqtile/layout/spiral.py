@@ -1,9 +1,11 @@
+from collections.abc import Sequence
 from typing import Any, Self
 
 from libqtile.backend.base import Window
 from libqtile.command.base import expose_command
+from libqtile.config import ScreenRect
 from libqtile.group import _Group
-from libqtile.layout.base import _SimpleLayoutBase
+from libqtile.layout.base import Arrangement, Placement, _SimpleLayoutBase
 from libqtile.log_utils import logger
 
 Rect = tuple[int, int, int, int]
@@ -130,56 +132,48 @@ class Spiral(_SimpleLayoutBase):
         self.dirty = True
         return _SimpleLayoutBase.remove(self, w)
 
-    def configure(self, win, screen):
+    def arrange(self, windows: Sequence[Window], screen_rect: ScreenRect) -> Arrangement:
         # force recalc
-        if not self.last_screen or self.last_screen != screen:
-            self.last_screen = screen
+        if not self.last_screen or self.last_screen != screen_rect:
+            self.last_screen = screen_rect
             self.dirty = True
 
         if self.last_size and not self.dirty:
-            if screen.width != self.last_size[0] or screen.height != self.last_size[1]:
+            if screen_rect.width != self.last_size[0] or screen_rect.height != self.last_size[1]:
                 self.dirty = True
 
         if self.dirty:
-            self.layout_info = self.get_spiral(screen.x, screen.y, screen.width, screen.height)
+            self.layout_info = self.get_spiral(
+                screen_rect.x, screen_rect.y, screen_rect.width, screen_rect.height
+            )
             self.dirty = False
 
-        try:
-            idx = self.clients.index(win)
-        except ValueError:
-            win.hide()
-            return
-
-        try:
-            x, y, w, h = self.layout_info[idx]
-        # IndexError will arise if we're unable to create a window due to the dimensions
-        # being too small. If that's the case, hide the window.
-        except IndexError:
-            win.hide()
-            return
-
-        if win.has_focus:
-            bc = self.border_focus
-        else:
-            bc = self.border_normal
-
-        (x, y, w, h), margins = self._fix_double_margins(x, y, w, h)
-
         if len(self.clients) == 1 and not self.border_on_single:
             border_width = 0
         else:
             border_width = self.border_width
 
-        win.place(
-            x,
-            y,
-            w - border_width * 2,
-            h - border_width * 2,
-            border_width,
-            bc,
-            margin=margins,
-        )
-        win.unhide()
+        # windows that aren't clients, or that we're unable to create due to the
+        # dimensions being too small, are hidden
+        arrangement: Arrangement = dict.fromkeys(windows)
+        for win, (x, y, w, h) in zip(self.clients, self.layout_info):
+            if win.has_focus:
+                bc = self.border_focus
+            else:
+                bc = self.border_normal
+
+            (x, y, w, h), margins = self._fix_double_margins(x, y, w, h)
+
+            arrangement[win] = Placement(
+                x,
+                y,
+                w - border_width * 2,
+                h - border_width * 2,
+                border_width,
+                bc,
+                margin=margins,
+            )
+        return arrangement
 
     def split_left(self, rect: Rect) -> tuple[Rect, Rect]:
         rect_x, rect_y, rect_w, rect_h = rect
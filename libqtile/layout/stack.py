@@ -1,10 +1,12 @@
+from collections.abc import Sequence
 from typing import Any, Self
 
 from libqtile.backend.base import Window
 from libqtile.command.base import expose_command
 from libqtile.config import ScreenRect
 from libqtile.group import _Group
-from libqtile.layout.base import Layout, _ClientList
+from libqtile.layout.base import Arrangement, Layout, Placement, _ClientList
+from libqtile.utils import ColorsType
 
 
 class _WinStack(_ClientList):
@@ -193,65 +195,44 @@ class Stack(Layout):
                 return n.cw
         return None
 
-    def configure(self, client: Window, screen_rect: ScreenRect) -> None:
-        # pylint: disable=undefined-loop-variable
-        # We made sure that self.stacks is not empty, so s is defined.
+    def arrange(self, windows: Sequence[Window], screen_rect: ScreenRect) -> Arrangement:
+        arrangement: Arrangement = dict.fromkeys(windows)
+        column_width = int(screen_rect.width / len(self.stacks))
+        window_width = column_width - 2 * self.border_width
         for i, s in enumerate(self.stacks):
-            if client in s:
-                break
-        else:
-            client.hide()
-            return
-
-        if client.has_focus:
-            if self.border_focus_stack:
-                if s.split:
-                    px = self.border_focus
-                else:
-                    px = self.border_focus_stack
-            else:
-                px = self.border_focus
-        else:
-            if self.border_normal_stack:
+            xoffset = screen_rect.x + i * column_width
+            if s.split:
+                column_height = int(screen_rect.height / len(s)) if len(s) else 0
+                window_height = column_height - 2 * self.border_width
+            for j, client in enumerate(s):
                 if s.split:
-                    px = self.border_normal
+                    yoffset = screen_rect.y + j * column_height
+                    height = window_height
+                elif client == s.cw:
+                    yoffset = screen_rect.y
+                    height = screen_rect.height - 2 * self.border_width
                 else:
-                    px = self.border_normal_stack
-            else:
-                px = self.border_normal
-
-        column_width = int(screen_rect.width / len(self.stacks))
-        xoffset = screen_rect.x + i * column_width
-        window_width = column_width - 2 * self.border_width
-
-        if s.split:
-            column_height = int(screen_rect.height / len(s))
-            window_height = column_height - 2 * self.border_width
-            yoffset = screen_rect.y + s.index(client) * column_height
-            client.place(
-                xoffset,
-                yoffset,
-                window_width,
-                window_height,
-                self.border_width,
-                px,
-                margin=self.margin,
-            )
-            client.unhide()
-        else:
-            if client == s.cw:
-                client.place(
+                    arrangement[client] = None
+                    continue
+                arrangement[client] = Placement(
                     xoffset,
-                    screen_rect.y,
+                    yoffset,
                     window_width,
-                    screen_rect.height - 2 * self.border_width,
+                    height,
                     self.border_width,
-                    px,
+                    self._border_color(client, s),
                     margin=self.margin,
                 )
-                client.unhide()
-            else:
-                client.hide()
+        return arrangement
+
+    def _border_color(self, client: Window, s: _WinStack) -> ColorsType:
+        if client.has_focus:
+            if self.border_focus_stack and not s.split:
+                return self.border_focus_stack
+            return self.border_focus
+        if self.border_normal_stack and not s.split:
+            return self.border_normal_stack
+        return self.border_normal
 
     def get_windows(self):
         return self.clients
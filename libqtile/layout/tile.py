@@ -1,10 +1,11 @@
+from collections.abc import Sequence
 from typing import Any, Self
 
 from libqtile.backend.base import Window
 from libqtile.command.base import expose_command
 from libqtile.config import ScreenRect, _Match
 from libqtile.group import _Group
-from libqtile.layout.base import _SimpleLayoutBase
+from libqtile.layout.base import Arrangement, Placement, _SimpleLayoutBase
 
 
 class Tile(_SimpleLayoutBase):
@@ -135,51 +136,42 @@ class Tile(_SimpleLayoutBase):
             super().add_client(client, offset_to_current)
         self.reset_master()
 
-    def configure(self, client: Window, screen_rect: ScreenRect) -> None:
+    def arrange(self, windows: Sequence[Window], screen_rect: ScreenRect) -> Arrangement:
+        arrangement: Arrangement = dict.fromkeys(windows)
+        if not self.clients:
+            return arrangement
         screen_width = screen_rect.width
         screen_height = screen_rect.height
-        border_width = self.border_width
-        if self.clients and client in self.clients:
-            pos = self.clients.index(client)
-            if client in self.master_windows:
-                w = (
-                    int(screen_width * self.ratio_size)
-                    if len(self.slave_windows) or not self.expand
-                    else screen_width
-                )
+        single = len(self.clients) == 1
+        border_width = 0 if not self.border_on_single and single else self.border_width
+        margin = 0 if not self.margin_on_single and single else self.margin
+        master_width = int(screen_width * self.ratio_size)
+        slaves = len(self.clients) - self.master_length
+        for pos, client in enumerate(self.clients):
+            if pos < self.master_length:
+                w = master_width if slaves > 0 or not self.expand else screen_width
                 h = screen_height // self.master_length
                 x = screen_rect.x
                 y = screen_rect.y + pos * h
             else:
-                w = screen_width - int(screen_width * self.ratio_size)
-                h = screen_height // (len(self.slave_windows))
-                x = screen_rect.x + int(screen_width * self.ratio_size)
-                sublist = self.clients[self.master_length :]
-                if client not in sublist:
-                    raise ValueError("Client not in layout. This shouldn't happen.")
-                y = screen_rect.y + sublist.index(client) * h
+                w = screen_width - master_width
+                h = screen_height // slaves
+                x = screen_rect.x + master_width
+                y = screen_rect.y + (pos - self.master_length) * h
             if client.has_focus:
                 bc = self.border_focus
             else:
                 bc = self.border_normal
-            if not self.border_on_single and len(self.clients) == 1:
-                border_width = 0
-            else:
-                border_width = self.border_width
-            client.place(
+            arrangement[client] = Placement(
                 x,
                 y,
                 w - border_width * 2,
                 h - border_width * 2,
                 border_width,
                 bc,
-                margin=0
-                if (not self.margin_on_single and len(self.clients) == 1)
-                else self.margin,
+                margin=margin,
             )
-            client.unhide()
-        else:
-            client.hide()
+        return arrangement
 
     @expose_command()
     def info(self) -> dict[str, Any]:
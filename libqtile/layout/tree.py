@@ -1,23 +1,37 @@
+import bisect
 from collections.abc import Sequence
-from typing import Any, Self
+from typing import Any, NamedTuple, Self
 
 from libqtile import hook
 from libqtile.backend import base
 from libqtile.command.base import expose_command
 from libqtile.config import ScreenRect
 from libqtile.group import _Group
-from libqtile.layout.base import Layout
+from libqtile.layout.base import Arrangement, Layout, Placement
 
 to_superscript = dict(zip(map(ord, "0123456789"), map(ord, "⁰¹²³⁴⁵⁶⁷⁸⁹")))
 
 
+class Row(NamedTuple):
+    """A horizontal band of the panel
+
+    The node is the Section or Window drawn in the band, or None for the
+    space below a section. The state holds everything the band's pixels
+    depend on, so a band only needs repainting when its state or position
+    changed.
+    """
+
+    top: int
+    height: int
+    node: "TreeNode | None"
+    state: tuple
+
+
 class TreeNode:
     def __init__(self):
         self.children = []
         self.parent = None
         self.expanded = True
-        self._children_top = None
-        self._children_bot = None
 
     def add_client(self, node, hint=None):
         """Add a node below this node
@@ -36,30 +50,18 @@ class TreeNode:
                 return
         self.children.append(node)
 
-    def draw(self, layout, top, level=0):
-        """Draw the node and its children to a layout
+    def add_rows(self, layout, top, level=0):
+        """Add the rows of the node and its children to a layout
 
-        Draws this node to the given layout (presumably a TreeTab), starting
-        from a y-offset of `top` and at the given level.
+        Adds the rows of this node to the given layout (presumably a TreeTab),
+        starting from a y-offset of `top` and at the given level. Returns the
+        y-offset below the last row.
         """
-        self._children_top = top
         if self.expanded:
             for i in self.children:
-                top = i.draw(layout, top, level)
-        self._children_bot = top
+                top = i.add_rows(layout, top, level)
         return top
 
-    def button_press(self, x, y):
-        """Returns self or sibling which got the click"""
-        # if we store the locations of each child, it would be possible to do
-        # this without having to traverse the tree...
-        if not (self._children_top <= y < self._children_bot):
-            return
-        for i in self.children:
-            res = i.button_press(x, y)
-            if res is not None:
-                return res
-
     def add_superscript(self, title):
         """Prepend superscript denoting the number of hidden children"""
         if not self.expanded and self.children:
@@ -195,36 +197,38 @@ class Section(TreeNode):
         super().__init__()
         self.title = title
 
-    def draw(self, layout, top, level=0):
-        layout._layout.reset_width()  # no centering
-        # draw a horizontal line above the section
-        layout._drawer.draw_hbar(layout.section_fg, 0, layout.panel_width, top, linewidth=1)
-        # draw the section title
-        layout._layout.font_size = layout.section_fontsize
-        layout._layout.text = self.add_superscript(self.title)
-        layout._layout.colour = layout.section_fg
-        layout._layout.draw(x=layout.section_left, y=top + layout.section_top)
-        top += layout._layout.height + layout.section_top + layout.section_padding
+    def add_rows(self, layout, top, level=0):
+        title = self.add_superscript(self.title)
+        # no width, so no centering
+        textlayout = layout._row_layout(self, title, layout.section_fontsize)
+        height = textlayout.height + layout.section_top + layout.section_padding
+        layout._add_row(self, top, height, ("section", title))
+        top += height
 
-        # run the TreeNode draw to draw children (if expanded)
-        top = super().draw(layout, top, level)
+        # run the TreeNode add_rows to add children (if expanded)
+        top = super().add_rows(layout, top, level)
 
+        layout._add_row(None, top, layout.section_bottom, ("space",))
         return top + layout.section_bottom
 
+    def draw(self, layout, row):
+        # draw a horizontal line above the section
+        layout._drawer.draw_hbar(layout.section_fg, 0, layout.panel_width, row.top, linewidth=1)
+        # draw the section title
+        textlayout = layout._row_layouts[self][-1]
+        textlayout.colour = layout.section_fg
+        textlayout.draw(x=layout.section_left, y=row.top + layout.section_top)
+
 
 class Window(TreeNode):
     def __init__(self, win):
         super().__init__()
         self.window = win
-        self._title_top = None
-
-    def draw(self, layout, top, level=0):
-        self._title_top = top
 
+    def add_rows(self, layout, top, level=0):
         # setup parameters for drawing self
         left = layout.padding_left + level * layout.level_shift
-        layout._layout.font_size = layout.fontsize
-        layout._layout.text = self.add_superscript(self.window.name)
+        title = self.add_superscript(self.window.name)
         if self.window is layout._focused:
             fg = layout.active_fg
             bg = layout.active_bg
@@ -234,25 +238,23 @@ class Window(TreeNode):
         else:
             fg = layout.inactive_fg
             bg = layout.inactive_bg
-        layout._layout.colour = fg
-        layout._layout.width = layout.panel_width - left
+        textlayout = layout._row_layout(self, title, layout.fontsize, layout.panel_width - left)
+        framed = textlayout.framed(layout.border_width, bg, layout.padding_x, layout.padding_y)
+        height = framed.height + layout.vspace + layout.border_width
+        layout._add_row(self, top, height, ("window", title, left, fg, bg))
+        top += height
+
+        # run the TreeNode add_rows to add children (if expanded)
+        return super().add_rows(layout, top, level + 1)
+
+    def draw(self, layout, row):
+        _, _, left, fg, bg = row.state
+        textlayout = layout._row_layouts[self][-1]
+        textlayout.colour = fg
         # get a text frame from the above
-        framed = layout._layout.framed(
-            layout.border_width, bg, layout.padding_x, layout.padding_y
-        )
+        framed = textlayout.framed(layout.border_width, bg, layout.padding_x, layout.padding_y)
         # draw the text frame at the given point
-        framed.draw_fill(left, top)
-
-        top += framed.height + layout.vspace + layout.border_width
-
-        # run the TreeNode draw to draw children (if expanded)
-        return super().draw(layout, top, level + 1)
-
-    def button_press(self, x, y):
-        """Returns self if clicked on title else returns sibling"""
-        if self._title_top <= y < self._children_top:
-            return self
-        return super().button_press(x, y)
+        framed.draw_fill(left, row.top)
 
     def remove(self) -> None:
         """Removes this Window
@@ -354,15 +356,30 @@ class TreeTab(Layout):
         self._focused = None
         self._panel = None
         self._drawer = None
-        self._layout = None
         self._tree = Root(self.sections)
         self._nodes = {}
+        self._panel_rect = None
+        # the rows of the panel, their tops for hit-testing, and a text
+        # layout for each section or window row
+        self._rows: list[Row] = []
+        self._row_tops: list[int] = []
+        self._row_layouts = {}
+        # the rows as they were last drawn, by top, and the bottom of the last
+        self._drawn: dict[int, Row] = {}
+        self._drawn_bottom = 0
 
     def clone(self, group: _Group) -> Self:
         c = Layout.clone(self, group)
         c._focused = None
         c._panel = None
         c._tree = Root(self.sections)
+        c._nodes = {}
+        c._panel_rect = None
+        c._rows = []
+        c._row_tops = []
+        c._row_layouts = {}
+        c._drawn = {}
+        c._drawn_bottom = 0
         return c
 
     def focus(self, win):
@@ -427,36 +444,109 @@ class TreeTab(Layout):
         )
         self._panel.keep_below(enable=True)
         self._create_drawer(screen_rect)
-        self._panel.process_window_expose = self.draw_panel
+        self._panel.process_window_expose = self._expose_panel
         self._panel.process_button_click = self.process_button_click
         hook.subscribe.client_name_updated(self.draw_panel)
         hook.subscribe.focus_change(self.draw_panel)
 
+    def _row_layout(self, node, text, font_size, width=None):
+        """The text layout of a row, set to the given text and width"""
+        cached = self._row_layouts.get(node)
+        if cached is None:
+            textlayout = self._drawer.textlayout(
+                text, "ffffff", self.font, font_size, self.fontshadow, wrap=False
+            )
+            if width is not None:
+                textlayout.width = width
+        else:
+            old_text, old_width, textlayout = cached
+            if text != old_text:
+                textlayout.text = text
+            if width != old_width:
+                textlayout.width = width
+        self._row_layouts[node] = (text, width, textlayout)
+        return textlayout
+
+    def _add_row(self, node, top, height, state):
+        if height > 0:
+            self._rows.append(Row(top, height, node, state))
+
+    def _clear_rows(self, top, height):
+        self._drawer.clear_rect(0, top, self.panel_width, height)
+        self._drawer.set_source_rgb(self.bg_color)
+        self._drawer.fillrect(0, top, self.panel_width, height)
+
+    def _draw_rows(self, top, bottom):
+        self._drawer.draw(
+            offsetx=0, offsety=top, width=self.panel_width, height=bottom - top, src_y=top
+        )
+
     def draw_panel(self, *args):
         if not self._panel:
             return
-        self._drawer.clear(self.bg_color)
-        self._tree.draw(self, 0)
-        self._drawer.draw(offsetx=0, width=self.panel_width)
+        self._rows = []
+        bottom = self._tree.add_rows(self, 0)
+        self._row_tops = [row.top for row in self._rows]
+
+        # drop the text layouts of removed or collapsed nodes
+        shown = {row.node for row in self._rows}
+        for node in self._row_layouts.keys() - shown:
+            self._row_layouts.pop(node)[-1].finalize()
+
+        # only repaint the rows that moved or changed since the last draw,
+        # copying each run of them to the panel before starting the next
+        run_top = run_bottom = None
+        for row in self._rows:
+            if self._drawn.get(row.top) == row:
+                if run_top is not None:
+                    self._draw_rows(run_top, run_bottom)
+                    run_top = None
+                continue
+            self._clear_rows(row.top, row.height)
+            if row.node is not None:
+                row.node.draw(self, row)
+            if run_top is None:
+                run_top = row.top
+            run_bottom = row.top + row.height
+        if bottom < self._drawn_bottom:
+            self._clear_rows(bottom, self._drawn_bottom - bottom)
+            if run_top is None:
+                run_top = bottom
+            run_bottom = self._drawn_bottom
+        if run_top is not None:
+            self._draw_rows(run_top, run_bottom)
+        self._drawn = {row.top: row for row in self._rows}
+        self._drawn_bottom = bottom
+
+    def _expose_panel(self):
+        # the panel's contents were lost, so repaint all of it
+        self._drawn = {}
+        self._drawn_bottom = self._drawer.height
+        self.draw_panel()
 
     def process_button_click(self, x, y, _buttom):
-        node = self._tree.button_press(x, y)
-        if node:
-            self.group.focus(node.window, False)
-
-    def configure(self, client: base.Window, screen_rect: ScreenRect) -> None:
-        if self._nodes and client is self._focused:
-            client.place(
+        idx = bisect.bisect_right(self._row_tops, y) - 1
+        if idx < 0:
+            return
+        row = self._rows[idx]
+        if isinstance(row.node, Window) and y < row.top + row.height:
+            self.group.focus(row.node.window, False)
+
+    def arrange(self, windows: Sequence[base.Window], screen_rect: ScreenRect) -> Arrangement:
+        arrangement: Arrangement = dict.fromkeys(windows)
+        if self._nodes and self._focused in arrangement:
+            arrangement[self._focused] = Placement(
                 screen_rect.x, screen_rect.y, screen_rect.width, screen_rect.height, 0, None
             )
-            client.unhide()
-        else:
-            client.hide()
+        return arrangement
 
     def finalize(self) -> None:
         if self._panel:
             self._panel.kill()
         Layout.finalize(self)
+        for _, _, textlayout in self._row_layouts.values():
+            textlayout.finalize()
+        self._row_layouts = {}
         if self._drawer is not None:
             self._drawer.finalize()
 
@@ -710,10 +800,13 @@ class TreeTab(Layout):
                 self.panel_width,
                 screen_rect.height,
             )
-        self._drawer.clear(self.bg_color)
-        self._layout = self._drawer.textlayout(
-            "", "ffffff", self.font, self.fontsize, self.fontshadow, wrap=False
-        )
+            # the text layouts belong to the old drawer, and nothing has been
+            # drawn to the new one yet
+            for _, _, textlayout in self._row_layouts.values():
+                textlayout.finalize()
+            self._row_layouts = {}
+            self._drawn = {}
+            self._drawn_bottom = self._drawer.height
 
     def layout(self, windows: Sequence[base.Window], screen_rect: ScreenRect) -> None:
         if self.place_right:
@@ -725,8 +818,10 @@ class TreeTab(Layout):
 
     def _resize_panel(self, screen_rect):
         if self._panel:
-            self._panel.place(
-                screen_rect.x, screen_rect.y, screen_rect.width, screen_rect.height, 0, None
-            )
-            self._create_drawer(screen_rect)
+            if screen_rect != self._panel_rect:
+                self._panel.place(
+                    screen_rect.x, screen_rect.y, screen_rect.width, screen_rect.height, 0, None
+                )
+                self._create_drawer(screen_rect)
+                self._panel_rect = screen_rect
             self.draw_panel()
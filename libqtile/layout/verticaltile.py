@@ -1,9 +1,11 @@
+from collections.abc import Sequence
 from typing import Self
 
 from libqtile.backend.base import Window
 from libqtile.command.base import expose_command
+from libqtile.config import ScreenRect
 from libqtile.group import _Group
-from libqtile.layout.base import _SimpleLayoutBase
+from libqtile.layout.base import Arrangement, Placement, _SimpleLayoutBase
 
 
 class VerticalTile(_SimpleLayoutBase):
@@ -101,40 +103,46 @@ class VerticalTile(_SimpleLayoutBase):
         c.maximized = None
         return c
 
-    def configure(self, window, screen_rect):
-        if self.clients and window in self.clients:
-            n = len(self.clients)
-            index = self.clients.index(window)
+    def arrange(self, windows: Sequence[Window], screen_rect: ScreenRect) -> Arrangement:
+        arrangement: Arrangement = dict.fromkeys(windows)
+        n = len(self.clients)
+        if not n:
+            return arrangement
 
-            # border
-            border_width = self.border_width if n > 1 else self.single_border_width
-            border_color = self.border_focus if window.has_focus else self.border_normal
+        # border
+        border_width = self.border_width if n > 1 else self.single_border_width
+
+        # margin
+        margin = self.margin if n > 1 else self.single_margin
+
+        # width
+        width = screen_rect.width - border_width * 2
+
+        if n > 1:
+            main_area_height = int(screen_rect.height * self.ratio)
+            sec_area_height = screen_rect.height - main_area_height
 
-            # margin
-            margin = self.margin if n > 1 else self.single_margin
+            main_pane_height = main_area_height - border_width * 2
+            sec_pane_height = sec_area_height // (n - 1) - border_width * 2
+            normal_pane_height = (screen_rect.height // n) - (border_width * 2)
+            if self.maximized:
+                maximized_index = self.clients.index(self.maximized)
 
-            # width
-            width = screen_rect.width - border_width * 2
+        for index, window in enumerate(self.clients):
+            border_color = self.border_focus if window.has_focus else self.border_normal
 
             # y
             y = screen_rect.y
 
             # height
             if n > 1:
-                main_area_height = int(screen_rect.height * self.ratio)
-                sec_area_height = screen_rect.height - main_area_height
-
-                main_pane_height = main_area_height - border_width * 2
-                sec_pane_height = sec_area_height // (n - 1) - border_width * 2
-                normal_pane_height = (screen_rect.height // n) - (border_width * 2)
-
                 if self.maximized:
                     y += (index * sec_pane_height) + (border_width * 2 * index)
                     if window is self.maximized:
                         height = main_pane_height
                     else:
                         height = sec_pane_height
-                        if index > self.clients.index(self.maximized):
+                        if index > maximized_index:
                             y = y - sec_pane_height + main_pane_height
                 else:
                     height = normal_pane_height
@@ -142,12 +150,10 @@ class VerticalTile(_SimpleLayoutBase):
             else:
                 height = screen_rect.height - 2 * border_width
 
-            window.place(
+            arrangement[window] = Placement(
                 screen_rect.x, y, width, height, border_width, border_color, margin=margin
             )
-            window.unhide()
-        else:
-            window.hide()
+        return arrangement
 
     def _grow(self):
         if self.ratio + self.steps < 1:
@@ -1,12 +1,13 @@
 import math
 from collections import namedtuple
+from collections.abc import Sequence
 from typing import Any, Self
 
 from libqtile.backend.base import Window
 from libqtile.command.base import expose_command
 from libqtile.config import ScreenRect
 from libqtile.group import _Group
-from libqtile.layout.base import _SimpleLayoutBase
+from libqtile.layout.base import Arrangement, Placement, _SimpleLayoutBase
 
 
 class MonadTall(_SimpleLayoutBase):
@@ -357,46 +358,46 @@ class MonadTall(_SimpleLayoutBase):
             self._maximize_secondary()
         self.group.layout_all()
 
-    def configure(self, client: Window, screen_rect: ScreenRect) -> None:
-        "Position client based on order and sizes"
+    def arrange(self, windows: Sequence[Window], screen_rect: ScreenRect) -> Arrangement:
+        "Position clients based on order and sizes"
         self.screen_rect = screen_rect
 
         # if no sizes or normalize flag is set, normalize
         if not self.relative_sizes or self.do_normalize:
             self.normalize(False)
 
-        # if client not in this layout
-        if not self.clients or client not in self.clients:
-            client.hide()
-            return
-
-        # determine focus border-color
-        if client.has_focus:
-            px = self.border_focus
-        else:
-            px = self.border_normal
+        # windows not in this layout are hidden
+        arrangement: Arrangement = dict.fromkeys(windows)
 
         # single client - fullscreen
         if len(self.clients) == 1:
-            client.place(
+            client = self.clients[0]
+            arrangement[client] = Placement(
                 self.screen_rect.x,
                 self.screen_rect.y,
                 self.screen_rect.width - 2 * self.single_border_width,
                 self.screen_rect.height - 2 * self.single_border_width,
                 self.single_border_width,
-                px,
+                self.border_focus if client.has_focus else self.border_normal,
                 margin=self.single_margin,
             )
-            client.unhide()
-            return
-        cidx = self.clients.index(client)
-        self._configure_specific(client, screen_rect, px, cidx)
-        client.unhide()
-
-    def _configure_specific(self, client, screen_rect, px, cidx):
-        """Specific configuration for xmonad tall."""
-        self.screen_rect = screen_rect
-
+            return arrangement
+
+        # sum of the relative sizes of the secondary clients before this one
+        above = 0
+        for cidx, client in enumerate(self.clients):
+            # determine focus border-color
+            if client.has_focus:
+                px = self.border_focus
+            else:
+                px = self.border_normal
+            arrangement[client] = self._arrange_specific(client, px, cidx, above)
+            if cidx > 0:
+                above += self.relative_sizes[cidx - 1]
+        return arrangement
+
+    def _arrange_specific(self, client, px, cidx, above):
+        """Specific placement for xmonad tall."""
         # calculate main/secondary pane size
         width_main = int(self.screen_rect.width * self.ratio)
         width_shared = self.screen_rect.width - width_main
@@ -422,9 +423,7 @@ class MonadTall(_SimpleLayoutBase):
             # secondary client
             width = width_shared - 2 * self.border_width
             # ypos is the sum of all clients above it
-            ypos = self.screen_rect.y + self._get_absolute_size_from_relative(
-                sum(self.relative_sizes[: cidx - 1])
-            )
+            ypos = self.screen_rect.y + self._get_absolute_size_from_relative(above)
             # get height from precalculated height list
             height = self._get_absolute_size_from_relative(self.relative_sizes[cidx - 1])
             # fix double margin
@@ -432,7 +431,7 @@ class MonadTall(_SimpleLayoutBase):
                 ypos -= self.margin
                 height += self.margin
             # place client based on calculated dimensions
-            client.place(
+            return Placement(
                 xpos,
                 ypos,
                 width,
@@ -443,7 +442,7 @@ class MonadTall(_SimpleLayoutBase):
             )
         else:
             # main client
-            client.place(
+            return Placement(
                 xpos,
                 self.screen_rect.y,
                 width_main,
@@ -965,10 +964,8 @@ class MonadWide(MonadTall):
         else:
             self._grow_secondary(maxed_size)
 
-    def _configure_specific(self, client, screen_rect, px, cidx):
-        """Specific configuration for xmonad wide."""
-        self.screen_rect = screen_rect
-
+    def _arrange_specific(self, client, px, cidx, above):
+        """Specific placement for xmonad wide."""
         # calculate main/secondary column widths
         height_main = int(self.screen_rect.height * self.ratio)
         height_shared = self.screen_rect.height - height_main
@@ -994,9 +991,7 @@ class MonadWide(MonadTall):
             # secondary client
             height = height_shared - 2 * self.border_width
             # xpos is the sum of all clients left of it
-            xpos = self.screen_rect.x + self._get_absolute_size_from_relative(
-                sum(self.relative_sizes[: cidx - 1])
-            )
+            xpos = self.screen_rect.x + self._get_absolute_size_from_relative(above)
             # get width from precalculated width list
             width = self._get_absolute_size_from_relative(self.relative_sizes[cidx - 1])
             # fix double margin
@@ -1004,7 +999,7 @@ class MonadWide(MonadTall):
                 xpos -= self.margin
                 width += self.margin
             # place client based on calculated dimensions
-            client.place(
+            return Placement(
                 xpos,
                 ypos,
                 width - 2 * self.border_width,
@@ -1015,7 +1010,7 @@ class MonadWide(MonadTall):
             )
         else:
             # main client
-            client.place(
+            return Placement(
                 self.screen_rect.x,
                 ypos,
                 self.screen_rect.width,
@@ -1213,17 +1208,17 @@ class MonadThreeCol(MonadTall):
             self.do_normalize = True
         self._screen_rect = value
 
-    def _configure_specific(self, client, screen_rect, border_color, index):
-        """Specific configuration for xmonad three columns."""
+    def _arrange_specific(self, client, border_color, index, above):
+        """Specific placement for xmonad three columns."""
         if index == 0:
-            self._configure_main(client)
+            return self._arrange_main(client)
         elif self._get_column(index - 1).name == "left":
-            self._configure_left(client, index)
+            return self._arrange_left(client, index)
         else:
-            self._configure_right(client, index)
+            return self._arrange_right(client, index)
 
-    def _configure_main(self, client):
-        """Configure the main client"""
+    def _arrange_main(self, client):
+        """Place the main client"""
         width = self._get_main_width()
         height = self.screen_rect.height
         left = self.screen_rect.x
@@ -1232,10 +1227,10 @@ class MonadThreeCol(MonadTall):
         if self.main_centered and len(self.clients) > 2:
             left += (self.screen_rect.width - width) // 2
 
-        self._place_client(client, left, top, width, height)
+        return self._placement(client, left, top, width, height)
 
-    def _configure_left(self, client, index):
-        """Configure the left column"""
+    def _arrange_left(self, client, index):
+        """Place a client of the left column"""
         width = self._get_secondary_widths()[0]
         height = self._get_secondary_height(index)
         left = self.screen_rect.x
@@ -1244,16 +1239,16 @@ class MonadThreeCol(MonadTall):
         if not self.main_centered or len(self.clients) == 2:
             left += self._get_main_width()
 
-        self._place_client(client, left, top, width, height)
+        return self._placement(client, left, top, width, height)
 
-    def _configure_right(self, client, index):
-        """Configure the right column"""
+    def _arrange_right(self, client, index):
+        """Place a client of the right column"""
         widths = self._get_secondary_widths()
         height = self._get_secondary_height(index)
         left = self.screen_rect.x + widths[0] + self._get_main_width()
         top = self.screen_rect.y + self._get_relative_sizes_above(index)
 
-        self._place_client(client, left, top, widths[1], height)
+        return self._placement(client, left, top, widths[1], height)
 
     def _get_main_width(self):
         """Calculate the main client's width"""
@@ -1276,8 +1271,8 @@ class MonadThreeCol(MonadTall):
         column = self._get_column(index - 1)
         return sum(self.relative_sizes[column.start : index - 1])
 
-    def _place_client(self, client, left, top, width, height):
-        """Place a client on the screen
+    def _placement(self, client, left, top, width, height):
+        """Compute the placement of a client on the screen
 
         Will prevent double margins by applying east and south margins only
         when the client is the rightmost or the bottommost window.
@@ -1298,7 +1293,7 @@ class MonadThreeCol(MonadTall):
         if not bottommost:
             margin[2] = 0
 
-        client.place(
+        return Placement(
             left,
             top,
             width - 2 * self.border_width,
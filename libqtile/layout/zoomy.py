@@ -1,8 +1,10 @@
+from collections.abc import Sequence
+
 import libqtile
 from libqtile.backend.base import Window
 from libqtile.command.base import expose_command
 from libqtile.config import ScreenRect
-from libqtile.layout.base import _SimpleLayoutBase
+from libqtile.layout.base import Arrangement, Placement, _SimpleLayoutBase
 
 
 class Zoomy(_SimpleLayoutBase):
@@ -23,47 +25,28 @@ class Zoomy(_SimpleLayoutBase):
     def add_client(self, client: Window) -> None:  # type: ignore[override]
         self.clients.append_head(client)
 
-    def configure(self, client: Window, screen_rect: ScreenRect) -> None:
+    def arrange(self, windows: Sequence[Window], screen_rect: ScreenRect) -> Arrangement:
+        arrangement: Arrangement = {}
         left, right = screen_rect.hsplit(screen_rect.width - self.columnwidth)
-        if client is self.clients.current_client:
-            client.place(
-                left.x,
-                left.y,
-                left.width,
-                left.height,
-                0,
-                None,
-                margin=self.margin,
-            )
+        h = right.width * left.height // left.width
+        focused_index = self.clients.current_index
+        if len(self.clients) < 2 or h * (len(self.clients) - 1) < right.height:
+            step = h
         else:
-            h = right.width * left.height // left.width
-            client_index = self.clients.index(client)
-            focused_index = self.clients.current_index
+            step = (right.height - h) // (len(self.clients) - 1)
+        for client_index, client in enumerate(self.clients):
+            if client is self.clients.current_client:
+                arrangement[client] = Placement(
+                    left.x, left.y, left.width, left.height, 0, None, margin=self.margin
+                )
+                continue
             offset = client_index - focused_index - 1
             if offset < 0:
                 offset += len(self.clients)
-            if h * (len(self.clients) - 1) < right.height:
-                client.place(
-                    right.x,
-                    right.y + h * offset,
-                    right.width,
-                    h,
-                    0,
-                    None,
-                    margin=self.margin,
-                )
-            else:
-                hh = (right.height - h) // (len(self.clients) - 1)
-                client.place(
-                    right.x,
-                    right.y + hh * offset,
-                    right.width,
-                    h,
-                    0,
-                    None,
-                    margin=self.margin,
-                )
-        client.unhide()
+            arrangement[client] = Placement(
+                right.x, right.y + step * offset, right.width, h, 0, None, margin=self.margin
+            )
+        return arrangement
 
     def focus(self, win):
         if self.property_name and libqtile.qtile.core.name != "x11":
@@ -0,0 +1,165 @@
+"""
+Record how long the callbacks run by qtile's event loop take
+
+Profiling is off by default and costs a single attribute check per callback
+when off. Once enabled (see the ``profiling_toggle`` command), the X11 event
+handlers, hooks, IPC commands and everything scheduled through
+``Qtile.call_soon``/``call_later`` are timed, grouped by category and
+handler name. Anything running for longer than the stall threshold is logged
+as blocking the event loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import bisect
+import functools
+import time
+from typing import TYPE_CHECKING
+
+from libqtile.log_utils import logger
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from typing import Any
+
+# Upper bounds, in seconds, of the latency histogram buckets. A last bucket
+# counts everything slower than the last bound.
+BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5)
+
+# Categories whose handlers run in the event loop's thread, and so can stall it
+_BLOCKING = ("loop", "x11", "hook", "command")
+
+# How often the event loop lag is measured
+LAG_INTERVAL = 0.25
+
+
+def handler_name(func: Callable) -> str:
+    """A readable name for a callback"""
+    while isinstance(func, functools.partial):
+        func = func.func
+    module = getattr(func, "__module__", None)
+    name = getattr(func, "__qualname__", None) or repr(func)
+    return f"{module}.{name}" if module else name
+
+
+def bucket_label(index: int) -> str:
+    if index == len(BUCKETS):
+        return f">{BUCKETS[-1] * 1000:g}ms"
+    return f"<={BUCKETS[index] * 1000:g}ms"
+
+
+class HandlerStats:
+    __slots__ = ("calls", "total", "max", "histogram")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.histogram = [0] * (len(BUCKETS) + 1)
+
+    def add(self, elapsed: float) -> None:
+        self.calls += 1
+        self.total += elapsed
+        if elapsed > self.max:
+            self.max = elapsed
+        self.histogram[bisect.bisect_left(BUCKETS, elapsed)] += 1
+
+    def info(self) -> dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "total": self.total,
+            "mean": self.total / self.calls if self.calls else 0.0,
+            "max": self.max,
+            "histogram": {
+                bucket_label(i): count for i, count in enumerate(self.histogram) if count
+            },
+        }
+
+
+class Profiler:
+    def __init__(self) -> None:
+        self.enabled = False
+        self.stall_threshold = 0.1
+        self.stalls = 0
+        self.handlers: dict[tuple[str, str], HandlerStats] = {}
+        self.started = 0.0
+        self._lag_handle: asyncio.TimerHandle | None = None
+
+    def enable(
+        self,
+        enabled: bool = True,
+        stall_threshold: float | None = None,
+        loop: asyncio.AbstractEventLoop | None = None,
+    ) -> None:
+        """Start or stop profiling
+
+        Recorded data is discarded when (re)starting. If a loop is given, its
+        lag (how late it runs a callback scheduled at a known time) is also
+        measured, which catches stalls in callbacks that aren't instrumented.
+        """
+        if self._lag_handle is not None:
+            self._lag_handle.cancel()
+            self._lag_handle = None
+        self.enabled = enabled
+        if stall_threshold is not None:
+            self.stall_threshold = stall_threshold
+        if not enabled:
+            return
+        self.handlers = {}
+        self.stalls = 0
+        self.started = time.monotonic()
+        if loop is not None:
+            self._schedule_lag_check(loop)
+
+    def _schedule_lag_check(self, loop: asyncio.AbstractEventLoop) -> None:
+        self._lag_handle = loop.call_later(
+            LAG_INTERVAL, self._check_lag, loop, loop.time() + LAG_INTERVAL
+        )
+
+    def _check_lag(self, loop: asyncio.AbstractEventLoop, expected: float) -> None:
+        lag = max(loop.time() - expected, 0.0)
+        self.handlers.setdefault(("loop", "lag"), HandlerStats()).add(lag)
+        if lag > self.stall_threshold:
+            self.stalls += 1
+            logger.warning("The event loop was stalled for %.1fms", lag * 1000)
+        self._schedule_lag_check(loop)
+
+    def record(self, category: str, name: str, elapsed: float) -> None:
+        stats = self.handlers.get((category, name))
+        if stats is None:
+            stats = self.handlers[(category, name)] = HandlerStats()
+        stats.add(elapsed)
+        if elapsed > self.stall_threshold and category in _BLOCKING:
+            self.stalls += 1
+            logger.warning(
+                "%s handler %s blocked the event loop for %.1fms",
+                category,
+                name,
+                elapsed * 1000,
+            )
+
+    def call(self, category: str, name: str, func: Callable, *args: Any, **kwargs: Any) -> Any:
+        """Call func, recording the time it took"""
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            self.record(category, name, time.perf_counter() - start)
+
+    def info(self) -> dict[str, Any]:
+        handlers = [
+            {"category": category, "name": name, **stats.info()}
+            for (category, name), stats in self.handlers.items()
+        ]
+        handlers.sort(key=lambda h: h["total"], reverse=True)
+        return {
+            "enabled": self.enabled,
+            "duration": time.monotonic() - self.started if self.enabled else 0.0,
+            "stall_threshold": self.stall_threshold,
+            "stalls": self.stalls,
+            "handlers": handlers,
+        }
+
+
+profiler = Profiler()
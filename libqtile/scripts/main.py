@@ -13,6 +13,7 @@ from libqtile.scripts import (
     run_cmd,
     shell,
     start,
+    subscribe,
     top,
     x11_identify_output,
 )
@@ -59,6 +60,7 @@ def main():
     migrate.add_subcommand(subparsers, [parent_parser])
     launch.add_subcommand(subparsers, [parent_parser])
     repl.add_subcommand(subparsers, [parent_parser])
+    subscribe.add_subcommand(subparsers, [parent_parser])
     x11_identify_output.add_subcommand(subparsers, [parent_parser])
 
     # `qtile help` should print help
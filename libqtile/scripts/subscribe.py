@@ -0,0 +1,61 @@
+"""
+Print the events of qtile hooks as they are fired, one JSON object per line
+"""
+
+import json
+import sys
+
+from libqtile import hook, ipc
+from libqtile.command.base import CommandError
+from libqtile.command.interface import IPCCommandInterface
+
+
+def subscribe(opts) -> None:
+    if opts.socket is None:
+        socket = ipc.find_sockfile()
+    else:
+        socket = opts.socket
+
+    with ipc.PersistentClient(socket) as client:
+        cmd_object = IPCCommandInterface(client)
+        try:
+            for event in cmd_object.subscribe(
+                opts.hooks, maxsize=opts.buffer_size, policy=opts.policy
+            ):
+                print(json.dumps(event), flush=True)
+        except CommandError as e:
+            print(e, file=sys.stderr)
+            sys.exit(1)
+        except KeyboardInterrupt:
+            pass
+
+
+def add_subcommand(subparsers, parents):
+    parser = subparsers.add_parser(
+        "subscribe",
+        parents=parents,
+        help="Print the events of the given hooks as they are fired.",
+    )
+    parser.add_argument("-s", "--socket", help="Use specified socket for IPC.")
+    parser.add_argument(
+        "-b",
+        "--buffer-size",
+        type=int,
+        default=256,
+        help="Number of events buffered by qtile while they are not read.",
+    )
+    parser.add_argument(
+        "-p",
+        "--policy",
+        choices=ipc.STREAM_POLICIES,
+        default=ipc.DROP_OLDEST,
+        help="What to do with new events when the buffer is full.",
+    )
+    parser.add_argument(
+        "hooks",
+        nargs="+",
+        metavar="hook",
+        choices=sorted(hook.subscribe.hooks),
+        help="Name of a hook to subscribe to, e.g. focus_change.",
+    )
+    parser.set_defaults(func=subscribe)
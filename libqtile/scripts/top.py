@@ -118,8 +118,70 @@ def raw_stats(c, group_by="lineno", limit=10):
     print(f"Total allocated size: {total / 1024.0:.1f} KiB")
 
 
+def get_profile(c):
+    profile = c.get_profile()
+    if not profile["enabled"]:
+        c.profiling_toggle()
+        profile = c.get_profile()
+    return profile
+
+
+def format_handler(index, handler):
+    name = f"{handler['category']}: {handler['name']}"
+    return (
+        f"{index:<3} {name[-50:]:<50} {handler['calls']:>8} "
+        f"{handler['total'] * 1000:>10.1f} {handler['mean'] * 1000:>8.2f} "
+        f"{handler['max'] * 1000:>8.1f}"
+    )
+
+
+PROFILE_HEADER = "{:<3s} {:<50s} {:>8s} {:>10s} {:>8s} {:>8s}".format(
+    "#", "Handler", "Calls", "Total ms", "Mean ms", "Max ms"
+)
+
+
+def get_profile_stats(scr, c, limit=10, seconds=1.5):
+    (max_y, max_x) = scr.getmaxyx()
+    while True:
+        profile = get_profile(c)
+        scr.addstr(
+            0,
+            0,
+            f"Qtile - Top {limit} handlers over {profile['duration']:.0f}s, "
+            f"{profile['stalls']} stalls over {profile['stall_threshold'] * 1000:g}ms",
+        )
+        scr.addstr(
+            1, 0, PROFILE_HEADER.ljust(max_x - 1)[: max_x - 1], curses.A_BOLD | curses.A_REVERSE
+        )
+        for index, handler in enumerate(profile["handlers"][:limit], 1):
+            scr.addstr(index + 1, 0, format_handler(index, handler)[: max_x - 1])
+
+        scr.move(max_y - 2, max_y - 2)
+        scr.refresh()
+        time.sleep(seconds)
+        scr.erase()
+
+
+def raw_profile(c, limit=10, seconds=1.5):
+    if not c.get_profile()["enabled"]:
+        # Profiling is turned off again on exit, so record for a while first
+        c.profiling_toggle()
+        time.sleep(seconds)
+    profile = get_profile(c)
+    print(
+        f"Qtile - Top {limit} handlers over {profile['duration']:.0f}s, "
+        f"{profile['stalls']} stalls over {profile['stall_threshold'] * 1000:g}ms"
+    )
+    print(PROFILE_HEADER)
+    for index, handler in enumerate(profile["handlers"][:limit], 1):
+        print(format_handler(index, handler))
+        if handler["histogram"]:
+            buckets = ", ".join(f"{k}: {v}" for k, v in handler["histogram"].items())
+            print(f"    {buckets}")
+
+
 def top(opts):
-    if not ENABLED:
+    if not ENABLED and not opts.profile:
         raise Exception("Could not import tracemalloc")
     lines = opts.lines
     seconds = opts.seconds
@@ -129,10 +191,28 @@ def top(opts):
         socket = opts.socket
     c = client.InteractiveCommandClient(
         interface.IPCCommandInterface(
-            ipc.Client(socket),
+            ipc.PersistentClient(socket),
         ),
     )
 
+    if opts.profile:
+        was_enabled = c.get_profile()["enabled"]
+        try:
+            if not opts.raw:
+                curses.wrapper(get_profile_stats, c, limit=lines, seconds=seconds)
+            else:
+                raw_profile(c, limit=lines, seconds=seconds)
+        except KeyboardInterrupt:
+            sys.exit(1)
+        except curses.error:
+            print("Terminal too small for curses interface.")
+            raw_profile(c, limit=lines, seconds=seconds)
+        finally:
+            # Leave profiling as it was found
+            if not was_enabled and c.get_profile()["enabled"]:
+                c.profiling_toggle()
+        return
+
     try:
         if not opts.raw:
             curses.wrapper(get_stats, c, limit=lines, seconds=seconds)
@@ -162,6 +242,14 @@ def add_subcommand(subparsers, parents):
         default=False,
         help="Output raw without curses.",
     )
+    parser.add_argument(
+        "-p",
+        "--profile",
+        dest="profile",
+        action="store_true",
+        default=False,
+        help="Show the time spent in event loop handlers instead of memory usage.",
+    )
     parser.add_argument(
         "-t",
         "--time",
@@ -194,7 +194,9 @@ class _Widget(CommandObject, configurable.Configurable):
 
         self.qtile = qtile
         self.bar = bar
-        self.drawer = bar.window.create_drawer(self.bar.width, self.bar.height)
+        self.drawer = bar.window.create_drawer(
+            self.bar.width, self.bar.height, persistent=self.bar.persistent_drawers
+        )
 
         # Clear this flag as widget may be restarted (e.g. if screen removed and re-added)
         self.finalized = False
@@ -311,7 +313,7 @@ class _Widget(CommandObject, configurable.Configurable):
         """
         Method that draws the widget. You may call this explicitly to
         redraw the widget, but only if the length of the widget hasn't
-        changed. If it has, you must call bar.draw instead.
+        changed. If it has, you must call bar.draw_widget instead.
         """
         raise NotImplementedError
 
@@ -405,7 +407,7 @@ class _Widget(CommandObject, configurable.Configurable):
             # infinite loop when we call bar.draw(). mirror.draw() will trigger a resize
             # if it's the wrong size.
             if mirror.length_type == bar.CALCULATED and mirror.bar is not self.bar:
-                mirror.bar.draw()
+                mirror.bar.draw_widget(mirror)
             else:
                 mirror.draw()
 
@@ -721,7 +723,7 @@ class _TextBox(_Widget):
             self.layout.font_shadow = self.fontshadow
             self.layout.colour = self.foreground
             self.layout.markup = self.markup
-        self.bar.draw()
+        self.bar.draw_widget(self)
 
     @expose_command()
     def info(self):
@@ -747,11 +749,11 @@ class _TextBox(_Widget):
         self.text = text
 
         # If our width hasn't changed, we just draw ourselves. Otherwise,
-        # we draw the whole bar.
+        # the bar lays out and redraws the widgets that have moved.
         if self.layout.width == old_width and (self.bar.horizontal or self.rotate):
             self.draw()
         else:
-            self.bar.draw()
+            self.bar.draw_widget(self)
 
 
 class InLoopPollText(_TextBox):
@@ -10,4 +10,4 @@ class ConfigErrorWidget(_TextBox):
 
     def _hide(self):
         self.text = ""
-        self.bar.draw()
+        self.bar.draw_widget(self)
@@ -1,9 +1,10 @@
 import psutil
 
 from libqtile.widget import base
+from libqtile.widget.metrics import CPU_FREQ, CPU_PERCENT, SampledMixin
 
 
-class CPU(base.InLoopPollText):
+class CPU(SampledMixin, base.InLoopPollText):
     """
     A simple widget to display CPU load and frequency.
 
@@ -21,15 +22,25 @@ class CPU(base.InLoopPollText):
         ),
     ]
 
+    sampled_metrics = (CPU_PERCENT, CPU_FREQ)
+
     def __init__(self, **config):
         super().__init__("", **config)
         self.add_defaults(CPU.defaults)
 
+    def sampled(self, snapshot):
+        self.update(self.format_snapshot(snapshot))
+
     def poll(self):
+        if self.snapshot is None:
+            return self.text
+        return self.format_snapshot(self.snapshot)
+
+    def format_snapshot(self, snapshot):
         variables = dict()
 
-        variables["load_percent"] = round(psutil.cpu_percent(), 1)
-        freq = psutil.cpu_freq()
+        variables["load_percent"] = round(snapshot[CPU_PERCENT], 1)
+        freq = snapshot[CPU_FREQ]
         if psutil.__version__ == "5.9.0":
             variables["freq_current"] = round(freq.current, 1)
         else:
@@ -90,7 +90,7 @@ class CurrentLayout(base._TextBox):
     def hook_response(self, layout, group):
         if group.screen is not None and group.screen == self.bar.screen:
             self.text = layout.name
-            self.bar.draw()
+            self.bar.draw_widget(self)
 
     def setup_hooks(self):
         """
@@ -108,7 +108,7 @@ class CurrentLayout(base._TextBox):
         if self.mode == "both":
             return
         self.mode = "text" if self.mode != "text" else "icon"
-        self.bar.draw()
+        self.bar.draw_widget(self)
 
     def draw(self):
         if self.mode != "text":
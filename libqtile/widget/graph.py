@@ -1,3 +1,4 @@
+import functools
 import itertools
 import operator
 import time
@@ -8,6 +9,15 @@ import psutil
 
 from libqtile.log_utils import logger
 from libqtile.widget import base
+from libqtile.widget.metrics import (
+    CPU_TIMES,
+    CPU_TIMES_PERCPU,
+    NET_IO_COUNTERS,
+    SWAP_MEMORY,
+    VIRTUAL_MEMORY,
+    Metric,
+    SampledMixin,
+)
 
 __all__ = [
     "CPUGraph",
@@ -156,12 +166,13 @@ class _Graph(base._Widget, base.MarginMixin):
             self.maxvalue = max(self.values)
         self.draw()
 
-    def update(self):
-        # lag detection
+    def _detect_lag(self):
         newtime = time.time()
         self.lag_cycles = int((newtime - self.oldtime) / self.frequency)
         self.oldtime = newtime
 
+    def update(self):
+        self._detect_lag()
         self.update_graph()
         self.timeout_add(self.frequency, self.update)
 
@@ -169,7 +180,37 @@ class _Graph(base._Widget, base.MarginMixin):
         self.values = [value] * len(self.values)
 
 
-class CPUGraph(_Graph):
+def _read_io_ticks(path):
+    try:
+        # io_ticks is field number 9
+        with open(path) as f:
+            return int(f.read().split()[9])
+    except OSError:
+        return None
+
+
+class _SampledGraph(SampledMixin, _Graph):
+    """A graph of metrics from the shared sampler, which replaces its own timer"""
+
+    update_on_setup = False
+
+    @property
+    def sample_interval(self):
+        return self.frequency
+
+    def sampled(self, snapshot):
+        self._detect_lag()
+        self.push_snapshot(snapshot)
+
+    def update_graph(self):
+        if self.snapshot is not None:
+            self.push_snapshot(self.snapshot)
+
+    def push_snapshot(self, snapshot):
+        raise NotImplementedError
+
+
+class CPUGraph(_SampledGraph):
     """Display CPU usage graph.
 
     Widget requirements: psutil_.
@@ -188,28 +229,22 @@ class CPUGraph(_Graph):
         _Graph.__init__(self, **config)
         self.add_defaults(CPUGraph.defaults)
         self.maxvalue = 100
-        self.oldvalues = self._getvalues()
-
-    def _getvalues(self):
         if isinstance(self.core, int):
             if self.core > psutil.cpu_count() - 1:
                 raise ValueError(f"No such core: {self.core}")
-            cpu = psutil.cpu_times(percpu=True)[self.core]
+            self.sampled_metrics = (CPU_TIMES_PERCPU,)
         else:
-            cpu = psutil.cpu_times()
-
-        user = cpu.user * 100
-        nice = cpu.nice * 100
-        sys = cpu.system * 100
-        idle = cpu.idle * 100
-
-        return (int(user), int(nice), int(sys), int(idle))
-
-    def update_graph(self):
-        nval = self._getvalues()
-        oval = self.oldvalues
-        busy = nval[0] + nval[1] + nval[2] - oval[0] - oval[1] - oval[2]
-        total = busy + nval[3] - oval[3]
+            self.sampled_metrics = (CPU_TIMES,)
+
+    def push_snapshot(self, snapshot):
+        # The rates of the CPU times are the fraction of each second spent in each state
+        cpu = snapshot.rate(self.sampled_metrics[0])
+        if cpu is not None and isinstance(self.core, int):
+            cpu = cpu[self.core]
+        busy = total = 0
+        if cpu is not None:
+            busy = cpu.user + cpu.nice + cpu.system
+            total = busy + cpu.idle
         # sometimes this value is zero for unknown reason (time shift?)
         # we just sent the previous value, because it gives us no info about
         # cpu load, if it's zero.
@@ -219,10 +254,9 @@ class CPUGraph(_Graph):
             self.push(push_value)
         else:
             self.push(self.values[0])
-        self.oldvalues = nval
 
 
-class MemoryGraph(_Graph):
+class MemoryGraph(_SampledGraph):
     """Displays a memory usage graph.
 
     Widget requirements: psutil_.
@@ -232,30 +266,29 @@ class MemoryGraph(_Graph):
 
     orientations = base.ORIENTATION_HORIZONTAL
     fixed_upper_bound = True
+    sampled_metrics = (VIRTUAL_MEMORY,)
 
-    def __init__(self, **config):
-        _Graph.__init__(self, **config)
-        val = self._getvalues()
-        self.maxvalue = val["MemTotal"]
-
-        mem = val["MemTotal"] - val["MemFree"] - val["Buffers"] - val["Cached"]
-        self.fulfill(mem)
-
-    def _getvalues(self):
+    def _getvalues(self, snapshot):
         val = {}
-        mem = psutil.virtual_memory()
+        mem = snapshot[VIRTUAL_MEMORY]
         val["MemTotal"] = int(mem.total / 1024 / 1024)
         val["MemFree"] = int(mem.free / 1024 / 1024)
         val["Buffers"] = int(mem.buffers / 1024 / 1024)
         val["Cached"] = int(mem.cached / 1024 / 1024)
         return val
 
-    def update_graph(self):
-        val = self._getvalues()
-        self.push(val["MemTotal"] - val["MemFree"] - val["Buffers"] - val["Cached"])
+    def push_snapshot(self, snapshot):
+        val = self._getvalues(snapshot)
+        mem = val["MemTotal"] - val["MemFree"] - val["Buffers"] - val["Cached"]
 
+        # The graph is filled with the first value
+        if self.maxvalue != val["MemTotal"]:
+            self.maxvalue = val["MemTotal"]
+            self.fulfill(mem)
+        self.push(mem)
 
-class SwapGraph(_Graph):
+
+class SwapGraph(_SampledGraph):
     """Display a swap info graph.
 
     Widget requirements: psutil_.
@@ -265,23 +298,17 @@ class SwapGraph(_Graph):
 
     orientations = base.ORIENTATION_HORIZONTAL
     fixed_upper_bound = True
+    sampled_metrics = (SWAP_MEMORY,)
 
-    def __init__(self, **config):
-        _Graph.__init__(self, **config)
-        val = self._getvalues()
-        self.maxvalue = val["SwapTotal"]
-        swap = val["SwapTotal"] - val["SwapFree"]
-        self.fulfill(swap)
-
-    def _getvalues(self):
+    def _getvalues(self, snapshot):
         val = {}
-        swap = psutil.swap_memory()
+        swap = snapshot[SWAP_MEMORY]
         val["SwapTotal"] = int(swap.total / 1024 / 1024)
         val["SwapFree"] = int(swap.free / 1024 / 1024)
         return val
 
-    def update_graph(self):
-        val = self._getvalues()
+    def push_snapshot(self, snapshot):
+        val = self._getvalues(snapshot)
 
         swap = val["SwapTotal"] - val["SwapFree"]
 
@@ -292,7 +319,7 @@ class SwapGraph(_Graph):
         self.push(swap)
 
 
-class NetGraph(_Graph):
+class NetGraph(_SampledGraph):
     """Display a network usage graph.
 
     Widget requirements: psutil_.
@@ -304,6 +331,7 @@ class NetGraph(_Graph):
         ("interface", "auto", "Interface to display info for ('auto' for detection)"),
         ("bandwidth_type", "down", "down(load)/up(load)"),
     ]
+    sampled_metrics = (NET_IO_COUNTERS,)
 
     def __init__(self, **config):
         _Graph.__init__(self, **config)
@@ -318,21 +346,18 @@ class NetGraph(_Graph):
                 self.interface = "eth0"
         if self.bandwidth_type != "down" and self.bandwidth_type != "up":
             raise ValueError(f"bandwidth type {self.bandwidth_type} not known!")
-        self.bytes = 0
-        self.bytes = self._get_values()
 
-    def _get_values(self):
-        net = psutil.net_io_counters(pernic=True)
+    def push_snapshot(self, snapshot):
+        net = snapshot.rate(NET_IO_COUNTERS) or {}
+        if self.interface not in net:
+            self.push(0)
+            return
         if self.bandwidth_type == "up":
-            return net[self.interface].bytes_sent
-        if self.bandwidth_type == "down":
-            return net[self.interface].bytes_recv
-
-    def update_graph(self):
-        val = self._get_values()
-        change = val - self.bytes
-        self.bytes = val
-        self.push(change)
+            rate = net[self.interface].bytes_sent
+        else:
+            rate = net[self.interface].bytes_recv
+        # The graph shows the bytes transferred over each update
+        self.push(rate * self.frequency)
 
     @staticmethod
     def get_main_iface():
@@ -350,7 +375,7 @@ class NetGraph(_Graph):
         return sorted(iface.items(), key=operator.itemgetter(1))[-1][0]
 
 
-class HDDGraph(_Graph):
+class HDDGraph(_SampledGraph):
     """Display HDD free or used space graph"""
 
     fixed_upper_bound = True
@@ -360,24 +385,27 @@ class HDDGraph(_Graph):
     def __init__(self, **config):
         _Graph.__init__(self, **config)
         self.add_defaults(HDDGraph.defaults)
+        self.sampled_metrics = (
+            Metric(f"statvfs:{self.path}", functools.partial(statvfs, self.path)),
+        )
         stats = statvfs(self.path)
         self.maxvalue = stats.f_blocks * stats.f_frsize
-        values = self._get_values()
+        values = self._get_values(stats)
         self.fulfill(values)
 
-    def _get_values(self):
-        stats = statvfs(self.path)
+    def _get_values(self, stats):
         if self.space_type == "used":
             return (stats.f_blocks - stats.f_bfree) * stats.f_frsize
         else:
             return stats.f_bavail * stats.f_frsize
 
-    def update_graph(self):
-        val = self._get_values()
-        self.push(val)
+    def push_snapshot(self, snapshot):
+        stats = snapshot[self.sampled_metrics[0]]
+        if stats is not None:
+            self.push(self._get_values(stats))
 
 
-class HDDBusyGraph(_Graph):
+class HDDBusyGraph(_SampledGraph):
     """Display HDD busy time graph
 
     Parses /sys/block/<dev>/stat file and extracts overall device IO usage,
@@ -392,19 +420,15 @@ class HDDBusyGraph(_Graph):
         _Graph.__init__(self, **config)
         self.add_defaults(HDDBusyGraph.defaults)
         self.path = f"/sys/block/{self.device}/stat"
-        self._prev = 0
-
-    def _get_values(self):
-        try:
-            # io_ticks is field number 9
-            with open(self.path) as f:
-                io_ticks = int(f.read().split()[9])
-        except OSError:
-            return 0
-        activity = io_ticks - self._prev
-        self._prev = io_ticks
-        return activity
+        self.sampled_metrics = (
+            Metric(
+                f"io_ticks:{self.path}",
+                functools.partial(_read_io_ticks, self.path),
+                counter=True,
+            ),
+        )
 
-    def update_graph(self):
-        val = self._get_values()
-        self.push(val)
+    def push_snapshot(self, snapshot):
+        # io_ticks is the number of milliseconds spent doing I/O
+        rate = snapshot.rate(self.sampled_metrics[0])
+        self.push(0 if rate is None else rate * self.frequency)
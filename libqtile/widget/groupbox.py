@@ -36,16 +36,16 @@ class _GroupBase(base._TextBox, base.PaddingMixin, base.MarginMixin):
         self.setup_hooks()
 
     def _hook_response(self, *args, **kwargs):
-        self.bar.draw()
+        self.bar.draw_widget(self)
 
     def setup_hooks(self):
-        hook.subscribe.client_managed(self._hook_response)
-        hook.subscribe.client_urgent_hint_changed(self._hook_response)
-        hook.subscribe.client_killed(self._hook_response)
-        hook.subscribe.setgroup(self._hook_response)
-        hook.subscribe.group_window_add(self._hook_response)
-        hook.subscribe.current_screen_change(self._hook_response)
-        hook.subscribe.changegroup(self._hook_response)
+        hook.subscribe.client_managed(self._hook_response, coalesce=True)
+        hook.subscribe.client_urgent_hint_changed(self._hook_response, coalesce=True)
+        hook.subscribe.client_killed(self._hook_response, coalesce=True)
+        hook.subscribe.setgroup(self._hook_response, coalesce=True)
+        hook.subscribe.group_window_add(self._hook_response, coalesce=True)
+        hook.subscribe.current_screen_change(self._hook_response, coalesce=True)
+        hook.subscribe.changegroup(self._hook_response, coalesce=True)
 
     def remove_hooks(self):
         hook.unsubscribe.client_managed(self._hook_response)
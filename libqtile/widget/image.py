@@ -70,4 +70,4 @@ class Image(base._Widget, base.MarginMixin):
         if self.calculate_length() == old_length:
             self.draw()
         else:
-            self.bar.draw()
+            self.bar.draw_widget(self)
@@ -1,11 +1,13 @@
-import psutil
+# The metrics import psutil when they are sampled, but fail early if it is missing
+import psutil  # noqa: F401
 
 from libqtile.widget import base
+from libqtile.widget.metrics import SWAP_MEMORY, VIRTUAL_MEMORY, SampledMixin
 
 __all__ = ["Memory"]
 
 
-class Memory(base.InLoopPollText):
+class Memory(SampledMixin, base.InLoopPollText):
     """Display memory/swap usage.
 
     The following fields are available in the `format` string:
@@ -42,15 +44,25 @@ class Memory(base.InLoopPollText):
 
     measures = {"G": 1024 * 1024 * 1024, "M": 1024 * 1024, "K": 1024, "B": 1}
 
+    sampled_metrics = (VIRTUAL_MEMORY, SWAP_MEMORY)
+
     def __init__(self, **config):
         super().__init__("", **config)
         self.add_defaults(Memory.defaults)
         self.calc_mem = self.measures[self.measure_mem]
         self.calc_swap = self.measures[self.measure_swap]
 
+    def sampled(self, snapshot):
+        self.update(self.format_snapshot(snapshot))
+
     def poll(self):
-        mem = psutil.virtual_memory()
-        swap = psutil.swap_memory()
+        if self.snapshot is None:
+            return self.text
+        return self.format_snapshot(self.snapshot)
+
+    def format_snapshot(self, snapshot):
+        mem = snapshot[VIRTUAL_MEMORY]
+        swap = snapshot[SWAP_MEMORY]
         val = {}
         val["MemUsed"] = mem.used / self.calc_mem
         val["MemTotal"] = mem.total / self.calc_mem
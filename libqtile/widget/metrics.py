@@ -0,0 +1,249 @@
+"""
+Shared sampling of system metrics
+
+Widgets showing system metrics do not read them on their own timers. Instead,
+they subscribe to the sampler with the metrics that they need and how often
+they need them. On each tick, the sampler reads every metric that is due once,
+in a worker thread, and passes the same snapshot to all of the widgets that
+asked for it. The sampler ticks as often as its fastest subscriber.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import threading
+import time
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from libqtile.log_utils import logger
+from libqtile.utils import create_task
+
+
+class Metric:
+    """
+    A source of a system metric, e.g. a psutil function
+
+    Metrics are identified by their name, so that widgets creating their own
+    Metric for the same source share its samples. The rate of change per
+    second of counters is computed when they are sampled.
+    """
+
+    def __init__(self, name: str, read: Callable[[], Any], counter: bool = False) -> None:
+        self.name = name
+        self.read = read
+        self.counter = counter
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Metric) and other.name == self.name
+
+    def __hash__(self) -> int:
+        return hash(self.name)
+
+    def __repr__(self) -> str:
+        return f"<Metric {self.name}>"
+
+
+def _psutil(function: str, **kwargs: Any) -> Callable[[], Any]:
+    """Read a psutil function, importing psutil only once the metric is sampled"""
+
+    def read() -> Any:
+        import psutil
+
+        return getattr(psutil, function)(**kwargs)
+
+    return read
+
+
+CPU_PERCENT = Metric("cpu_percent", _psutil("cpu_percent"))
+CPU_FREQ = Metric("cpu_freq", _psutil("cpu_freq"))
+CPU_TIMES = Metric("cpu_times", _psutil("cpu_times"), counter=True)
+CPU_TIMES_PERCPU = Metric("cpu_times_percpu", _psutil("cpu_times", percpu=True), counter=True)
+VIRTUAL_MEMORY = Metric("virtual_memory", _psutil("virtual_memory"))
+SWAP_MEMORY = Metric("swap_memory", _psutil("swap_memory"))
+NET_IO_COUNTERS = Metric("net_io_counters", _psutil("net_io_counters", pernic=True), counter=True)
+NET_IO_COUNTERS_TOTAL = Metric("net_io_counters_total", _psutil("net_io_counters"), counter=True)
+SENSORS_TEMPERATURES = Metric("sensors_temperatures", _psutil("sensors_temperatures"))
+
+
+def _rate(new: Any, old: Any, elapsed: float) -> Any:
+    if isinstance(new, dict):
+        return {key: _rate(value, old[key], elapsed) for key, value in new.items() if key in old}
+    if isinstance(new, list):
+        return [_rate(n, o, elapsed) for n, o in zip(new, old)]
+    if isinstance(new, tuple):
+        # psutil returns named tuples of counters
+        return type(new)(*(_rate(n, o, elapsed) for n, o in zip(new, old)))
+    return (new - old) / elapsed
+
+
+class Snapshot:
+    """The values of some metrics, and the rates of those that are counters"""
+
+    def __init__(self, values: dict[Metric, Any], rates: dict[Metric, Any]) -> None:
+        self.values = values
+        self.rates = rates
+
+    def __getitem__(self, metric: Metric) -> Any:
+        return self.values.get(metric)
+
+    def rate(self, metric: Metric) -> Any:
+        """
+        The rate of change per second of a counter since it was last sampled, or None
+        if it was not sampled before.
+        """
+        return self.rates.get(metric)
+
+
+class _Subscription:
+    def __init__(self, metrics: frozenset[Metric], interval: float | None, due: float) -> None:
+        self.metrics = metrics
+        self.interval = interval
+        self.due = due
+
+
+class Sampler:
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        self._lock = threading.Lock()
+        # The time and value of the last sample of each counter
+        self._counters: dict[Metric, tuple[float, Any]] = {}
+        self._subscriptions: dict[Callable[[Snapshot], None], _Subscription] = {}
+        self._task: asyncio.Task | None = None
+        self._wakeup: asyncio.Event | None = None
+
+    @property
+    def interval(self) -> float | None:
+        """The time between ticks, which is the interval of the fastest subscriber"""
+        intervals = [s.interval for s in self._subscriptions.values() if s.interval is not None]
+        return min(intervals, default=None)
+
+    def sample(self, metrics: Iterable[Metric]) -> Snapshot:
+        """Read the given metrics now. This blocks, and can be called from any thread."""
+        values = {}
+        rates = {}
+        for metric in metrics:
+            try:
+                value = metric.read()
+            except Exception:
+                logger.exception("Failed to sample %s", metric.name)
+                continue
+            values[metric] = value
+            if not metric.counter or value is None:
+                continue
+
+            with self._lock:
+                now = self._clock()
+                last = self._counters.get(metric)
+                self._counters[metric] = (now, value)
+            if last is not None and last[1] is not None and now > last[0]:
+                try:
+                    rates[metric] = _rate(value, last[1], now - last[0])
+                except (KeyError, TypeError):
+                    logger.exception("Failed to compute the rate of %s", metric.name)
+
+        return Snapshot(values, rates)
+
+    def subscribe(
+        self,
+        callback: Callable[[Snapshot], None],
+        metrics: Iterable[Metric],
+        interval: float | None,
+        delay: float | None = None,
+    ) -> None:
+        """
+        Call callback with a snapshot of metrics every interval seconds, starting in
+        delay seconds or on the next tick. Subscribers with an interval of None are
+        only called once.
+        """
+        loop = asyncio.get_running_loop()
+        due = loop.time() + (delay or 0)
+        self._subscriptions[callback] = _Subscription(frozenset(metrics), interval, due)
+
+        if self._task is None or self._task.done():
+            self._wakeup = asyncio.Event()
+            self._task = create_task(self._run())
+        elif self._wakeup is not None:
+            # The new subscriber may be due before the next tick
+            self._wakeup.set()
+
+    def unsubscribe(self, callback: Callable[[Snapshot], None]) -> None:
+        self._subscriptions.pop(callback, None)
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        assert self._wakeup is not None
+
+        while self._subscriptions:
+            now = loop.time()
+            # Subscribers that are due within half a tick are served by this tick, so
+            # that subscribers with the same interval share their samples
+            slack = (self.interval or 0) / 2
+            due = [(c, s) for c, s in self._subscriptions.items() if s.due <= now + slack]
+
+            if due:
+                metrics = frozenset().union(*(s.metrics for _, s in due))
+                snapshot = await loop.run_in_executor(None, self.sample, metrics)
+
+                for callback, subscription in due:
+                    if self._subscriptions.get(callback) is not subscription:
+                        # Unsubscribed while sampling
+                        continue
+                    if subscription.interval is None:
+                        del self._subscriptions[callback]
+                    else:
+                        subscription.due = now + subscription.interval
+                    try:
+                        callback(snapshot)
+                    except Exception:
+                        logger.exception("Error in metrics subscriber %s", callback)
+
+            if not self._subscriptions:
+                break
+
+            self._wakeup.clear()
+            timeout = min(s.due for s in self._subscriptions.values()) - loop.time()
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), max(timeout, 0))
+
+
+sampler = Sampler()
+
+
+class SampledMixin:
+    """
+    Mixin for widgets updated with metrics from the shared sampler
+
+    Widgets set ``sampled_metrics`` to the metrics that they need, and are passed a
+    snapshot of them in ``sampled()`` every ``sample_interval`` seconds, starting
+    when their timers are set up. The latest snapshot is kept in ``snapshot``. If
+    ``update_on_setup`` is False, the first snapshot only primes the counters, and
+    widgets are first updated one interval later.
+    """
+
+    sampled_metrics: tuple[Metric, ...] = ()
+    update_on_setup = True
+    snapshot: Snapshot | None = None
+
+    @property
+    def sample_interval(self) -> float | None:
+        return self.update_interval  # type: ignore[attr-defined]
+
+    def sampled(self, snapshot: Snapshot) -> None:
+        raise NotImplementedError
+
+    def _on_sample(self, snapshot: Snapshot) -> None:
+        first = self.snapshot is None
+        self.snapshot = snapshot
+        if not first or self.update_on_setup:
+            self.sampled(snapshot)
+
+    def timer_setup(self) -> None:
+        # The first sample is taken on the sampler's next tick, off the event loop
+        if self.sample_interval is not None or self.update_on_setup:
+            sampler.subscribe(self._on_sample, self.sampled_metrics, self.sample_interval, 0)
+
+    def finalize(self) -> None:
+        sampler.unsubscribe(self._on_sample)
+        super().finalize()  # type: ignore[misc]
@@ -1,11 +1,13 @@
 from math import log
 
-import psutil
+# The metrics import psutil when they are sampled, but fail early if it is missing
+import psutil  # noqa: F401
 
 from libqtile.widget import base
+from libqtile.widget.metrics import NET_IO_COUNTERS, NET_IO_COUNTERS_TOTAL, SampledMixin
 
 
-class Net(base.InLoopPollText):
+class Net(SampledMixin, base.InLoopPollText):
     """
     Displays interface down and up speed
 
@@ -82,7 +84,10 @@ class Net(base.InLoopPollText):
                 raise AttributeError(
                     f"Invalid Argument passed: {self.interface}\nAllowed Types: list, str, None"
                 )
-        self.stats = self.get_stats()
+        if self.interface == ["all"]:
+            self.sampled_metrics = (NET_IO_COUNTERS_TOTAL,)
+        else:
+            self.sampled_metrics = (NET_IO_COUNTERS,)
 
     def convert_b(self, num_bytes: float, prefix: str | None = None) -> tuple[float, str]:
         """Converts the number of bytes to the correct unit"""
@@ -103,62 +108,61 @@ class Net(base.InLoopPollText):
 
         return converted_bytes, unit
 
-    def get_stats(self):
+    def get_stats(self, snapshot):
+        """Returns the counters and rates of each interface"""
         interfaces = {}
         if self.interface == ["all"]:
-            net = psutil.net_io_counters(pernic=False)
-            interfaces["all"] = {
-                "down": net.bytes_recv,
-                "up": net.bytes_sent,
-                "total": net.bytes_recv + net.bytes_sent,
-            }
-            return interfaces
+            net = {"all": snapshot[NET_IO_COUNTERS_TOTAL]}
+            rates = {"all": snapshot.rate(NET_IO_COUNTERS_TOTAL)}
         else:
-            net = psutil.net_io_counters(pernic=True)
-            for iface in net:
-                down = net[iface].bytes_recv
-                up = net[iface].bytes_sent
-                interfaces[iface] = {
-                    "down": down,
-                    "up": up,
-                    "total": down + up,
-                }
-            return interfaces
+            net = snapshot[NET_IO_COUNTERS]
+            rates = snapshot.rate(NET_IO_COUNTERS) or {}
+
+        for iface in net:
+            down = net[iface].bytes_recv
+            up = net[iface].bytes_sent
+            # The rates of interfaces that just appeared are not known yet
+            rate = rates.get(iface)
+            down_rate = rate.bytes_recv if rate else 0
+            up_rate = rate.bytes_sent if rate else 0
+            interfaces[iface] = {
+                "down": down,
+                "up": up,
+                "total": down + up,
+                "down_rate": down_rate,
+                "up_rate": up_rate,
+                "total_rate": down_rate + up_rate,
+            }
+        return interfaces
+
+    def sampled(self, snapshot):
+        self.update(self.format_snapshot(snapshot))
 
     def poll(self):
+        if self.snapshot is None:
+            return self.text
+        return self.format_snapshot(self.snapshot)
+
+    def format_snapshot(self, snapshot):
         ret_stat = []
-        new_stats = self.get_stats()
+        stats = self.get_stats(snapshot)
         for intf in self.interface:
-            if intf not in new_stats:
+            if intf not in stats:
                 ret_stat.append(self.missing_interface.format(interface=intf))
                 continue
 
-            # This is for any interfaces that appear after the widget has started.
-            # In that scenario, new_stats[intf] will exist but self.stats[intf] would result
-            # in a KeyError, so we populate it now.
-            if intf not in self.stats:
-                self.stats[intf] = new_stats[intf]
-
-            down = new_stats[intf]["down"] - self.stats[intf]["down"]
-            up = new_stats[intf]["up"] - self.stats[intf]["up"]
-            total = new_stats[intf]["total"] - self.stats[intf]["total"]
-
-            down = down / self.update_interval
-            up = up / self.update_interval
-            total = total / self.update_interval
-            down, down_suffix = self.convert_b(down, self.prefix)
+            down, down_suffix = self.convert_b(stats[intf]["down_rate"], self.prefix)
             down_cumulative, down_cumulative_suffix = self.convert_b(
-                new_stats[intf]["down"], self.cumulative_prefix
+                stats[intf]["down"], self.cumulative_prefix
             )
-            up, up_suffix = self.convert_b(up, self.prefix)
+            up, up_suffix = self.convert_b(stats[intf]["up_rate"], self.prefix)
             up_cumulative, up_cumulative_suffix = self.convert_b(
-                new_stats[intf]["up"], self.cumulative_prefix
+                stats[intf]["up"], self.cumulative_prefix
             )
-            total, total_suffix = self.convert_b(total, self.prefix)
+            total, total_suffix = self.convert_b(stats[intf]["total_rate"], self.prefix)
             total_cumulative, total_cumulative_suffix = self.convert_b(
-                new_stats[intf]["total"], self.cumulative_prefix
+                stats[intf]["total"], self.cumulative_prefix
             )
-            self.stats[intf] = new_stats[intf]
             ret_stat.append(
                 self.format.format(
                     interface=intf,
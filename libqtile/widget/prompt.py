@@ -551,7 +551,7 @@ class Prompt(base._TextBox):
             self.text = self.display + self.text
         else:
             self.text = ""
-        self.bar.draw()
+        self.bar.draw_widget(self)
 
     def _trigger_complete(self) -> None:
         # Trigger the auto completion in user input
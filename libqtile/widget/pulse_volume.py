@@ -255,7 +255,7 @@ class PulseVolume(VolumeBase):
         if self.length == length:
             self.draw()
         else:
-            self.bar.draw()
+            self.bar.draw_widget(self)
 
     def finalize(self):
         # Close the connection to the server
@@ -1,9 +1,11 @@
-import psutil
+# The metrics import psutil when they are sampled, but fail early if it is missing
+import psutil  # noqa: F401
 
 from libqtile.widget import base
+from libqtile.widget.metrics import SENSORS_TEMPERATURES, SampledMixin
 
 
-class ThermalSensor(base.BackgroundPoll):
+class ThermalSensor(SampledMixin, base.BackgroundPoll):
     """Widget to display temperature sensor information
 
     For using the thermal sensor widget you need to have lm-sensors installed.
@@ -36,33 +38,27 @@ class ThermalSensor(base.BackgroundPoll):
         ("foreground_alert", "ff0000", "Foreground colour alert"),
     ]
 
+    sampled_metrics = (SENSORS_TEMPERATURES,)
+
     def __init__(self, **config):
         base.BackgroundPoll.__init__(self, **config)
         self.add_defaults(ThermalSensor.defaults)
-        temp_values = self.get_temp_sensors()
-
-        if temp_values is None:
-            self.data = "sensors command not found"
-        elif len(temp_values) == 0:
-            self.data = "Temperature sensors not found"
-        elif self.tag_sensor is None:
-            for k in temp_values:
-                self.tag_sensor = k
-                break
 
     def _configure(self, qtile, bar):
         self.unit = "°C" if self.metric else "°F"
         base.BackgroundPoll._configure(self, qtile, bar)
         self.foreground_normal = self.foreground
 
-    def get_temp_sensors(self):
+    def get_temp_sensors(self, snapshot):
         """
-        Reads temperatures from sys-fs via psutil.
-        Output will be read Fahrenheit if user has specified it to be.
+        Gets the temperatures read from sys-fs via psutil.
+        Output will be in Fahrenheit if user has specified it to be.
         """
 
         temperature_list = {}
-        temps = psutil.sensors_temperatures(fahrenheit=not self.metric)
+        temps = snapshot[SENSORS_TEMPERATURES]
+        if temps is None:
+            return None
         empty_index = 0
         for kernel_module in temps:
             for sensor in temps[kernel_module]:
@@ -72,12 +68,27 @@ class ThermalSensor(base.BackgroundPoll):
                         kernel_module if kernel_module else "UNKNOWN", str(empty_index)
                     )
                     empty_index += 1
-                temperature_list[label] = sensor.current
+                if self.metric:
+                    temperature_list[label] = sensor.current
+                else:
+                    temperature_list[label] = sensor.current * 9 / 5 + 32
 
         return temperature_list
 
+    def sampled(self, snapshot):
+        self.update(self.format_snapshot(snapshot))
+
     def poll(self):
-        temp_values = self.get_temp_sensors()
+        if self.snapshot is None:
+            return self.text
+        return self.format_snapshot(self.snapshot)
+
+    def format_snapshot(self, snapshot):
+        temp_values = self.get_temp_sensors(snapshot)
+
+        # Default to the first sensor
+        if self.tag_sensor is None and temp_values:
+            self.tag_sensor = next(iter(temp_values))
 
         # Temperature not available
         if (temp_values is None) or (self.tag_sensor not in temp_values):
@@ -394,9 +394,14 @@ class TaskList(base._Widget, base.PaddingMixin, base.MarginMixin):
         )
         self.setup_hooks()
 
+    @staticmethod
+    def _hook_key(window=None):
+        # Coalesce the hooks per window, as only windows in this widget trigger a redraw
+        return window
+
     def update(self, window=None):
         if not window or window in self.windows:
-            self.bar.draw()
+            self.bar.draw_widget(self)
 
     def remove_icon_cache(self, window):
         wid = window.wid
@@ -408,10 +413,10 @@ class TaskList(base._Widget, base.PaddingMixin, base.MarginMixin):
         self.update(window)
 
     def setup_hooks(self):
-        hook.subscribe.client_name_updated(self.update)
-        hook.subscribe.focus_change(self.update)
-        hook.subscribe.float_change(self.update)
-        hook.subscribe.client_urgent_hint_changed(self.update)
+        hook.subscribe.client_name_updated(self.update, coalesce=self._hook_key)
+        hook.subscribe.focus_change(self.update, coalesce=self._hook_key)
+        hook.subscribe.float_change(self.update, coalesce=self._hook_key)
+        hook.subscribe.client_urgent_hint_changed(self.update, coalesce=self._hook_key)
 
         hook.subscribe.net_wm_icon_change(self.invalidate_cache)
         hook.subscribe.client_killed(self.remove_icon_cache)
@@ -494,14 +499,14 @@ class TaskList(base._Widget, base.PaddingMixin, base.MarginMixin):
 
         # If we have a HiDPI display, we want to find icons at the scaled icon size
         icon_size_scaled = int(self.drawer.output_scale * self.icon_size)
-        icons = sorted(
-            iter(window.icons.items()),
-            key=lambda x: abs(icon_size_scaled - int(x[0].split("x")[0])),
+        # Only look up the closest size, as icons may be decoded when they are looked up
+        size = min(
+            window.icons,
+            key=lambda x: abs(icon_size_scaled - int(x.split("x")[0])),
         )
-        icon = icons[0]
-        width, height = map(int, icon[0].split("x"))
+        width, height = map(int, size.split("x"))
 
-        img = Img.from_data(icon[1], cairocffi.FORMAT_ARGB32, width, height)
+        img = Img.from_data(window.icons[size], cairocffi.FORMAT_ARGB32, width, height)
 
         return img
 
@@ -66,7 +66,7 @@ class TunedManager(base.BackgroundPoll):
     def update_bar(self):
         self.current_mode = self.find_mode()
         self.text = self.current_mode
-        self.bar.draw()
+        self.bar.draw_widget(self)
 
     def execute_command(self, index: int):
         argument = self.modes[index]  # pyright: ignore
@@ -196,7 +196,7 @@ class Volume(VolumeBase):
             # Update the underlying canvas size before actually attempting
             # to figure out how big it is and draw it.
             self._update_drawer()
-            self.bar.draw()
+            self.bar.draw_widget(self)
         await asyncio.sleep(self.update_interval)
         self._volume_task = create_task(self.do_volume())
 
@@ -33,10 +33,10 @@ class WindowCount(base._TextBox):
 
     def _setup_hooks(self):
         hook.subscribe.client_killed(self._win_killed)
-        hook.subscribe.client_managed(self._wincount)
-        hook.subscribe.current_screen_change(self._wincount)
-        hook.subscribe.group_window_add(self._wincount)
-        hook.subscribe.setgroup(self._wincount)
+        hook.subscribe.client_managed(self._wincount, coalesce=True)
+        hook.subscribe.current_screen_change(self._wincount, coalesce=True)
+        hook.subscribe.group_window_add(self._wincount, coalesce=True)
+        hook.subscribe.setgroup(self._wincount, coalesce=True)
 
     def _wincount(self, *args):
         try:
@@ -40,9 +40,9 @@ class WindowName(base._TextBox):
 
     def _configure(self, qtile, bar):
         base._TextBox._configure(self, qtile, bar)
-        hook.subscribe.client_name_updated(self.hook_response)
-        hook.subscribe.focus_change(self.hook_response)
-        hook.subscribe.float_change(self.hook_response)
+        hook.subscribe.client_name_updated(self.hook_response, coalesce=True)
+        hook.subscribe.focus_change(self.hook_response, coalesce=True)
+        hook.subscribe.float_change(self.hook_response, coalesce=True)
         hook.subscribe.current_screen_change(self.hook_response_current_screen)
 
         if not self.stretch:
@@ -31,9 +31,9 @@ class WindowTabs(base._TextBox):
 
     def _configure(self, qtile, bar):
         base._TextBox._configure(self, qtile, bar)
-        hook.subscribe.client_name_updated(self.update)
-        hook.subscribe.focus_change(self.update)
-        hook.subscribe.float_change(self.update)
+        hook.subscribe.client_name_updated(self.update, coalesce=True)
+        hook.subscribe.focus_change(self.update, coalesce=True)
+        hook.subscribe.float_change(self.update, coalesce=True)
         self.add_callbacks({"Button1": self.bar.screen.group.next_window})
 
     def update(self, *args):
@@ -56,4 +56,4 @@ class WindowTabs(base._TextBox):
                 task = task.join(self.selected)
             names.append(task)
         self.text = self.separator.join(names)
-        self.bar.draw()
+        self.bar.draw_widget(self)
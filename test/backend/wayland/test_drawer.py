@@ -10,8 +10,9 @@ from test.test_images import SVGS, png_img_24, rgba_pixel_data  # noqa: F401
 
 
 class FakeDrawer(Drawer):
-    def __init__(self, image_surface, output_scale, monkeypatch):
+    def __init__(self, image_surface, output_scale, monkeypatch, persistent=False):
         self._image_surface = image_surface
+        self._persistent = persistent
         win = Mock()
         win.scale = output_scale
         win.width = image_surface.get_width()
@@ -72,6 +73,24 @@ def test_hidpi_png_scaling(png_img_24, drawer):  # noqa:F811
     assert bytes(img0.surface.get_data()) == bytes(image_surface.get_data())
 
 
+def test_hidpi_persistent_surface(svg_img, monkeypatch):
+    image_surface = cairocffi.ImageSurface(cairocffi.FORMAT_ARGB32, 24, 24)
+    d = FakeDrawer(image_surface, 1.5, monkeypatch, persistent=True)
+    # The persistent surface is allocated at the output's scale
+    assert d.surface.get_width() == 36
+    img0 = copy(svg_img)
+    svg_img.resize(height=16)
+    surface = d.surface
+
+    for _ in range(2):
+        d.draw_image(svg_img)
+        d._draw()
+        d._reset_surface()
+        assert bytes(img0.surface.get_data()) == bytes(image_surface.get_data())
+        # The surface is kept between frames
+        assert d.surface is surface
+
+
 def test_hidpi_pixel_data_scaling(rgba_pixel_data, drawer):  # noqa:F811
     img = images.Img.from_data(rgba_pixel_data, cairocffi.FORMAT_ARGB32, 24, 24)
     assert img.width == 24
@@ -1,6 +1,7 @@
 import os
 import shutil
 import subprocess
+import sys
 import tempfile
 from multiprocessing import Value
 
@@ -19,6 +20,7 @@ from test.helpers import (
     SECOND_WIDTH,
     WIDTH,
     BareConfig,
+    Retry,
     assert_window_died,
     window_by_name,
 )
@@ -881,3 +883,91 @@ def test_multiple_wm_types(xmanager):
     kde_override = conn.atoms["_KDE_NET_WM_WINDOW_TYPE_OVERRIDE"]
     w.set_property("_NET_WM_WINDOW_TYPE", [kde_override, normal])
     assert w.get_wm_type() == "normal"
+
+
+def test_prefetch(xmanager, conn):
+    xmanager.test_window("one")
+    wid = xmanager.c.window.info()["id"]
+    xwin = window.XWindow(conn, wid)
+
+    expected = (xwin.get_name(), xwin.get_wm_class(), xwin.get_geometry().width)
+    with xwin.prefetch():
+        assert xwin._prefetched
+        assert (xwin.get_name(), xwin.get_wm_class(), xwin.get_geometry().width) == expected
+
+        # Properties that are set are read from the server again
+        xwin.set_property("_NET_WM_NAME", "two")
+        assert xwin.get_name() == "two"
+    assert xwin._prefetched is None
+
+    # Errors are raised when the replies are read
+    xwin = window.XWindow(conn, 0x123456)
+    with xwin.prefetch():
+        assert xwin.get_property("WM_CLASS", "STRING") is None
+        with pytest.raises(xcffib.xproto.WindowError):
+            xwin.get_attributes()
+
+
+def test_property_change_burst(xmanager, conn):
+    xmanager.test_window("one")
+    wid = xmanager.c.window.info()["id"]
+    xwin = window.XWindow(conn, wid)
+
+    # Changes within a poll are handled together, and the last one wins
+    for i in range(20):
+        xwin.set_property("_NET_WM_NAME", f"name {i}")
+        xwin.set_property("WM_CLASS", f"class{i}\0Class{i}", type="STRING", format=8)
+    conn.flush()
+
+    @Retry(ignore_exceptions=(AssertionError,))
+    def assert_updated():
+        info = xmanager.c.window.info()
+        assert info["name"] == "name 19"
+        assert info["wm_class"] == ["class19", "Class19"]
+
+    assert_updated()
+
+
+@manager_config
+def test_place_skips_unchanged(xmanager):
+    xmanager.c.to_layout_index(2)
+    xmanager.test_window("one")
+    xmanager.test_window("two")
+
+    before = xmanager.c.core.get_place_stats()
+    # Switching focus in a Tile layout changes the borders but not the geometry
+    xmanager.c.group.next_window()
+    after = xmanager.c.core.get_place_stats()
+    assert after["configure"]["skipped"] > before["configure"]["skipped"]
+    assert after["configure"]["sent"] == before["configure"]["sent"]
+    assert after["borders"]["sent"] > before["borders"]["sent"]
+
+
+@manager_config
+def test_stacking_order_model(xmanager):
+    xmanager.test_window("one")
+    xmanager.test_window("two", floating=True)
+    xmanager.c.window.toggle_floating()
+    xmanager.c.window.keep_above()
+    xmanager.test_window("three")
+    xmanager.c.group.next_window()
+    xmanager.kill_window(xmanager.test_window("four"))
+
+    # The stacking order that qtile keeps matches the server's
+    assert xmanager.c.core.verify_stacking() == {}
+
+
+def test_net_wm_icons():
+    def cardinals(*values):
+        return b"".join(v.to_bytes(4, sys.byteorder) for v in values)
+
+    # A 1x1 icon with half transparent white and a 256x1 opaque one
+    data = cardinals(1, 1, 0x80FFFFFF, 256, 1, *([0xFF102030] * 256))
+    icons = window.NetWmIcons(data)
+    assert list(icons) == ["1x1", "256x1"]
+
+    assert bytes(icons["1x1"])[3] == 0x80
+    assert all(c == 0x80 for c in bytes(icons["1x1"])[:3])
+    assert bytes(icons["256x1"]) == data[20:]
+    # Icons are only decoded once
+    assert icons["1x1"] is icons["1x1"]
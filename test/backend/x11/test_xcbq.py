@@ -48,3 +48,72 @@ def test_edid_decoding_ev2460():
     assert make == "ENC"
     assert model == "EV2460"
     assert serial == "22806129"
+
+
+def test_pixmap_cache():
+    freed = []
+
+    class FakeConn:
+        class core:  # noqa: N801
+            FreePixmap = freed.append
+
+    cache = xcbq.PixmapCache(FakeConn, limit=100)
+    cache.add("a", 1, 40)
+    cache.add("b", 2, 40)
+    assert cache.get("a") == 1
+    assert cache.get("c") is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # b is the least recently used
+    cache.add("c", 3, 40)
+    assert freed == [2]
+    assert cache.get("b") is None
+    assert cache.size == 80
+
+    # The pixmap that was just added is kept, even if it is too large
+    cache.add("d", 4, 200)
+    assert freed == [2, 1, 3]
+    assert cache.get("d") == 4
+
+    cache.clear()
+    assert freed == [2, 1, 3, 4]
+    assert cache.size == 0
+
+
+def test_stacking_order():
+    stacking = xcbq.StackingOrder()
+    stacking.reset([1, 2, 3])
+    stacking.restack(1, xcffib.xproto.StackMode.Above)
+    assert list(stacking) == [2, 3, 1]
+    stacking.restack(1, xcffib.xproto.StackMode.Below, 3)
+    assert list(stacking) == [2, 1, 3]
+    stacking.restack(3, xcffib.xproto.StackMode.Below)
+    assert list(stacking) == [3, 2, 1]
+
+    # Windows that aren't children of the root aren't tracked
+    stacking.restack(4, xcffib.xproto.StackMode.Above)
+    assert list(stacking) == [3, 2, 1]
+    stacking.add(4)
+    assert list(stacking) == [3, 2, 1, 4]
+
+
+def test_atom_cache(xmanager, conn):
+    # Declared atoms are interned when connecting
+    assert "_NET_WM_STATE_FULLSCREEN" in conn.atoms.atoms
+    assert "QTILE_TEST_ONE" not in conn.atoms.atoms
+
+    conn.atoms.intern(["QTILE_TEST_ONE", "QTILE_TEST_TWO", "QTILE_TEST_ONE"])
+    one = conn.atoms["QTILE_TEST_ONE"]
+    two = conn.atoms["QTILE_TEST_TWO"]
+    assert one != two
+
+    # A new connection has to look the names up
+    other = xcbq.Connection(xmanager.display)
+    try:
+        assert other.atoms.get_names([two, one, two]) == [
+            "QTILE_TEST_TWO",
+            "QTILE_TEST_ONE",
+            "QTILE_TEST_TWO",
+        ]
+    finally:
+        other.finalize()
@@ -23,6 +23,15 @@ def test_color_pixel(xmanager):
     xmanager.c.eval('self.core.conn.color_pixel("ffffff")')
 
 
+def test_get_valid_timestamp(xmanager):
+    first = xmanager.c.eval("self.core.get_valid_timestamp()")
+    second = xmanager.c.eval("self.core.get_valid_timestamp()")
+    assert 0 < int(first) <= int(second)
+    # The connection is kept for the next timestamp
+    kept = xmanager.c.eval("self.core._timestamp_connection is not None")
+    assert kept == "True"
+
+
 @pytest.mark.parametrize("xmanager", [ManagerConfig], indirect=True)
 def test_net_client_list(xmanager, conn):
     def assert_clients(number):
@@ -0,0 +1,135 @@
+"""
+Benchmark of bar drawing
+
+Draws frames of a bar holding text and graph widgets, plus a mirror of one of
+the text widgets, and reports the frames per second with drawers that record
+and replay their operations on each frame and with persistent drawers. The
+window is stood in for by an ImageSurface, which the drawers paint to like the
+Wayland drawer does.
+
+Run with:
+
+    python -m test.benchmarks.bar_drawing
+"""
+
+import argparse
+import asyncio
+import itertools
+import random
+import time
+
+WIDTH = 1920
+SIZE = 24
+
+
+class Handle:
+    def cancel(self):
+        pass
+
+
+class FakeQtile:
+    def call_soon(self, func, *args):
+        for arg in args:
+            if asyncio.iscoroutine(arg):
+                arg.close()
+        return Handle()
+
+    call_later = call_soon
+
+
+def make_bar(persistent: bool, texts: int, graphs: int):
+    import cairocffi
+
+    from libqtile import bar, widget
+    from libqtile.backend.base import drawer
+    from libqtile.widget.graph import _Graph
+
+    class ImageDrawer(drawer.Drawer):
+        def _draw(self, offsetx=0, offsety=0, width=None, height=None, src_x=0, src_y=0):
+            with cairocffi.Context(self._win.buffer) as ctx:
+                ctx.set_operator(cairocffi.OPERATOR_SOURCE)
+                ctx.set_source_surface(self.surface, offsetx - src_x, offsety - src_y)
+                ctx.rectangle(
+                    offsetx,
+                    offsety,
+                    self.width if width is None else width,
+                    self.height if height is None else height,
+                )
+                ctx.fill()
+
+    class ImageWindow:
+        def __init__(self, width, height):
+            self.buffer = cairocffi.ImageSurface(cairocffi.FORMAT_ARGB32, width, height)
+
+        def create_drawer(self, width, height, persistent=False):
+            return ImageDrawer(self, width, height, persistent=persistent)
+
+    class RandomGraph(_Graph):
+        def tick(self):
+            self.push(random.randint(0, 100))
+
+    class BenchBar(bar.Bar):
+        def draw(self):
+            pass
+
+        def draw_widget(self, widget):
+            pass
+
+    text_widgets = [widget.TextBox(f"text {i}", width=80) for i in range(texts)]
+    graph_widgets = [
+        RandomGraph(type=graph_type)
+        for graph_type in itertools.islice(itertools.cycle(("box", "line", "linefill")), graphs)
+    ]
+    mirror = widget.Mirror(text_widgets[0])
+    widgets = [*text_widgets, *graph_widgets, mirror]
+
+    b = BenchBar(widgets, SIZE, persistent_drawers=persistent)
+    b.horizontal = True
+    b.length = b.width = WIDTH
+    b.height = SIZE
+    b.window = ImageWindow(WIDTH, SIZE)  # type: ignore[assignment]
+    b.drawer = b.window.create_drawer(WIDTH, SIZE, persistent=persistent)
+    qtile = FakeQtile()
+    for w in widgets:
+        w._configure(qtile, b)
+    b._resize(b.length, b.widgets)
+
+    def frame(count):
+        for w in text_widgets:
+            w.text = f"{w.name} {count}"
+            w.draw()
+        for g in graph_widgets:
+            g.tick()
+        mirror.draw()
+
+    return frame
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("-d", "--duration", type=float, default=3, help="Seconds per mode.")
+    parser.add_argument("-t", "--texts", type=int, default=20, help="Number of text widgets.")
+    parser.add_argument("-g", "--graphs", type=int, default=5, help="Number of graph widgets.")
+    args = parser.parse_args()
+
+    try:
+        bars = {
+            "recording": make_bar(False, args.texts, args.graphs),
+            "persistent": make_bar(True, args.texts, args.graphs),
+        }
+    except (ImportError, OSError) as e:
+        print(f"skipped: {str(e).splitlines()[0]}")
+        return
+
+    print(f"{'drawer':<12} {'fps':>10}")
+    for name, frame in bars.items():
+        frames = 0
+        end = time.perf_counter() + args.duration
+        while time.perf_counter() < end:
+            frame(frames)
+            frames += 1
+        print(f"{name:<12} {frames / args.duration:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
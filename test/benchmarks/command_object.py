@@ -0,0 +1,69 @@
+"""
+Microbenchmark of CommandObject creation
+
+Compares creating command objects with the exposed command table cached on
+their class against rebuilding it for every instance, which is what
+CommandObject.__new__ used to do. Only __new__ is timed, so the figures are
+independent of what each class does in its constructor.
+
+Run with:
+
+    python -m test.benchmarks.command_object
+"""
+
+import argparse
+import importlib
+import timeit
+
+from libqtile.command.base import CommandObject
+
+CLASSES = [
+    "libqtile.backend.x11.window.Window",
+    "libqtile.backend.x11.window.Internal",
+    "libqtile.group._Group",
+    "libqtile.layout.columns.Columns",
+    "libqtile.layout.xmonad.MonadTall",
+    "libqtile.widget.textbox.TextBox",
+    "libqtile.widget.tasklist.TaskList",
+]
+
+
+def load(path: str) -> type[CommandObject]:
+    module, name = path.rsplit(".", 1)
+    return getattr(importlib.import_module(module), name)
+
+
+def create_uncached(cls: type[CommandObject]) -> None:
+    type.__delattr__(cls, "_commands")
+    CommandObject.__new__(cls)
+
+
+def create_cached(cls: type[CommandObject]) -> None:
+    CommandObject.__new__(cls)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("-n", "--number", type=int, default=10000, help="Instances per class.")
+    args = parser.parse_args()
+
+    print(f"{'class':<40} {'uncached':>12} {'cached':>12} {'speedup':>8}")
+    for path in CLASSES:
+        try:
+            cls = load(path)
+        except (ImportError, OSError) as e:
+            print(f"{path:<40} skipped: {str(e).splitlines()[0]}")
+            continue
+
+        create_cached(cls)
+        uncached = timeit.timeit(lambda: create_uncached(cls), number=args.number)
+        cached = timeit.timeit(lambda: create_cached(cls), number=args.number)
+        name = path.rsplit(".", 1)[1]
+        print(
+            f"{name:<40} {uncached / args.number * 1e6:>10.2f}us "
+            f"{cached / args.number * 1e6:>10.2f}us {uncached / cached:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
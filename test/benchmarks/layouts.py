@@ -0,0 +1,442 @@
+"""
+Benchmark of the layouts
+
+Drives every layout in libqtile.layout through adding and removing windows,
+cycling focus, swapping and resizing, with stub windows that only record how
+they are placed, so no X server or compositor is needed. Each operation is
+followed by laying out the group, as it is in qtile. The time, the memory
+allocated (the peak traced by tracemalloc) and the number of place, hide and
+unhide calls are reported per operation.
+
+Results can be saved and later compared against, to spot regressions:
+
+    python -m test.benchmarks.layouts --save baseline.json
+    python -m test.benchmarks.layouts --compare baseline.json
+
+Run with:
+
+    python -m test.benchmarks.layouts
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import json
+import sys
+import time
+import tracemalloc
+from typing import TYPE_CHECKING
+
+from libqtile import layout
+from libqtile.config import ScreenRect
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from typing import Any
+
+WIDTH = 1920
+HEIGHT = 1080
+SIZES = (1, 10, 100, 500)
+
+# Layouts which need arguments to be useful
+CONFIGS: dict[str, dict[str, Any]] = {
+    "Slice": {"width": 400},
+    "Stack": {"num_stacks": 2},
+}
+
+# The first of these commands each layout has is used for the swap and resize
+# operations, with the given arguments
+SWAP_COMMANDS = (("shuffle_down", ()), ("shuffle_right", ()), ("move_down", ()))
+RESIZE_COMMANDS = (
+    ("grow_width", (10,)),
+    ("grow", ()),
+    ("grow_right", ()),
+    ("grow_main", ()),
+    ("increase_ratio", ()),
+)
+
+
+class Window:
+    """Stands in for a backend window, counting how it is placed"""
+
+    def __init__(self, wid: int, counter: list[int]) -> None:
+        self.wid = wid
+        self.name = f"window {wid}"
+        self._counter = counter
+        self.group: Group | None = None
+        self.has_focus = False
+        self.floating = False
+        self.fullscreen = False
+        self.maximized = False
+        self.minimized = False
+        self.float_x: int | None = None
+        self.float_y: int | None = None
+        self.x = 0
+        self.y = 0
+        self.width = 100
+        self.height = 100
+        self.hidden = True
+
+    def __repr__(self) -> str:
+        return f"<Window {self.wid}>"
+
+    def place(self, x, y, width, height, *args, **kwargs) -> None:
+        self._counter[0] += 1
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+
+    def hide(self) -> None:
+        self._counter[0] += 1
+        self.hidden = True
+
+    def unhide(self) -> None:
+        self._counter[0] += 1
+        self.hidden = False
+
+    def move_to_top(self) -> None:
+        pass
+
+    def bring_to_front(self) -> None:
+        pass
+
+    def paint_borders(self, *args, **kwargs) -> None:
+        pass
+
+    def match(self, match) -> bool:
+        return False
+
+    def has_user_set_position(self) -> bool:
+        return False
+
+    def is_transient_for(self) -> None:
+        return None
+
+    def get_wm_class(self) -> list[str]:
+        return ["bench"]
+
+    def info(self) -> dict[str, Any]:
+        return {"name": self.name, "wid": self.wid}
+
+
+class Internal:
+    """Stands in for the TreeTab panel, drawing to an ImageSurface"""
+
+    def __init__(self, width: int, height: int) -> None:
+        import cairocffi
+
+        self.buffer = cairocffi.ImageSurface(cairocffi.FORMAT_ARGB32, width, height)
+
+    def create_drawer(self, width, height, persistent=False):
+        from libqtile.backend.base import drawer
+
+        class ImageDrawer(drawer.Drawer):
+            def _draw(self, *args, **kwargs):
+                pass
+
+        return ImageDrawer(self, width, height, persistent=persistent)
+
+    def keep_below(self, enable=True) -> None:
+        pass
+
+    def place(self, *args, **kwargs) -> None:
+        pass
+
+    def hide(self) -> None:
+        pass
+
+    def unhide(self) -> None:
+        pass
+
+    def kill(self) -> None:
+        pass
+
+
+class Core:
+    def create_internal(self, x, y, width, height):
+        return Internal(width, height)
+
+
+class Qtile:
+    core = Core()
+
+
+class Screen:
+    def __init__(self, width: int, height: int) -> None:
+        self.x = self.y = 0
+        self.width = self.dwidth = width
+        self.height = self.dheight = height
+
+    def get_rect(self) -> ScreenRect:
+        return ScreenRect(self.x, self.y, self.width, self.height)
+
+
+class Group:
+    """The parts of a group the layouts use, holding a single layout"""
+
+    def __init__(self, layout_class: type[layout.base.Layout], config: dict[str, Any]) -> None:
+        self.name = "bench"
+        self.qtile = Qtile()
+        self.screen = Screen(WIDTH, HEIGHT)
+        self.windows: list[Window] = []
+        self.current_window: Window | None = None
+        self.counter = [0]
+        self._next_wid = 0
+        self.layout = layout_class(**config).clone(self)
+
+    def new_window(self) -> Window:
+        self._next_wid += 1
+        return Window(self._next_wid, self.counter)
+
+    def add(self, win: Window) -> None:
+        self.windows.append(win)
+        win.group = self
+        self.layout.add_client(win)
+        self.focus(win)
+
+    def remove(self, win: Window) -> None:
+        self.windows.remove(win)
+        win.group = None
+        nextfocus = self.layout.remove(win)
+        if win is self.current_window:
+            win.has_focus = False
+            self.current_window = None
+        self.focus(nextfocus or self.layout.focus_first())
+
+    def focus(self, win: Window | None, warp: bool = True, force: bool = False) -> None:
+        if win is not None and win not in self.windows:
+            return
+        if self.current_window is not None:
+            self.current_window.has_focus = False
+        self.current_window = win
+        if win is not None:
+            win.has_focus = True
+            self.layout.focus(win)
+        self.layout_all()
+
+    def layout_all(self, warp: bool = False, focus: bool = True) -> None:
+        if self.windows:
+            self.layout.layout(self.windows, self.screen.get_rect())
+
+
+def command(group: Group, commands: tuple[tuple[str, tuple], ...]) -> Callable[[], None] | None:
+    for name, args in commands:
+        cmd = getattr(group.layout, name, None)
+        if cmd is not None:
+            return functools.partial(cmd, *args)
+    return None
+
+
+def operations(group: Group) -> dict[str, tuple[Callable[[], None], Callable[[], None]] | None]:
+    """The operations to time, each with the untimed step that undoes it"""
+    added: list[Window] = []
+    removed: list[Window] = []
+
+    def add():
+        win = group.new_window()
+        added.append(win)
+        group.add(win)
+
+    def undo_add():
+        group.remove(added.pop())
+
+    def remove():
+        win = group.current_window or group.windows[-1]
+        removed.append(win)
+        group.remove(win)
+
+    def undo_remove():
+        group.add(removed.pop())
+
+    def noop():
+        pass
+
+    ops: dict[str, tuple[Callable[[], None], Callable[[], None]] | None] = {
+        "add": (add, undo_add),
+        "remove": (remove, undo_remove),
+        "focus": (group.layout.next, noop),
+    }
+    swap = command(group, SWAP_COMMANDS)
+    resize = command(group, RESIZE_COMMANDS)
+    ops["swap"] = (swap, noop) if swap is not None else None
+    ops["resize"] = (resize, noop) if resize is not None else None
+    return ops
+
+
+class TooSlow(Exception):
+    pass
+
+
+def measure(
+    layout_class: type[layout.base.Layout], size: int, repeat: int, budget: float
+) -> dict[str, dict[str, float] | None]:
+    """Time each operation on a group holding size windows"""
+    group = Group(layout_class, CONFIGS.get(layout_class.__name__, {}))
+    deadline = time.perf_counter() + budget
+    for _ in range(size):
+        group.add(group.new_window())
+        if time.perf_counter() > deadline:
+            raise TooSlow(f"adding {size} windows took over {budget:g}s")
+
+    results: dict[str, dict[str, float] | None] = {}
+    for name, op in operations(group).items():
+        if op is None:
+            results[name] = None
+            continue
+        run, undo = op
+
+        best = float("inf")
+        calls = 0
+        for _ in range(repeat):
+            before = group.counter[0]
+            start = time.perf_counter()
+            run()
+            best = min(best, time.perf_counter() - start)
+            calls = group.counter[0] - before
+            undo()
+
+        tracemalloc.start()
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        undo()
+
+        results[name] = {"time": best, "alloc": peak, "calls": calls}
+    return results
+
+
+def layout_classes(names: list[str] | None = None) -> list[type[layout.base.Layout]]:
+    return [getattr(layout, name) for name in names or layout.__all__]
+
+
+def run(
+    names: list[str] | None = None,
+    sizes: tuple[int, ...] = SIZES,
+    repeat: int = 5,
+    budget: float = 10,
+    callback: Callable[[str, str, dict[str, dict[str, float] | None]], None] | None = None,
+) -> dict[str, dict[str, dict[str, dict[str, float] | None]]]:
+    """Measure every layout at every size, keyed by layout, size and operation
+
+    A layout isn't measured at larger sizes once adding the windows takes more
+    than budget seconds, or exceeds the recursion limit.
+    """
+    results: dict[str, dict[str, dict[str, dict[str, float] | None]]] = {}
+    for cls in layout_classes(names):
+        name = cls.__name__
+        for size in sizes:
+            try:
+                result = measure(cls, size, repeat, budget)
+            except (ImportError, OSError) as e:
+                print(f"{name:<14} skipped: {str(e).splitlines()[0]}", file=sys.stderr)
+                break
+            except TooSlow as e:
+                print(f"{name:<14} stopped: {e}", file=sys.stderr)
+                break
+            except RecursionError:
+                print(f"{name:<14} stopped: too deep at {size} windows", file=sys.stderr)
+                break
+            results.setdefault(name, {})[str(size)] = result
+            if callback is not None:
+                callback(name, str(size), result)
+    return results
+
+
+def compare(
+    results: dict, baseline: dict, threshold: float
+) -> list[tuple[str, str, str, str, float]]:
+    """The measurements which got worse than the baseline by more than threshold"""
+    regressions = []
+    for name, sizes in results.items():
+        for size, ops in sizes.items():
+            for op, result in ops.items():
+                base = baseline.get(name, {}).get(size, {}).get(op)
+                if not result or not base:
+                    continue
+                if result["calls"] > base["calls"]:
+                    ratio = result["calls"] / base["calls"] if base["calls"] else float("inf")
+                    regressions.append((name, size, op, "calls", ratio))
+                for metric in ("time", "alloc"):
+                    ratio = result[metric] / base[metric] if base[metric] else 0
+                    if ratio > threshold:
+                        regressions.append((name, size, op, metric, ratio))
+    return regressions
+
+
+def report(
+    name: str, size: str, ops: dict[str, dict[str, float] | None], baseline: dict | None
+) -> None:
+    for op, result in ops.items():
+        if result is None:
+            print(f"{name:<14} {size:>7} {op:<7} {'-':>10}")
+            continue
+        line = (
+            f"{name:<14} {size:>7} {op:<7} {result['time'] * 1e6:>8.1f}us "
+            f"{result['alloc'] / 1024:>8.1f}K {result['calls']:>6}"
+        )
+        base = (baseline or {}).get(name, {}).get(size, {}).get(op)
+        if base:
+            line += f" {result['time'] / base['time']:>6.2f}x"
+        print(line, flush=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("layouts", nargs="*", help="Layouts to run, all by default.")
+    parser.add_argument(
+        "-s",
+        "--sizes",
+        type=lambda s: tuple(int(i) for i in s.split(",")),
+        default=SIZES,
+        help="Comma separated numbers of windows.",
+    )
+    parser.add_argument("-r", "--repeat", type=int, default=5, help="Runs per operation.")
+    parser.add_argument("--save", metavar="FILE", help="Save the results as a baseline.")
+    parser.add_argument("--compare", metavar="FILE", help="Compare against a saved baseline.")
+    parser.add_argument(
+        "-t",
+        "--threshold",
+        type=float,
+        default=1.5,
+        help="Slowdown (or growth in allocations) over the baseline to fail on.",
+    )
+    parser.add_argument(
+        "-b",
+        "--budget",
+        type=float,
+        default=10,
+        help="Seconds adding windows may take before larger sizes are skipped.",
+    )
+    args = parser.parse_args()
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+
+    print(f"{'layout':<14} {'windows':>7} {'op':<7} {'time':>10} {'alloc':>10} {'calls':>6}")
+    results = run(
+        args.layouts,
+        args.sizes,
+        args.repeat,
+        args.budget,
+        lambda name, size, ops: report(name, size, ops, baseline),
+    )
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(results, f, indent=2)
+            f.write("\n")
+
+    if baseline is not None:
+        regressions = compare(results, baseline, args.threshold)
+        for name, size, op, metric, ratio in regressions:
+            print(f"regression: {name} {op} at {size} windows, {metric} {ratio:.2f}x")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
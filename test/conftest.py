@@ -106,8 +106,8 @@ def fake_window():
 
         window = _NestedWindow()
 
-        def create_drawer(self, width, height):
-            return drawer.Drawer(self, width, height)
+        def create_drawer(self, width, height, persistent=False):
+            return drawer.Drawer(self, width, height, persistent=persistent)
 
     return FakeWindow()
 
@@ -0,0 +1,82 @@
+import asyncio
+
+from libqtile.command.base import CommandObject, expose_command
+from libqtile.command.interface import IPCCommandServer
+from libqtile.core.drag import DragEngine
+from libqtile.lazy import lazy
+
+
+class FakeQtile(CommandObject):
+    current_window = None
+    locked = False
+
+    def __init__(self, loop):
+        self.loop = loop
+        self.windows_map = {}
+        self.server = IPCCommandServer(self)
+        self.moves = []
+        self.selects = 0
+
+    def select(self, selectors):
+        self.selects += 1
+        return super().select(selectors)
+
+    def call_soon(self, func, *args):
+        return self.loop.call_soon(func, *args)
+
+    def call_later(self, delay, func, *args):
+        return self.loop.call_later(delay, func, *args)
+
+    @expose_command()
+    def move(self, x, y):
+        self.moves.append((x, y))
+
+    def _items(self, name):
+        return None
+
+    def _select(self, name, sel):
+        return None
+
+
+def test_drag_coalesces_motion():
+    async def t():
+        qtile = FakeQtile(asyncio.get_running_loop())
+        drag = DragEngine(qtile, 10, 10, 100, 100, [lazy.move()], rate=20)
+        assert qtile.selects == 1
+
+        for i in range(1, 6):
+            drag.motion(10 + i, 10 + i)
+        await asyncio.sleep(0)
+        # only the newest position is applied, through the resolved command
+        assert qtile.moves == [(105, 105)]
+        assert drag.coalesced == 4
+        assert qtile.selects == 1
+
+        # the next frame isn't due yet
+        drag.motion(20, 10)
+        drag.motion(30, 10)
+        await asyncio.sleep(0)
+        assert qtile.moves == [(105, 105)]
+        await asyncio.sleep(0.1)
+        assert qtile.moves == [(105, 105), (120, 100)]
+
+        # releasing the button applies the last position straight away
+        drag.motion(40, 40)
+        drag.stop()
+        assert qtile.moves[-1] == (130, 130)
+        await asyncio.sleep(0.1)
+        assert len(qtile.moves) == 3
+
+    asyncio.run(t())
+
+
+def test_drag_unresolved_command():
+    async def t():
+        qtile = FakeQtile(asyncio.get_running_loop())
+        drag = DragEngine(qtile, 0, 0, 0, 0, [lazy.nonexistent()], rate=60)
+        drag.motion(5, 5)
+        drag.stop()
+        assert drag.applied == 1
+        assert qtile.moves == []
+
+    asyncio.run(t())
@@ -3,7 +3,7 @@ import pytest
 import libqtile
 from libqtile.command.base import expose_command
 from libqtile.confreader import Config
-from libqtile.layout.base import _SimpleLayoutBase
+from libqtile.layout.base import Placement, _SimpleLayoutBase
 
 
 class DummyLayout(_SimpleLayoutBase):
@@ -71,3 +71,48 @@ def test_base_client_position_top(manager):
     manager.test_window("one")
     manager.test_window("two")
     assert manager.c.layout.info()["clients"] == ["two", "one"]
+
+
+class ColumnsLayout(_SimpleLayoutBase):
+    """Puts each client in its own column, hiding all but the first three"""
+
+    def arrange(self, windows, screen_rect):
+        arrangement = dict.fromkeys(windows)
+        width = screen_rect.width // 3
+        for index, client in enumerate(self.clients[:3]):
+            arrangement[client] = Placement(
+                screen_rect.x + index * width, screen_rect.y, width, screen_rect.height
+            )
+        return arrangement
+
+    @expose_command("up")
+    def previous(self):
+        _SimpleLayoutBase.previous(self)
+
+    @expose_command("down")
+    def next(self):
+        _SimpleLayoutBase.next(self)
+
+
+class ArrangeConfig(BaseLayoutConfigBottom):
+    layouts = [ColumnsLayout()]
+
+
+@pytest.mark.parametrize("manager", [ArrangeConfig], indirect=True)
+def test_arrange(manager):
+    for name in ("one", "two", "three", "four"):
+        manager.test_window(name)
+
+    windows = {w["name"]: w for w in manager.c.windows()}
+    assert [windows[name]["x"] for name in ("one", "two", "three")] == [0, 266, 532]
+    assert all(windows[name]["width"] == 266 for name in ("one", "two", "three"))
+    visible = "[w.is_visible() for w in self.current_group.windows]"
+    assert manager.c.eval(visible) == "[True, True, True, False]"
+
+    # configure is still usable on layouts that only implement arrange
+    manager.c.eval("self.current_group.windows[3].unhide()")
+    manager.c.eval(
+        "self.current_layout.configure("
+        "self.current_group.windows[3], self.current_screen.get_rect())"
+    )
+    assert manager.c.eval(visible) == "[True, True, True, False]"
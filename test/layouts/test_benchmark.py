@@ -0,0 +1,38 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from libqtile import layout
+from test.benchmarks import layouts as benchmark
+
+# Saved with: python -m test.benchmarks.layouts --sizes 1,10 --repeat 1 --save <file>
+# Some operations are not undone, so the calls depend on the number of repeats
+BASELINE = Path(benchmark.__file__).with_name("layouts_baseline.json")
+
+
+@pytest.mark.parametrize("name", layout.__all__)
+def test_benchmark_layout(name):
+    results = benchmark.run([name], sizes=(1, 10), repeat=1)
+    ops = results[name]["10"]
+    assert ops["add"]["calls"] >= 10
+    assert ops["focus"] is not None
+
+    # Only the number of place, hide and unhide calls is deterministic enough to
+    # be checked, time and allocations depend on the machine
+    with open(BASELINE) as f:
+        baseline = json.load(f)
+    assert name in baseline
+    regressions = benchmark.compare(results, baseline, float("inf"))
+    assert [r for r in regressions if r[3] == "calls"] == []
+
+
+def test_benchmark_compare():
+    results = benchmark.run(["Max"], sizes=(5,), repeat=1)
+    assert benchmark.compare(results, results, 1.5) == []
+
+    worse = {"Max": {"5": {"add": dict(results["Max"]["5"]["add"])}}}
+    worse["Max"]["5"]["add"]["calls"] += 1
+    worse["Max"]["5"]["add"]["time"] *= 2
+    regressions = benchmark.compare(worse, results, 1.5)
+    assert {(r[2], r[3]) for r in regressions} == {("add", "calls"), ("add", "time")}
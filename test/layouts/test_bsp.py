@@ -114,3 +114,32 @@ def test_bsp_swap():
     bsp.swap("one", "five")
 
     assert bsp.get_windows() == ["two", "one", "three", "five", "four"]
+
+
+def test_bsp_node_index():
+    bsp = layout.Bsp()
+    bsp._group = libqtile.group._Group("A")
+
+    def assert_index():
+        windows = bsp.get_windows()
+        assert len(bsp._nodes) == len(windows)
+        for window in windows:
+            assert bsp.get_node(window).client == window
+
+    for name in ("one", "two", "three", "four", "five"):
+        bsp.add_client(name)
+        assert_index()
+
+    bsp.focus("two")
+    bsp.shuffle_up()
+    assert_index()
+    bsp.shuffle_left()
+    assert_index()
+    bsp.swap("one", "five")
+    assert_index()
+
+    bsp.remove("three")
+    assert_index()
+    bsp.remove("one")
+    assert_index()
+    assert bsp.get_node("one") is None
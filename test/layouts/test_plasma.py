@@ -462,6 +462,26 @@ def test_find_payload(root, grid):
     assert root.find_payload("x") is None
 
 
+def test_find_payload_after_change(root, grid):
+    a, b, c, d, e = grid
+    pa, pb, pd = a.payload, b.payload, d.payload
+    assert root.find_payload(pa) is a
+    a.payload, b.payload = pb, pa
+    assert root.find_payload(pa) is b
+    assert root.find_payload(pb) is a
+    d.remove()
+    assert root.find_payload(pd) is None
+
+
+def test_geometry_after_change(root, grid):
+    a, b, c, d, e = grid
+    assert (b.x, b.width) == (60, 60)
+    root.width = 240
+    assert (b.x, b.width) == (120, 120)
+    a.width = 40
+    assert (b.x, b.width) == (40, 200)
+
+
 def test_last_access(grid):
     a, b, c, d, e = grid
     f = Node("f")
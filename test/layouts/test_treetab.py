@@ -1,6 +1,8 @@
 import pytest
 
 import libqtile.config
+import libqtile.group
+import libqtile.hook
 from libqtile import layout
 from libqtile.confreader import Config
 from test.layouts.layout_utils import assert_focus_path, assert_focused
@@ -152,3 +154,139 @@ def test_sort_windows(manager):
         'Odd': [['101'], ['103']]
     }
     """
+
+
+class FakeTextLayout:
+    height = 10
+
+    def __init__(self, text):
+        self.text = text
+        self.width = None
+        self.colour = None
+
+    def framed(self, border_width, border_color, pad_x, pad_y):
+        return self
+
+    def draw(self, x, y):
+        pass
+
+    def draw_fill(self, x, y):
+        pass
+
+    def finalize(self):
+        pass
+
+
+class FakeDrawer:
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.painted = []
+        self.copied = []
+
+    def textlayout(self, text, *args, **kwargs):
+        return FakeTextLayout(text)
+
+    def clear_rect(self, x, y, width, height):
+        self.painted.append((y, height))
+
+    def set_source_rgb(self, colour):
+        pass
+
+    def fillrect(self, x, y, width, height):
+        pass
+
+    def draw_hbar(self, *args, **kwargs):
+        pass
+
+    def draw(self, offsetx, offsety, width, height, src_y):
+        self.copied.append((offsety, height))
+
+    def finalize(self):
+        pass
+
+
+class FakePanel:
+    def __init__(self):
+        self.placed = 0
+
+    def create_drawer(self, width, height):
+        return FakeDrawer(width, height)
+
+    def place(self, *args):
+        self.placed += 1
+
+    def keep_below(self, enable):
+        pass
+
+    def unhide(self):
+        pass
+
+
+class FakeWindow:
+    urgent = False
+
+    def __init__(self, name):
+        self.name = name
+
+
+def test_treetab_incremental_panel(monkeypatch):
+    monkeypatch.setattr(libqtile.hook, "subscriptions", {})
+    panel = FakePanel()
+    focused = []
+    group = libqtile.group._Group("A")
+    group.qtile = type("Qtile", (), {})()
+    group.qtile.core = type("Core", (), {"create_internal": lambda *args: panel})()
+    group.focus = lambda win, warp: focused.append(win)
+    # without the section label's margins, labels are 10 high and tabs 14
+    # (with the vspace and border)
+    tab = layout.TreeTab(
+        sections=["Foo"], section_top=0, section_padding=0, section_bottom=6
+    ).clone(group)
+
+    windows = [FakeWindow(name) for name in ("one", "two", "three")]
+    for win in windows:
+        tab.add_client(win)
+    tab.focus(windows[0])
+    rect = libqtile.config.ScreenRect(0, 0, 800, 600)
+    tab.show(rect)
+    drawer = tab._drawer
+    assert panel.placed == 1
+    assert tab._row_tops == [0, 10, 24, 38, 52]
+    assert drawer.painted == [(0, 10), (10, 14), (24, 14), (38, 14), (52, 6), (58, 542)]
+    assert drawer.copied == [(0, 600)]
+
+    # an unchanged panel isn't placed or drawn again
+    drawer.painted.clear()
+    drawer.copied.clear()
+    tab.show(rect)
+    assert panel.placed == 1
+    assert drawer.painted == drawer.copied == []
+
+    # only the tabs losing and gaining focus are drawn, as separate runs
+    tab.focus(windows[2])
+    tab.draw_panel()
+    assert drawer.painted == drawer.copied == [(10, 14), (38, 14)]
+
+    drawer.painted.clear()
+    drawer.copied.clear()
+    windows[1].name = "TWO"
+    tab.draw_panel()
+    assert drawer.painted == drawer.copied == [(24, 14)]
+
+    # removing a tab focuses the first one and moves the ones below, clearing
+    # the space left over
+    drawer.painted.clear()
+    drawer.copied.clear()
+    tab.remove(windows[1])
+    assert tab._row_tops == [0, 10, 24, 38]
+    assert drawer.painted == [(10, 14), (24, 14), (38, 6), (44, 14)]
+    assert drawer.copied == [(10, 48)]
+    assert tab._drawer is drawer
+
+    # clicks only hit the tabs
+    tab.process_button_click(5, 30, 1)
+    tab.process_button_click(5, 5, 1)
+    tab.process_button_click(5, 40, 1)
+    tab.process_button_click(5, 500, 1)
+    assert focused == [windows[2]]
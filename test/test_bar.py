@@ -297,6 +297,72 @@ def test_resize(manager):
         assert off(dwidget_list) == [0, 10, 90]
 
 
+class DrawnWidget(DWidget):
+    def __init__(self, length, length_type):
+        DWidget.__init__(self, length, length_type)
+        self.drawn = 0
+
+    def draw(self):
+        self.drawn += 1
+
+
+def test_partial_redraw():
+    def drawn(widgets):
+        drawn = [w.drawn for w in widgets]
+        for w in widgets:
+            w.drawn = 0
+        return drawn
+
+    widgets = [
+        DrawnWidget(10, libqtile.bar.CALCULATED),
+        DrawnWidget(10, libqtile.bar.CALCULATED),
+        DrawnWidget(10, libqtile.bar.CALCULATED),
+        DrawnWidget(10, libqtile.bar.CALCULATED),
+    ]
+    b = DBarH(widgets, 100)
+    b.length = 100
+    b._full_draw = False
+
+    # There is no drawer to fill the end of the bar without a window
+    b._fill_unoccupied = lambda: None
+
+    # The first layout repaints every widget
+    b._actual_draw()
+    assert drawn(widgets) == [1, 1, 1, 1]
+
+    # Only dirty widgets are repainted while lengths are unchanged
+    b._dirty.add(widgets[1])
+    b._actual_draw()
+    assert drawn(widgets) == [0, 1, 0, 0]
+    assert [w.offsetx for w in widgets] == [0, 10, 20, 30]
+
+    # A change of length repaints the widgets that it moved
+    widgets[1].length = 20
+    b._dirty.add(widgets[1])
+    b._actual_draw()
+    assert drawn(widgets) == [0, 1, 1, 1]
+    assert [w.offsetx for w in widgets] == [0, 10, 30, 40]
+
+    # Widgets moved by a stretch widget are repainted too
+    widgets[2].length_type = libqtile.bar.STRETCH
+    b._dirty.add(widgets[0])
+    b._actual_draw()
+    assert drawn(widgets) == [1, 0, 1, 1]
+    assert [w.offsetx for w in widgets] == [0, 10, 30, 90]
+
+    # A hidden widget becoming a stretch widget is laid out again
+    widgets[2].length_type = libqtile.bar.CALCULATED
+    widgets[2].length = 0
+    b._actual_draw()
+    assert drawn(widgets) == [0, 0, 1, 1]
+    assert [w.offsetx for w in widgets] == [0, 10, 30, 30]
+    widgets[2].length_type = libqtile.bar.STRETCH
+    b._dirty.add(widgets[0])
+    b._actual_draw()
+    assert drawn(widgets) == [1, 0, 1, 1]
+    assert [w.offsetx for w in widgets] == [0, 10, 30, 90]
+
+
 class ExampleWidget(libqtile.widget.base._Widget):
     orientations = libqtile.widget.base.ORIENTATION_HORIZONTAL
 
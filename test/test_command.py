@@ -9,8 +9,14 @@ import libqtile.layout
 import libqtile.log_utils
 import libqtile.widget
 from libqtile.command.base import CommandError, CommandException, CommandObject, expose_command
-from libqtile.command.client import CommandClient
-from libqtile.command.interface import IPCCommandInterface
+from libqtile.command.client import CommandClient, InteractiveCommandClient
+from libqtile.command.interface import (
+    ERROR,
+    SUCCESS,
+    IPCCommandInterface,
+    IPCCommandServer,
+    QtileCommandInterface,
+)
 from libqtile.confreader import Config
 from libqtile.ipc import Client, IPCError
 from libqtile.lazy import lazy
@@ -140,6 +146,97 @@ def test_command():
     assert not c.command("nonexistent")
 
 
+def test_commands_cached_per_class():
+    class SubCommandObject(FakeCommandObject):
+        @expose_command()
+        def four(self):
+            pass
+
+        def two(self, a):
+            return a
+
+    FakeCommandObject()
+    table = FakeCommandObject._commands
+    sub = SubCommandObject()
+
+    # the parent table is reused, not rebuilt or altered by the subclass
+    FakeCommandObject()
+    assert FakeCommandObject._commands is table
+    assert "four" not in FakeCommandObject().commands()
+
+    assert "four" in sub.commands()
+    assert sub.command("two") is SubCommandObject.two
+
+
+class FakeRoot(CommandObject):
+    locked = False
+
+    @expose_command()
+    def double(self, a: int):
+        return a * 2
+
+    @expose_command()
+    def fail(self):
+        raise CommandError("failed")
+
+    def _items(self, name):
+        return None
+
+    def _select(self, name, sel):
+        return None
+
+
+def test_batch_server():
+    server = IPCCommandServer(FakeRoot())
+    status, replies = server.call(
+        {
+            "type": "batch",
+            "calls": [
+                ([], "double", ("2",), {}, True),
+                ([], "fail", (), {}, False),
+                ([], "double", (3,), {}, False),
+                ([], "nonexistent", (), {}, False),
+            ],
+        }
+    )
+    assert status == SUCCESS
+    assert replies == [(SUCCESS, 4), (ERROR, "failed"), (SUCCESS, 6), (ERROR, "No such command")]
+
+    status, replies = server.call(
+        {
+            "type": "batch",
+            "calls": [([], "double", (1,), {}, False), ([], "fail", (), {}, False)] * 2,
+            "stop_on_error": True,
+        }
+    )
+    assert replies == [(SUCCESS, 2), (ERROR, "failed")]
+
+
+def test_batch_client():
+    root = FakeRoot()
+    client = CommandClient(QtileCommandInterface(root)).batch()
+    assert client.call("double", 2) == 0
+    assert client.call("fail") == 1
+    assert client.call("double", 4) == 2
+    results = client.send_batch()
+    assert results[0] == 4
+    assert isinstance(results[1], CommandError)
+    assert results[2] == 8
+
+    # the batch is emptied once sent
+    assert client.send_batch() == []
+
+    interactive = InteractiveCommandClient(QtileCommandInterface(root)).batch()
+    interactive.fail()
+    interactive.double(5)
+    results = interactive.send_batch(stop_on_error=True)
+    assert len(results) == 1
+    assert isinstance(results[0], CommandError)
+
+    with pytest.raises(CommandError):
+        InteractiveCommandClient(QtileCommandInterface(root)).send_batch()
+
+
 class DecoratedTextBox(libqtile.widget.TextBox):
     @expose_command("mapped")
     def exposed(self):
@@ -407,6 +504,29 @@ def test_select_widget(manager):
         widget.bar["bottom"]
 
 
+@server_config
+def test_batch_manager_call(manager):
+    batch = manager.c.batch()
+    batch.get_groups()
+    batch.group["b"].info()
+    batch.widget["one"].info()
+    batch.group["nonexistent"].info()
+    batch.layout.info()
+
+    groups, group, widget, missing, layout = batch.send_batch()
+    assert set(groups) == {"a", "b", "c"}
+    assert group["name"] == "b"
+    assert widget["name"] == "one"
+    assert isinstance(missing, CommandError)
+    assert layout["name"] == "stack"
+
+    batch.group["nonexistent"].info()
+    batch.layout.info()
+    results = batch.send_batch(stop_on_error=True)
+    assert len(results) == 1
+    assert isinstance(results[0], CommandError)
+
+
 def test_core_node(manager, backend_name):
     assert manager.c.core.info()["backend"] == backend_name
 
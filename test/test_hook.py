@@ -6,6 +6,7 @@ import pytest
 import libqtile.log_utils
 import libqtile.utils
 from libqtile import hook, layout
+from libqtile.profiling import profiler
 from libqtile.resources import default_config
 from test.conftest import BareConfig, dualmonitor
 from test.helpers import Retry
@@ -111,6 +112,218 @@ def test_can_unsubscribe_from_hook():
     assert test.val == 3
 
 
+@pytest.mark.usefixtures("hook_fixture")
+def test_observers_survive_clear():
+    events = []
+
+    def observer(event, *args):
+        events.append((event, args))
+
+    hook.observe("group_window_add", observer)
+    hook.clear()
+    hook.fire("group_window_add", 3)
+    assert events == [("group_window_add", (3,))]
+
+    hook.unobserve("group_window_add", observer)
+    hook.fire("group_window_add", 4)
+    assert events == [("group_window_add", (3,))]
+
+    with pytest.raises(libqtile.utils.QtileError):
+        hook.observe("unknown", observer)
+
+
+@pytest.mark.usefixtures("hook_fixture")
+def test_dispatch_follows_subscription_changes():
+    first = Call(0)
+    second = Call(0)
+
+    hook.subscribe.group_window_add(first)
+    hook.fire("group_window_add", 1)
+    hook.subscribe.group_window_add(second)
+    hook.fire("group_window_add", 2)
+    assert (first.val, second.val) == (2, 2)
+
+    # subscription lists may be changed directly too
+    hook.subscriptions["qtile"]["group_window_add"].remove(first)
+    hook.fire("group_window_add", 3)
+    assert (first.val, second.val) == (2, 3)
+
+    # including replacing a subscriber without changing the length of the list
+    hook.subscriptions["qtile"]["group_window_add"][0] = first
+    hook.fire("group_window_add", 4)
+    assert (first.val, second.val) == (4, 3)
+
+    del hook.subscriptions["qtile"]["group_window_add"]
+    hook.fire("group_window_add", 5)
+    assert (first.val, second.val) == (4, 3)
+
+
+@pytest.mark.usefixtures("hook_fixture")
+def test_transient_subscriber():
+    calls = []
+
+    def once(val):
+        calls.append(val)
+        return True
+
+    hook.subscribe.group_window_add(once)
+    hook.fire("group_window_add", 1)
+    hook.fire("group_window_add", 2)
+    assert calls == [1]
+
+
+@pytest.mark.usefixtures("hook_fixture")
+def test_subscriber_enables_profiling():
+    def enable(val):
+        profiler.enable()
+
+    hook.subscribe.group_window_add(enable)
+    try:
+        hook.fire("group_window_add", 1)
+        # the hook that turned profiling on isn't recorded, the next one is
+        assert ("hook", "group_window_add") not in profiler.handlers
+        hook.fire("group_window_add", 2)
+        assert profiler.handlers[("hook", "group_window_add")].calls == 1
+    finally:
+        profiler.enable(False)
+
+
+@pytest.mark.usefixtures("hook_fixture")
+def test_coalesced_subscriber():
+    calls = []
+
+    def handler(*args):
+        calls.append(args)
+
+    async def wrapper():
+        hook.subscribe.group_window_add(handler, coalesce=True)
+        hook.fire("group_window_add", 1)
+        hook.fire("group_window_add", 2)
+        hook.fire("group_window_add", 3)
+        assert calls == []
+        await asyncio.sleep(0)
+        assert calls == [(3,)]
+
+        hook.unsubscribe.group_window_add(handler)
+        hook.fire("group_window_add", 4)
+        await asyncio.sleep(0)
+        assert calls == [(3,)]
+
+    asyncio.run(wrapper())
+
+
+@pytest.mark.usefixtures("hook_fixture")
+def test_coalesced_subscriber_key():
+    calls = []
+
+    def handler(val):
+        calls.append(val)
+
+    async def wrapper():
+        hook.subscribe.group_window_add(coalesce=lambda val: val % 2, delay=0.01)(handler)
+        for val in range(5):
+            hook.fire("group_window_add", val)
+        await asyncio.sleep(0)
+        assert calls == []
+        await asyncio.sleep(0.05)
+        assert calls == [3, 4]
+
+    asyncio.run(wrapper())
+
+
+@pytest.mark.usefixtures("hook_fixture")
+def test_coalesced_transient_subscriber():
+    calls = []
+
+    def once(val):
+        calls.append(val)
+        return True
+
+    async def wrapper():
+        hook.subscribe.group_window_add(once, coalesce=True)
+        hook.fire("group_window_add", 1)
+        await asyncio.sleep(0)
+        hook.fire("group_window_add", 2)
+        await asyncio.sleep(0)
+        assert calls == [1]
+        assert not hook.subscriptions["qtile"]["group_window_add"]
+
+    asyncio.run(wrapper())
+
+
+@pytest.mark.usefixtures("hook_fixture")
+def test_coalesced_subscriber_several_events():
+    calls = []
+
+    def handler(*args):
+        calls.append(args)
+
+    async def wrapper():
+        hook.subscribe.group_window_add(handler, coalesce=True)
+        hook.subscribe.focus_change(handler, coalesce=True)
+        hook.fire("group_window_add", 1)
+        hook.fire("focus_change")
+        await asyncio.sleep(0)
+        assert calls == [()]
+
+        # Still delivered for the events it remains subscribed to
+        hook.unsubscribe.focus_change(handler)
+        hook.fire("group_window_add", 2)
+        hook.fire("focus_change")
+        await asyncio.sleep(0)
+        assert calls == [(), (2,)]
+
+    asyncio.run(wrapper())
+
+
+@pytest.mark.usefixtures("hook_fixture")
+def test_coalesced_transient_subscriber_several_events():
+    calls = []
+
+    def once(*args):
+        calls.append(args)
+        return True
+
+    async def wrapper():
+        hook.subscribe.group_window_add(once, coalesce=True)
+        hook.subscribe.focus_change(once, coalesce=True)
+        hook.fire("focus_change")
+        await asyncio.sleep(0)
+        assert calls == [()]
+        assert not hook.subscriptions["qtile"]["group_window_add"]
+        assert not hook.subscriptions["qtile"]["focus_change"]
+
+    asyncio.run(wrapper())
+
+
+@pytest.mark.usefixtures("hook_fixture")
+def test_coalesced_subscriber_without_loop():
+    test = Call(0)
+    hook.subscribe.group_window_add(test, coalesce=True)
+    hook.fire("group_window_add", 8)
+    assert test.val == 8
+
+
+@pytest.mark.usefixtures("hook_fixture")
+def test_hook_timings():
+    test = Call(0)
+    hook.subscribe.group_window_add(test)
+
+    hook.fire("group_window_add", 1)
+    assert hook.qtile_hooks.timings is None
+
+    hook.qtile_hooks.enable_timings()
+    try:
+        hook.fire("group_window_add", 2)
+        hook.fire("group_window_add", 3)
+        (timing,) = hook.qtile_hooks.timings["group_window_add"].values()
+        assert timing["calls"] == 2
+        assert 0 <= timing["max"] <= timing["total"]
+    finally:
+        hook.qtile_hooks.enable_timings(False)
+    assert hook.qtile_hooks.timings is None
+
+
 def test_can_subscribe_to_startup_hooks(manager_nospawn):
     config = BareConfig
     for attr in dir(default_config):
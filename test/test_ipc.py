@@ -1,6 +1,9 @@
+import asyncio
+
 import pytest
 
-from libqtile.ipc import _IPC
+from libqtile import ipc
+from libqtile.ipc import _IPC, Client, PersistentClient, Server
 
 
 def test_ipc_json_encoder_supports_sets():
@@ -27,3 +30,113 @@ def test_ipc_marshall_error_on_unsupported_field():
 
     with pytest.raises(ValueError, match="unmarshallable object"):
         _IPC.pack({"foo": NonSerializableType()})
+
+
+@pytest.mark.asyncio
+async def test_ipc_framed_connection_pipelines_requests(tmp_path):
+    received = []
+
+    def handler(msg):
+        received.append(msg)
+        return ("reply", msg)
+
+    async with Server(str(tmp_path / "sock"), handler):
+        client = PersistentClient(str(tmp_path / "sock"))
+        replies = await client.async_send_many([1, "two", (3,)])
+        assert replies == [("reply", 1), ("reply", "two"), ("reply", (3,))]
+        writer = client._writer
+
+        # the connection is reused for subsequent requests
+        assert await client.async_send({"four": 4}) == ("reply", {"four": 4})
+        assert client._writer is writer
+        await client.async_close()
+
+    assert received == [1, "two", (3,), {"four": 4}]
+
+
+@pytest.mark.asyncio
+async def test_ipc_framed_connection_errors(tmp_path, monkeypatch):
+    client = PersistentClient(str(tmp_path / "sock"))
+    with pytest.raises(ipc.IPCError):
+        await client.async_send(1)
+
+    async def timeout(path):
+        raise TimeoutError
+
+    monkeypatch.setattr(asyncio, "open_unix_connection", timeout)
+    with pytest.raises(ipc.IPCError):
+        await client.async_send(1)
+
+
+@pytest.mark.asyncio
+async def test_ipc_framed_connection_json(tmp_path):
+    async with Server(str(tmp_path / "sock"), lambda msg: {"echo": msg}):
+        client = PersistentClient(str(tmp_path / "sock"), is_json=True)
+        assert await client.async_send(["a", 1]) == {"echo": ["a", 1]}
+        await client.async_close()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("is_json", [False, True])
+async def test_ipc_one_shot_protocol_still_supported(tmp_path, is_json):
+    async with Server(str(tmp_path / "sock"), lambda msg: [msg]):
+        client = Client(str(tmp_path / "sock"), is_json=is_json)
+        assert await client.async_send(1) == [1]
+        assert await client.async_send("a much longer message than the magic") == [
+            "a much longer message than the magic"
+        ]
+
+
+def _stream_handler(events):
+    def handler(msg, stream):
+        stream.policy = msg["policy"]
+        stream.maxsize = 2
+        for key, value in events:
+            stream.push(value, key=key)
+        return "subscribed"
+
+    return handler
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "policy,expected",
+    [
+        (ipc.DROP_OLDEST, [{"event": 3, "dropped": 2}, {"event": 4, "dropped": 0}]),
+        (ipc.DROP_NEWEST, [{"event": 1, "dropped": 2}, {"event": 2, "dropped": 0}]),
+        (ipc.COALESCE, [{"event": 4, "dropped": 2}, {"event": 2, "dropped": 0}]),
+    ],
+)
+async def test_ipc_event_stream_policies(tmp_path, policy, expected):
+    events = [("a", 1), ("b", 2), ("a", 3), ("a", 4)]
+    path = str(tmp_path / "sock")
+    async with Server(path, lambda msg: "unused", _stream_handler(events)):
+        client = PersistentClient(path)
+        frames = []
+        async for frame in client.async_subscribe({"type": ipc.SUBSCRIBE, "policy": policy}):
+            frames.append(frame)
+            if len(frames) == 3:
+                break
+        await client.async_close()
+
+    assert frames == ["subscribed", *expected]
+
+
+@pytest.mark.asyncio
+async def test_ipc_event_stream_closed_with_connection(tmp_path):
+    closed = []
+
+    def handler(msg, stream):
+        stream.add_close_callback(lambda: closed.append(True))
+        return "subscribed"
+
+    path = str(tmp_path / "sock")
+    async with Server(path, lambda msg: "unused", handler):
+        client = PersistentClient(path)
+        async for frame in client.async_subscribe({"type": ipc.SUBSCRIBE}):
+            assert frame == "subscribed"
+            break
+        await client.async_close()
+        await asyncio.sleep(0.1)
+
+    assert closed == [True]
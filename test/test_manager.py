@@ -13,6 +13,7 @@ from libqtile.command.client import SelectError
 from libqtile.command.interface import CommandError, CommandException
 from libqtile.config import Match
 from libqtile.confreader import Config
+from libqtile.core.manager import _WindowsMap
 from libqtile.group import _Group
 from libqtile.lazy import lazy
 from libqtile.utils import guess_terminal
@@ -25,6 +26,31 @@ configs_dir = Path(__file__).resolve().parent / "configs"
 terminal = guess_terminal()
 
 
+def test_windows_map_addressable_index():
+    group = _Group("a")
+    widget = libqtile.widget.TextBox()
+    windows = _WindowsMap()
+
+    windows[1] = group
+    windows[2] = widget
+    windows.update({3: group})
+    assert list(windows.addressable) == [1, 3]
+
+    del windows[1]
+    assert windows.pop(3) is group
+    assert windows.pop(3, None) is None
+    assert list(windows.addressable) == []
+
+    windows[2] = group
+    assert list(windows.addressable) == [2]
+    windows[2] = widget
+    assert list(windows.addressable) == []
+
+    windows.setdefault(4, group)
+    windows.clear()
+    assert not windows and not windows.addressable
+
+
 class ManagerConfig(Config):
     auto_fullscreen = True
     groups = [
@@ -1259,6 +1285,24 @@ def test_windows_from_commands(manager):
     assert "TestWindow" in windows[0]["wm_class"]
 
 
+@manager_config
+def test_get_profile(manager):
+    assert manager.c.get_profile()["enabled"] is False
+
+    manager.c.profiling_toggle()
+    try:
+        manager.test_window("one")
+        manager.c.group.info()
+        profile = manager.c.get_profile()
+        assert profile["enabled"] is True
+        handlers = {(h["category"], h["name"]) for h in profile["handlers"]}
+        assert ("command", "info") in handlers
+        assert ("hook", "client_new") in handlers
+    finally:
+        manager.c.profiling_toggle()
+    assert manager.c.get_profile()["enabled"] is False
+
+
 class DuplicateWidgetsConfig(ManagerConfig):
     screens = [
         libqtile.config.Screen(
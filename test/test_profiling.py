@@ -0,0 +1,71 @@
+import asyncio
+import logging
+import time
+
+import pytest
+
+from libqtile.profiling import Profiler, handler_name
+
+
+@pytest.fixture
+def profiler():
+    profiler = Profiler()
+    profiler.enable(stall_threshold=0.05)
+    yield profiler
+    profiler.enable(False)
+
+
+def test_handler_stats(profiler):
+    for elapsed in (0.00005, 0.002, 0.003):
+        profiler.record("x11", "MapRequestEvent", elapsed)
+
+    (handler,) = profiler.info()["handlers"]
+    assert handler["category"] == "x11"
+    assert handler["name"] == "MapRequestEvent"
+    assert handler["calls"] == 3
+    assert handler["max"] == 0.003
+    assert handler["mean"] == pytest.approx(0.005050 / 3)
+    assert handler["histogram"] == {"<=0.1ms": 1, "<=5ms": 2}
+
+
+def test_stalls_are_logged(profiler, caplog):
+    with caplog.at_level(logging.WARNING):
+        profiler.record("hook", "client_new", 0.01)
+        profiler.record("executor", "slow_poll", 1)
+        assert not caplog.records
+
+        profiler.record("hook", "client_new", 0.2)
+    assert profiler.info()["stalls"] == 1
+    assert "client_new blocked the event loop for 200.0ms" in caplog.text
+
+
+def test_profiler_call(profiler):
+    def double(x):
+        return x * 2
+
+    assert profiler.call("loop", handler_name(double), double, 2) == 4
+    (handler,) = profiler.info()["handlers"]
+    assert handler["name"] == "test.test_profiling.test_profiler_call.<locals>.double"
+
+    with pytest.raises(ZeroDivisionError):
+        profiler.call("command", "fail", lambda: 1 / 0)
+    assert len(profiler.info()["handlers"]) == 2
+
+
+def test_loop_lag(caplog):
+    async def t():
+        profiler = Profiler()
+        profiler.enable(stall_threshold=0.05, loop=asyncio.get_running_loop())
+        try:
+            await asyncio.sleep(0.2)
+            # block the loop while the lag check is due
+            with caplog.at_level(logging.WARNING):
+                asyncio.get_running_loop().call_soon(time.sleep, 0.15)
+                await asyncio.sleep(0.3)
+            handlers = {(h["category"], h["name"]): h for h in profiler.info()["handlers"]}
+            assert handlers["loop", "lag"]["calls"] >= 1
+            assert "The event loop was stalled" in caplog.text
+        finally:
+            profiler.enable(False)
+
+    asyncio.run(t())
@@ -0,0 +1,116 @@
+import asyncio
+import itertools
+
+from libqtile.widget import metrics
+from libqtile.widget.metrics import Metric, SampledMixin, Sampler
+
+
+class Counter:
+    def __init__(self, step):
+        self.step = step
+        self.value = 0
+        self.reads = 0
+
+    def __call__(self):
+        self.reads += 1
+        self.value += self.step
+        return self.value
+
+
+def test_sampler_computes_rates():
+    sampler = Sampler(clock=itertools.count().__next__)
+    counter = Metric("counter", Counter(10), counter=True)
+
+    snapshot = sampler.sample([counter])
+    assert snapshot[counter] == 10
+    assert snapshot.rate(counter) is None
+
+    snapshot = sampler.sample([counter])
+    assert snapshot[counter] == 20
+    assert snapshot.rate(counter) == 10
+
+
+def test_metrics_are_identified_by_name():
+    assert Metric("a", lambda: 1) == Metric("a", lambda: 2)
+    assert Metric("a", lambda: 1) != Metric("b", lambda: 1)
+
+
+def test_sampler_shares_snapshots():
+    async def t():
+        sampler = Sampler()
+        read = Counter(1)
+        metric = Metric("shared", read)
+        snapshots = []
+
+        def fast(snapshot):
+            snapshots.append(snapshot)
+
+        def slow(snapshot):
+            snapshots.append(snapshot)
+
+        sampler.subscribe(fast, [metric], 0.05)
+        sampler.subscribe(slow, [metric], 0.1)
+        assert sampler.interval == 0.05
+
+        await asyncio.sleep(0.02)
+        # Both subscribers were due on the first tick, which read the metric once
+        assert read.reads == 1
+        assert len(snapshots) == 2
+        assert snapshots[0] is snapshots[1]
+
+        sampler.unsubscribe(fast)
+        assert sampler.interval == 0.1
+
+    asyncio.run(t())
+
+
+def test_sampler_survives_failing_metrics():
+    def fail():
+        raise OSError
+
+    sampler = Sampler()
+    good = Metric("good", lambda: 1)
+    bad = Metric("bad", fail)
+    snapshot = sampler.sample([good, bad])
+    assert snapshot[good] == 1
+    assert snapshot[bad] is None
+
+
+def test_sampled_widgets_are_not_sampled_in_the_loop(monkeypatch):
+    read = Counter(1)
+    metric = Metric("widget", read, counter=True)
+
+    class Widget(SampledMixin):
+        sampled_metrics = (metric,)
+        update_interval = 10
+
+        def __init__(self):
+            self.updates = []
+
+        def sampled(self, snapshot):
+            self.updates.append(snapshot)
+
+    class Graph(Widget):
+        update_on_setup = False
+
+    async def t():
+        monkeypatch.setattr(metrics, "sampler", Sampler())
+        widget = Widget()
+        graph = Graph()
+        widget.timer_setup()
+        graph.timer_setup()
+        # The first sample is taken by the sampler's tick, in an executor
+        assert read.reads == 0
+        assert widget.snapshot is None
+
+        await asyncio.sleep(0.02)
+        assert read.reads == 1
+        assert widget.updates == [widget.snapshot]
+        # The first sample only primes the graph's counters
+        assert graph.snapshot is widget.snapshot
+        assert graph.updates == []
+
+        metrics.sampler.unsubscribe(widget._on_sample)
+        metrics.sampler.unsubscribe(graph._on_sample)
+
+    asyncio.run(t())
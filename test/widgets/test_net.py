@@ -1,13 +1,19 @@
+import itertools
 import sys
+from collections import namedtuple
 from importlib import reload
 from types import ModuleType
 
 import pytest
 
+from libqtile.widget import metrics
 from test.widgets.conftest import FakeBar
 
+# Net widget only needs bytes_recv/sent attributes, in a named tuple like psutil's
+# so that the sampler can compute their rates
+IOCounters = namedtuple("IOCounters", ["bytes_sent", "bytes_recv"])
+
 
-# Net widget only needs bytes_recv/sent attributes
 # Widget displays increase since last poll therefore
 # we need to increment value each time this is called.
 class MockPsutil(ModuleType):
@@ -16,11 +22,6 @@ class MockPsutil(ModuleType):
 
     @classmethod
     def net_io_counters(cls, pernic=False, _nowrap=True):
-        class IOCounters:
-            def __init__(self, up, down):
-                self.bytes_sent = up
-                self.bytes_recv = down
-
         cls.up += 40000
         cls.down += 1200000
 
@@ -37,6 +38,8 @@ def patch_net(fake_qtile, monkeypatch, fake_window):
         MockPsutil.up = 0
         MockPsutil.down = 0
         monkeypatch.setitem(sys.modules, "psutil", MockPsutil("psutil"))
+        # Counters are sampled one second apart
+        monkeypatch.setattr(metrics, "sampler", metrics.Sampler(clock=itertools.count().__next__))
         from libqtile.widget import net
 
         # Reload fixes cases where psutil may have been imported previously
@@ -49,6 +52,9 @@ def patch_net(fake_qtile, monkeypatch, fake_window):
         )
         fakebar = FakeBar([widget], window=fake_window)
         widget._configure(fake_qtile, fakebar)
+        # The sampler's first tick primes the counters, and the next one has their rates
+        metrics.sampler.sample(widget.sampled_metrics)
+        widget.snapshot = metrics.sampler.sample(widget.sampled_metrics)
 
         return widget
 